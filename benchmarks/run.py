@@ -0,0 +1,245 @@
+# Tamga / benchmarks / run.py
+# Benchmark suite: throughput and per-call latency of every output, with Python's logging as baseline
+#
+# Every scenario writes into a temporary directory and runs offline. Results are
+# printed as a table on stderr and written as JSON so runs on different commits
+# can be compared:
+#
+#   python benchmarks/run.py --output before.json
+#   git checkout other-branch
+#   python benchmarks/run.py --output after.json --compare before.json
+#
+# Options:
+#   --calls 20000       Logging calls per scenario (split across threads)
+#   --threads 1 4       Thread counts to run every scenario with
+#   --only file jsonl   Run only some outputs (names as in SINKS plus "stdlib")
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import tamga  # noqa: E402
+from tamga import Tamga  # noqa: E402
+
+SINKS = {
+    "console": {"console_output": True},
+    "file": {"file_output": True},
+    "json": {"json_output": True},
+    "jsonl": {"jsonl_output": True},
+    "sql": {"sql_output": True},
+    "binary": {"binary_output": True},
+    "combined": {"file_output": True, "jsonl_output": True, "sql_output": True},
+}
+
+WARMUP_CALLS = 1000
+
+
+def make_tamga(sink: str, directory: str) -> Tamga:
+    """Create a logger for one output with files in directory."""
+    config = {
+        "console_output": False,
+        "colored_output": True,
+        "file_path": os.path.join(directory, "bench.log"),
+        "json_path": os.path.join(directory, "bench.json"),
+        "jsonl_path": os.path.join(directory, "bench.jsonl"),
+        "sql_path": os.path.join(directory, "bench.db"),
+        "binary_path": os.path.join(directory, "bench.bin"),
+        # Large limits so rotation does not distort throughput
+        "max_file_size_mb": 10_000,
+        "max_json_size_mb": 10_000,
+        "max_jsonl_size_mb": 10_000,
+        "max_sql_size_mb": 10_000,
+        "max_binary_size_mb": 10_000,
+    }
+    config.update(SINKS[sink])
+    return Tamga(**config)
+
+
+def make_stdlib(directory: str) -> logging.Logger:
+    """Create a stdlib logger writing a comparable line format to a file."""
+    logger = logging.getLogger(f"tamga-benchmark-{id(directory)}")
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = logging.FileHandler(os.path.join(directory, "stdlib.log"))
+    handler.setFormatter(
+        logging.Formatter(
+            "[%(asctime)s] %(levelname)s: %(message)s", "%d.%m.%y | %H:%M:%S"
+        )
+    )
+    logger.addHandler(handler)
+    return logger
+
+
+def call_for(target, structured: bool):
+    """Return a function logging call number i the way the scenario asks."""
+    if isinstance(target, logging.Logger):
+        if structured:
+            return lambda i: target.info(
+                "Request handled | user_id=%r, path=%r, status=%r", i, "/users", 200
+            )
+        return lambda i: target.info("Request handled %d", i)
+
+    if structured:
+        return lambda i: target.info(
+            "Request handled", user_id=i, path="/users", status=200
+        )
+    return lambda i: target.info(f"Request handled {i}")
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def run_scenario(sink: str, structured: bool, threads: int, calls: int) -> dict:
+    """Run one scenario and return its measurements."""
+    with tempfile.TemporaryDirectory() as directory:
+        target = (
+            make_stdlib(directory) if sink == "stdlib" else make_tamga(sink, directory)
+        )
+        log_call = call_for(target, structured)
+
+        for i in range(WARMUP_CALLS):
+            log_call(i)
+
+        per_thread = calls // threads
+        latencies = [[] for _ in range(threads)]
+        barrier = threading.Barrier(threads + 1)
+
+        def worker(index):
+            timings = latencies[index]
+            clock = time.perf_counter_ns
+            barrier.wait()
+            for i in range(per_thread):
+                began = clock()
+                log_call(i)
+                timings.append(clock() - began)
+
+        workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        for thread in workers:
+            thread.start()
+        barrier.wait()
+        started = time.perf_counter()
+        for thread in workers:
+            thread.join()
+
+        # Buffered records only count once they are on disk
+        if isinstance(target, Tamga):
+            target.close()
+        else:
+            for handler in target.handlers:
+                handler.close()
+        elapsed = time.perf_counter() - started
+
+    merged = sorted(value for timings in latencies for value in timings)
+    total = per_thread * threads
+    return {
+        "sink": sink,
+        "structured": structured,
+        "threads": threads,
+        "calls": total,
+        "seconds": elapsed,
+        "throughput": total / elapsed if elapsed else 0.0,
+        "p50_us": percentile(merged, 0.50) / 1000,
+        "p99_us": percentile(merged, 0.99) / 1000,
+    }
+
+
+def environment() -> dict:
+    """Describe the machine and code the results belong to."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "tamga": tamga.__version__,
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def scenario_key(result: dict) -> tuple:
+    """Identify a scenario across runs."""
+    return (result["sink"], result["structured"], result["threads"])
+
+
+def print_table(results, baseline=None):
+    """Print results, and the throughput change against a baseline run."""
+    previous = {scenario_key(r): r for r in (baseline or {}).get("results", [])}
+    header = f"{'sink':<10}{'kwargs':<8}{'threads':>7}{'logs/s':>12}{'p50 us':>9}{'p99 us':>9}"
+    if previous:
+        header += f"{'change':>9}"
+    print(header, file=sys.stderr)
+
+    for r in results:
+        line = (
+            f"{r['sink']:<10}{'yes' if r['structured'] else 'no':<8}{r['threads']:>7}"
+            f"{r['throughput']:>12,.0f}{r['p50_us']:>9.1f}{r['p99_us']:>9.1f}"
+        )
+        before = previous.get(scenario_key(r))
+        if before and before["throughput"]:
+            change = (r["throughput"] / before["throughput"] - 1) * 100
+            line += f"{change:>+8.1f}%"
+        print(line, file=sys.stderr)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Tamga benchmark suite")
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+    parser.add_argument(
+        "--only", nargs="+", choices=[*SINKS, "stdlib"], help="Outputs to run"
+    )
+    parser.add_argument("--output", help="Write JSON results here instead of stdout")
+    parser.add_argument("--compare", help="JSON results of an earlier run")
+    args = parser.parse_args(argv)
+
+    sinks = args.only or [*SINKS, "stdlib"]
+    results = []
+    # Console scenarios write to /dev/null so the terminal is not measured
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for sink in sinks:
+            for structured in (False, True):
+                for threads in args.threads:
+                    results.append(run_scenario(sink, structured, threads, args.calls))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_table(results, baseline)
+
+    report = json.dumps({"environment": environment(), "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
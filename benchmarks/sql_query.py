@@ -0,0 +1,110 @@
+# Tamga / benchmarks / sql_query.py
+# Benchmark: query_sql() latency against SQLite table size, with and without indexes
+#
+# Usage:
+#   python benchmarks/sql_query.py
+#   python benchmarks/sql_query.py --sizes 10000 100000 1000000 --repeat 20
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tamga import Tamga  # noqa: E402
+
+LEVELS = ["INFO"] * 90 + ["WARNING"] * 8 + ["ERROR"] * 2
+
+
+def populate(logger: Tamga, rows: int):
+    """Insert rows spread over one day with realistic level and data mixes."""
+    start = time.time() - 86400
+    step = 86400 / rows
+    batch = []
+    for i in range(rows):
+        batch.append(
+            (
+                LEVELS[i % len(LEVELS)],
+                "Request handled",
+                f'{{"user_id": {i % 5000}, "status": {200 if i % 50 else 500}}}',
+                "01.01.25",
+                "12:00:00",
+                "UTC",
+                start + i * step,
+            )
+        )
+        if len(batch) == 10000:
+            logger._sql_conn.executemany(
+                "INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?, ?)", batch
+            )
+            batch.clear()
+    if batch:
+        logger._sql_conn.executemany(
+            "INSERT INTO logs VALUES (?, ?, ?, ?, ?, ?, ?)", batch
+        )
+    logger._sql_conn.commit()
+
+
+def measure(logger: Tamga, repeat: int, **filters) -> float:
+    """Median milliseconds for one fully consumed query_sql() call."""
+    timings = []
+    for _ in range(repeat):
+        began = time.perf_counter()
+        for _ in logger.query_sql(**filters):
+            pass
+        timings.append((time.perf_counter() - began) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def run(sizes, repeat):
+    """Print query latency for each table size with and without indexes."""
+    last_hour = time.time() - 3600
+    queries = {
+        "errors last hour": {"level": "ERROR", "since": last_hour},
+        "all last hour (limit 100)": {"since": last_hour, "limit": 100},
+        "user 42 errors": {"level": "ERROR", "where_data": {"user_id": 42}},
+    }
+
+    print(f"{'rows':>10}  {'query':<28}{'indexed ms':>12}{'scan ms':>12}")
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bench.db")
+            logger = Tamga(
+                console_output=False,
+                sql_output=True,
+                sql_path=path,
+                max_sql_size_mb=1_000_000,
+            )
+            populate(logger, rows)
+
+            indexed = {
+                name: measure(logger, repeat, **f) for name, f in queries.items()
+            }
+            with sqlite3.connect(path) as conn:
+                conn.execute("DROP INDEX logs_timestamp")
+                conn.execute("DROP INDEX logs_level_timestamp")
+            scanned = {
+                name: measure(logger, repeat, **f) for name, f in queries.items()
+            }
+            logger.close()
+
+            for name in queries:
+                print(
+                    f"{rows:>10}  {name:<28}{indexed[name]:>12.2f}{scanned[name]:>12.2f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="query_sql() latency against table size"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 500_000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
@@ -1,11 +1,12 @@
 # Tamga / examples / fastapi_webapp.py
 # Example: Using Tamga with FastAPI
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 
 from tamga import Tamga
 
-app = FastAPI()
 logger = Tamga(
     console_output=True,
     file_output=True,
@@ -16,16 +17,25 @@ logger = Tamga(
 )
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await logger.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    logger.info(
+    await logger.ainfo(
         "Incoming request",
         method=request.method,
         path=request.url.path,
         client=str(request.client.host),
     )
     response = await call_next(request)
-    logger.info(
+    await logger.ainfo(
         "Request completed",
         method=request.method,
         path=request.url.path,
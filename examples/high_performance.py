@@ -33,4 +33,5 @@ print(f"Done. Logged {NUM_LOGS:,} entries in {elapsed:.2f} seconds.")
 print(f"Throughput: {NUM_LOGS / elapsed:,.0f} logs/sec")
 
 # Tip: Try increasing NUM_LOGS or buffer_size for even higher throughput.
-# For benchmarking, compare with Python's built-in logging for reference.
+# For reproducible numbers across outputs, threads and Python's built-in logging,
+# run the benchmark suite: python benchmarks/run.py
@@ -3,10 +3,11 @@ Tamga - A modern, async-capable Python logging utility
 """
 
 from .main import Tamga
+from .utils.binary import binary_to_jsonl, read_binary
 
 __version__ = "1.4.0"
 __author__ = "Doğukan Ürker"
 __email__ = "dogukanurker@icloud.com"
 __license__ = "MIT"
 
-__all__ = ["Tamga"]
+__all__ = ["Tamga", "binary_to_jsonl", "read_binary"]
@@ -0,0 +1,108 @@
+"""
+Command line interface: python -m tamga query ...
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from typing import List, Optional
+
+from .query import count_by_interval, query_logs
+
+
+def _parse_where(pairs: List[str]) -> dict:
+    """Parse key=value arguments, reading values as JSON when possible."""
+    where = {}
+    for pair in pairs:
+        key, separator, value = pair.partition("=")
+        if not separator:
+            raise ValueError(f"--where expects key=value, got {pair!r}")
+        try:
+            where[key] = json.loads(value)
+        except ValueError:
+            where[key] = value
+    return where
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser."""
+    parser = argparse.ArgumentParser(prog="python -m tamga")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    query = commands.add_parser(
+        "query", help="Filter or aggregate JSONL and binary logs and their backups"
+    )
+    query.add_argument("paths", nargs="+", help="Log files such as tamga.jsonl")
+    query.add_argument(
+        "--level", action="append", help="Level to keep, may be repeated"
+    )
+    query.add_argument("--since", help="Start time, unix seconds or ISO format")
+    query.add_argument("--until", help="End time, unix seconds or ISO format")
+    query.add_argument(
+        "--where",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Data value that must match, may be repeated",
+    )
+    query.add_argument("--no-backups", action="store_true", help="Skip rotated backups")
+    query.add_argument("--limit", type=int, help="Maximum records to print")
+    query.add_argument(
+        "--count",
+        action="store_true",
+        help="Print counts per level per interval instead of records",
+    )
+    query.add_argument(
+        "--interval", type=float, default=60.0, help="Count interval in seconds"
+    )
+    query.add_argument(
+        "--processes", type=int, help="Worker processes used for --count"
+    )
+    return parser
+
+
+def _time_bound(value: Optional[str]):
+    """Accept unix seconds or an ISO formatted time."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        datetime.fromisoformat(value)
+        return value
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command line interface."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    try:
+        filters = {
+            "level": args.level,
+            "since": _time_bound(args.since),
+            "until": _time_bound(args.until),
+            "where": _parse_where(args.where),
+            "include_backups": not args.no_backups,
+        }
+    except ValueError as e:
+        parser.error(str(e))
+    out = sys.stdout
+
+    if args.count:
+        counts = count_by_interval(
+            args.paths, args.interval, processes=args.processes, **filters
+        )
+        for (start, level), count in counts.items():
+            moment = datetime.fromtimestamp(start).isoformat(timespec="seconds")
+            out.write(f"{moment}\t{level}\t{count}\n")
+        return 0
+
+    for record in query_logs(args.paths, limit=args.limit, **filters):
+        out.write(json.dumps(record, ensure_ascii=False, default=str))
+        out.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
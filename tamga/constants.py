@@ -43,6 +43,23 @@ LOG_LEVELS: Dict[str, str] = {
     "TRACE": "gray",
 }
 
+# Severity of each level; records below a logger's min_level are dropped
+LOG_SEVERITIES: Dict[str, int] = {
+    "TRACE": 5,
+    "DEBUG": 10,
+    "INFO": 20,
+    "DATABASE": 20,
+    "METRIC": 20,
+    "SUCCESS": 25,
+    "NOTIFY": 30,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
+
+# Severity of custom levels that were not registered with one
+DEFAULT_SEVERITY: int = LOG_SEVERITIES["INFO"]
+
 LOG_EMOJIS: Dict[str, str] = {
     "INFO": "ℹ️",
     "WARNING": "⚠️",
@@ -1,21 +1,99 @@
 import asyncio
+import atexit
+import functools
 import json
 import os
-import re
 import sqlite3
+import sys
 import threading
-from datetime import datetime
-from typing import Any, Dict, Tuple
-
-from .constants import LOG_LEVELS
+import weakref
+from contextlib import closing
+from pathlib import Path
+from time import monotonic, perf_counter_ns, sleep, time_ns
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .constants import DEFAULT_SEVERITY, LOG_LEVELS, LOG_SEVERITIES
+from .query import TimeBound, to_timestamp
+from .utils.binary import BinaryEncoder, read_binary, valid_length
+from .utils.buffer import OVERFLOW_POLICIES, RecordBuffer, record_size
 from .utils.colors import Color
-from .utils.time import (
-    current_date,
-    current_time,
-    current_timestamp,
-    current_timezone,
+from .utils.encoding import RecordEncoder
+from .utils.mongo import MongoWriter
+from .utils.notifier import DROP_POLICIES, NotificationDispatcher
+from .utils.process import WriterProcess
+from .utils.ratelimit import LogLimiter
+from .utils.rotation import (
+    COMPRESSION_SUFFIXES,
+    ROTATE_WHEN,
+    backup_path,
+    compress_file,
+    prune_backups,
+    rollover_period,
+)
+from .utils.stats import CALL_SAMPLE_EVERY, LoggerStats
+from .utils.time import ClockSnapshot, clock_snapshot
+from .utils.timer import PeriodicTimer
+from .utils.writer import BackgroundWriter
+
+# Number of rotation checks between re-reading an output file's real size
+_SIZE_RESYNC_INTERVAL = 64
+# Rough per-row storage overhead, including both indexes, used to estimate SQLite growth
+_SQL_ROW_OVERHEAD = 112
+# Bytes read from the end of a JSON array file to find its closing bracket
+_JSON_TAIL_SCAN_BYTES = 4096
+
+
+# Output names accepted as sink_levels keys
+_SINK_NAMES = frozenset({"console", "file", "json", "jsonl", "sql", "mongo", "binary"})
+
+# Public settings read by the cached routes and console formats; assigning one
+# of them invalidates the cache, so changes take effect on the next record
+_ROUTE_SETTINGS = frozenset(
+    {
+        "console_output",
+        "file_output",
+        "json_output",
+        "jsonl_output",
+        "sql_output",
+        "mongo_output",
+        "binary_output",
+        "sink_levels",
+        "notify_levels",
+        "notify_services",
+        "writer_queue",
+    }
+)
+_CONSOLE_SETTINGS = frozenset(
+    {"colored_output", "show_date", "show_time", "show_timezone"}
 )
 
+# Severities of the built-in helpers, checked before any record is built
+_TRACE = LOG_SEVERITIES["TRACE"]
+_DEBUG = LOG_SEVERITIES["DEBUG"]
+_INFO = LOG_SEVERITIES["INFO"]
+_SUCCESS = LOG_SEVERITIES["SUCCESS"]
+_WARNING = LOG_SEVERITIES["WARNING"]
+_ERROR = LOG_SEVERITIES["ERROR"]
+_CRITICAL = LOG_SEVERITIES["CRITICAL"]
+_DATABASE = LOG_SEVERITIES["DATABASE"]
+_METRIC = LOG_SEVERITIES["METRIC"]
+_NOTIFY = LOG_SEVERITIES["NOTIFY"]
+
+# Live loggers, closed at interpreter exit so buffered records reach their outputs
+_instances = weakref.WeakSet()
+
+
+def _close_all():
+    """Close every live logger within its exit_timeout; registered with atexit."""
+    for logger in list(_instances):
+        try:
+            logger.close(logger.exit_timeout)
+        except Exception:
+            pass
+
+
+atexit.register(_close_all)
+
 
 class Tamga:
     """
@@ -33,45 +111,98 @@ class Tamga:
         "jsonl_output",
         "mongo_output",
         "sql_output",
+        "binary_output",
         # Display settings
         "show_date",
         "show_time",
         "show_timezone",
+        "min_level",
+        "custom_levels",
+        "sink_levels",
+        "sample_rates",
+        "rate_limit",
+        "rate_limit_burst",
+        "suppressed_report_interval",
         # File paths and configurations
         "file_path",
         "json_path",
         "jsonl_path",
         "sql_path",
         "sql_table_name",
+        "sql_synchronous",
+        "binary_path",
         # MongoDB configuration
         "mongo_uri",
         "mongo_database_name",
         "mongo_collection_name",
+        "mongo_batch_size",
+        "mongo_flush_interval",
         # Notification settings
         "notify_services",
         "notify_levels",
         "notify_title",
         "notify_format",
+        "notify_window",
+        "notify_max_per_window",
+        "notify_queue_size",
+        "notify_drop_policy",
         # Size limits and buffering
         "max_file_size_mb",
         "max_json_size_mb",
         "max_jsonl_size_mb",
         "max_sql_size_mb",
+        "max_binary_size_mb",
         "enable_backup",
+        "rotate_when",
+        "max_backups",
+        "max_backup_size_mb",
+        "backup_compression",
         "buffer_size",
+        "max_buffer_mb",
+        "buffer_overflow",
+        "buffer_block_timeout",
+        "flush_interval",
+        "json_encoder",
+        "background_writer",
+        "writer_queue",
+        "stats_callback",
+        "stats_interval",
+        "exit_timeout",
         # Computed values
         "max_level_width",
         # Internal state (private)
-        "_mongo_client",
+        "_min_severity",
+        "_severities",
+        "_routes",
+        "_limiter",
+        "_mongo_writer",
         "_apprise",
-        "_notify_executor",
+        "_notifier",
+        "_rotation_executor",
         "_file_buffer",
         "_json_buffer",
         "_jsonl_buffer",
-        "_buffer_lock",
+        "_sql_buffer",
+        "_binary_buffer",
+        "_state_lock",
+        "_file_sizes",
+        "_size_checks",
+        "_rollovers",
         "_color_cache",
+        "_console_stamp",
         "_json_file_handle",
+        "_json_tail",
+        "_json_has_entries",
         "_file_path_handle",
+        "_sql_conn",
+        "_binary_handle",
+        "_binary_encoder",
+        "_writer",
+        "_stats",
+        "_stats_exporter",
+        "_flush_timer",
+        "_encoder",
+        "__weakref__",
     ]
 
     def __init__(
@@ -84,32 +215,63 @@ class Tamga:
         jsonl_output: bool = False,
         mongo_output: bool = False,
         sql_output: bool = False,
+        binary_output: bool = False,
         # Display settings
         show_date: bool = True,
         show_time: bool = True,
         show_timezone: bool = False,
+        min_level: Optional[Union[str, int]] = None,
+        custom_levels: Optional[Dict[str, int]] = None,
+        sink_levels: Optional[Dict[str, Union[str, int, Iterable[str]]]] = None,
+        sample_rates: Optional[Dict[str, int]] = None,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[float] = None,
+        suppressed_report_interval: float = 60.0,
         # File paths and configurations
         file_path: str = "tamga.log",
         json_path: str = "tamga.json",
         jsonl_path: str = "tamga.jsonl",
         sql_path: str = "tamga.db",
         sql_table_name: str = "logs",
+        sql_synchronous: str = "NORMAL",
+        binary_path: str = "tamga.bin",
         # MongoDB configuration
         mongo_uri: str = None,
         mongo_database_name: str = "tamga",
         mongo_collection_name: str = "logs",
+        mongo_batch_size: int = 500,
+        mongo_flush_interval: float = 1.0,
         # Notification settings
         notify_services: list = None,
         notify_levels: list = [],
         notify_title: str = "{appname}: {level} - {date}",
         notify_format: str = "text",
+        notify_window: float = 60.0,
+        notify_max_per_window: int = 5,
+        notify_queue_size: int = 100,
+        notify_drop_policy: str = "drop_oldest",
         # Size limits and buffering
         max_file_size_mb: int = 10,
         max_json_size_mb: int = 10,
         max_jsonl_size_mb: int = 10,
         max_sql_size_mb: int = 50,
+        max_binary_size_mb: int = 10,
         enable_backup: bool = True,
+        rotate_when: Optional[str] = None,
+        max_backups: int = None,
+        max_backup_size_mb: float = None,
+        backup_compression: str = None,
         buffer_size: int = 50,
+        max_buffer_mb: Optional[float] = 16,
+        buffer_overflow: str = "drop_oldest",
+        buffer_block_timeout: float = 5.0,
+        flush_interval: Optional[float] = None,
+        json_encoder: Optional[Callable[[Any], str]] = None,
+        background_writer: bool = False,
+        writer_queue: Any = None,
+        stats_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        stats_interval: float = 60.0,
+        exit_timeout: Optional[float] = 5.0,
     ):
         """
         Initialize Tamga with optional features.
@@ -120,26 +282,81 @@ class Tamga:
             file_output: Enable logging to a file (default: False)
             json_output: Enable logging to a JSON file (default: False)
             mongo_output: Enable logging to MongoDB (default: False)
+            binary_output: Enable logging to a compact binary file, read it back with
+                tamga.read_binary() (default: False)
             sql_output: Enable logging to SQL database (default: False)
             show_date: Show day in console logs (default: True)
             show_time: Show time in console logs (default: True)
             show_timezone: Show timezone in console logs (default: False)
+            min_level: Drop records below this level name or severity (default: None, keep all)
+            custom_levels: Severities of custom levels, e.g. {"AUDIT": 45}, registered
+                before min_level and sink_levels are checked (default: None)
+            sink_levels: Per-output level filter keyed by console/file/json/jsonl/sql/mongo/binary;
+                a level name or severity is a minimum, a list of names an exact set
+                (default: None, every output receives every record)
+            sample_rates: Keep one record in N per level, e.g. {"METRIC": 100} (default: None)
+            rate_limit: Records per second allowed per message template, or per key= value
+                when given (default: None, no limit)
+            rate_limit_burst: Records a key may log at once (default: None, same as rate_limit)
+            suppressed_report_interval: Seconds between METRIC records counting the
+                sampled and rate-limited calls per level (default: 60.0)
             file_path: Path to the log file (default: "tamga.log")
             json_path: Path to the JSON log file (default: "tamga.json")
             sql_path: Path to the SQL log file (default: "tamga.db")
             sql_table_name: SQL table name for logs (default: "logs")
+            sql_synchronous: SQLite synchronous pragma - OFF/NORMAL/FULL (default: "NORMAL")
+            binary_path: Path to the binary log file (default: "tamga.bin")
             mongo_uri: MongoDB connection URI
             mongo_database_name: MongoDB database name (default: "tamga")
             mongo_collection_name: MongoDB collection name (default: "logs")
+            mongo_batch_size: Documents per insert_many batch (default: 500)
+            mongo_flush_interval: Maximum seconds a document waits before being sent (default: 1.0)
             notify_services: List of Apprise notification service URLs
             notify_levels: List of log levels to send notifications for (default: includes NOTIFY)
             notify_title: Template for notification titles (default: "{appname}: {level} - {date}")
             notify_format: Notification format type - text/markdown/html (default: "text")
+            notify_window: Seconds over which repeats are coalesced into one digest (default: 60.0)
+            notify_max_per_window: Notifications sent per level within one window (default: 5)
+            notify_queue_size: Maximum notifications waiting to be sent (default: 100)
+            notify_drop_policy: Queue overflow policy - drop_oldest/drop_newest (default: "drop_oldest")
             max_file_size_mb: Maximum size in MB for log file (default: 10)
             max_json_size_mb: Maximum size in MB for JSON file (default: 10)
             max_sql_size_mb: Maximum size in MB for SQL file (default: 50)
+            max_binary_size_mb: Maximum size in MB for binary file (default: 10)
             enable_backup: Enable backup when max size is reached (default: True)
+            rotate_when: Also rotate every file output at calendar boundaries - "H" hourly,
+                "D"/"midnight" daily; backups are named file.YYYYmmdd_HH.bak or
+                file.YYYYmmdd.bak after the period they cover (default: None)
+            max_backups: Maximum number of backups kept per file, oldest deleted first (default: None)
+            max_backup_size_mb: Maximum total size in MB of backups per file (default: None)
+            backup_compression: Compress backups in the background - gzip/lzma (default: None)
             buffer_size: Number of logs to buffer before writing to file (default: 50)
+            max_buffer_mb: Memory budget in MB of each output buffer; a buffer that
+                reaches it is flushed early, and if the flush fails buffer_overflow
+                applies (default: 16, None for no limit)
+            buffer_overflow: What to do with records over budget while an output keeps
+                failing - block (the caller waits for a successful flush), drop_newest,
+                drop_oldest, or spill (move them to path.spill and write them once the
+                output recovers) (default: "drop_oldest")
+            buffer_block_timeout: Seconds the "block" policy waits before dropping the
+                newest record (default: 5.0)
+            flush_interval: Also flush every output buffer this often in seconds, so a
+                record waits at most this long before reaching disk (default: None,
+                flush only on buffer_size)
+            json_encoder: Function turning a value into compact JSON text, used once per
+                record for the JSON, JSONL and SQL outputs (default: None, orjson when
+                installed, else the json module)
+            background_writer: Hand records to a dedicated writer thread so log calls
+                never touch console, disk or network on the caller's thread (default: False)
+            writer_queue: Queue of a writer process started with start_writer_process();
+                records are sent there and only console output stays in this
+                process (default: None)
+            stats_callback: Called with stats() every stats_interval seconds from a
+                background thread, e.g. to export metrics (default: None)
+            stats_interval: Seconds between stats_callback calls (default: 60.0)
+            exit_timeout: Seconds the close() run at interpreter exit waits for each
+                background thread, such as pending notification sends; None waits
+                without a limit (default: 5.0)
         """
         # Output configuration
         self.console_output = console_output
@@ -151,11 +368,36 @@ class Tamga:
         self.jsonl_output = jsonl_output
         self.mongo_output = mongo_output
         self.sql_output = sql_output
+        self.binary_output = binary_output
 
         # Display settings
         self.show_date = show_date
         self.show_time = show_time
         self.show_timezone = show_timezone
+        self._severities = dict(LOG_SEVERITIES)
+        self.custom_levels = custom_levels
+        self._severities.update(custom_levels or {})
+        self._routes = {}
+        self.sink_levels = {
+            sink: accepted if isinstance(accepted, (str, int)) else frozenset(accepted)
+            for sink, accepted in (sink_levels or {}).items()
+        }
+        unknown_sinks = set(self.sink_levels) - _SINK_NAMES
+        if unknown_sinks:
+            raise ValueError(f"Unknown outputs in sink_levels: {sorted(unknown_sinks)}")
+        for accepted in self.sink_levels.values():
+            if isinstance(accepted, str) and accepted not in self._severities:
+                raise ValueError(f"Unknown log level in sink_levels: {accepted}")
+        self.set_min_level(min_level)
+        self.sample_rates = sample_rates
+        self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+        self.suppressed_report_interval = suppressed_report_interval
+        self._limiter = None
+        if sample_rates or rate_limit is not None:
+            self._limiter = LogLimiter(
+                sample_rates, rate_limit, rate_limit_burst, suppressed_report_interval
+            )
 
         # File paths and configurations
         self.file_path = file_path
@@ -163,42 +405,147 @@ class Tamga:
         self.jsonl_path = jsonl_path
         self.sql_path = sql_path
         self.sql_table_name = sql_table_name
+        self.sql_synchronous = sql_synchronous
+        self.binary_path = binary_path
 
         # MongoDB configuration
         self.mongo_uri = mongo_uri
         self.mongo_database_name = mongo_database_name
         self.mongo_collection_name = mongo_collection_name
+        self.mongo_batch_size = mongo_batch_size
+        self.mongo_flush_interval = mongo_flush_interval
 
         # Notification settings
         self.notify_services = notify_services or []
-        self.notify_levels = list(set(notify_levels + ["NOTIFY"]))
+        self.notify_levels = frozenset(notify_levels) | {"NOTIFY"}
         self.notify_title = notify_title
         self.notify_format = notify_format
+        self.notify_window = notify_window
+        self.notify_max_per_window = notify_max_per_window
+        self.notify_queue_size = notify_queue_size
+        if notify_drop_policy not in DROP_POLICIES:
+            raise ValueError(f"notify_drop_policy must be one of {DROP_POLICIES}")
+        self.notify_drop_policy = notify_drop_policy
 
         # Size limits and buffering
         self.max_file_size_mb = max_file_size_mb
         self.max_json_size_mb = max_json_size_mb
         self.max_jsonl_size_mb = max_jsonl_size_mb
         self.max_sql_size_mb = max_sql_size_mb
+        self.max_binary_size_mb = max_binary_size_mb
         self.enable_backup = enable_backup
+        if rotate_when is not None and rotate_when not in ROTATE_WHEN:
+            raise ValueError(f"rotate_when must be one of {ROTATE_WHEN}")
+        self.rotate_when = rotate_when
+        self.max_backups = max_backups
+        self.max_backup_size_mb = max_backup_size_mb
+        if (
+            backup_compression is not None
+            and backup_compression not in COMPRESSION_SUFFIXES
+        ):
+            raise ValueError(
+                f"backup_compression must be one of {sorted(COMPRESSION_SUFFIXES)}"
+            )
+        self.backup_compression = backup_compression
         self.buffer_size = buffer_size
+        if buffer_overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"buffer_overflow must be one of {OVERFLOW_POLICIES}")
+        self.max_buffer_mb = max_buffer_mb
+        self.buffer_overflow = buffer_overflow
+        self.buffer_block_timeout = buffer_block_timeout
+        self.flush_interval = flush_interval
+        self.json_encoder = json_encoder
+        self.background_writer = background_writer
+        self.writer_queue = writer_queue
+        self.stats_callback = stats_callback
+        self.stats_interval = stats_interval
+        self.exit_timeout = exit_timeout
 
         # Computed values
-        self.max_level_width = max(len(level) for level in self.LOG_LEVELS)
+        self.max_level_width = max(
+            len(level) for level in (*self.LOG_LEVELS, *(custom_levels or ()))
+        )
 
         # Internal state (private)
-        self._mongo_client = None
+        self._mongo_writer = None
         self._apprise = None
-        self._notify_executor = None
-        self._file_buffer = []
-        self._json_buffer = []
-        self._jsonl_buffer = []
-        self._buffer_lock = threading.Lock()
+        self._notifier = None
+        self._rotation_executor = None
+        self._file_buffer = self._new_buffer("file", file_path)
+        self._json_buffer = self._new_buffer("json", json_path)
+        self._jsonl_buffer = self._new_buffer("jsonl", jsonl_path)
+        self._sql_buffer = self._new_buffer("sql", sql_path)
+        self._binary_buffer = self._new_buffer("binary", binary_path)
+        self._state_lock = threading.Lock()
+        self._file_sizes = {}
+        self._size_checks = {}
+        self._rollovers = {}
         self._color_cache = {}
+        self._console_stamp = (None, None, "")
         self._json_file_handle = None
+        self._json_tail = 0
+        self._json_has_entries = False
         self._file_path_handle = None
+        self._sql_conn = None
+        self._binary_handle = None
+        self._binary_encoder = None
+        self._writer = None
+        self._stats = LoggerStats()
+        self._stats_exporter = None
+        self._flush_timer = None
+        self._encoder = RecordEncoder(json_encoder)
+
+        if writer_queue is None:
+            self._init_services()
+
+        if self.background_writer:
+            self._start_writer()
+
+        if stats_callback is not None:
+            self._stats_exporter = PeriodicTimer(
+                self._export_stats, stats_interval, "tamga-stats"
+            )
 
-        self._init_services()
+        if flush_interval is not None and writer_queue is None:
+            self._flush_timer = PeriodicTimer(
+                self._flush_buffers, flush_interval, "tamga-flush"
+            )
+
+        _instances.add(self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping the caches that depend on it."""
+        object.__setattr__(self, name, value)
+        if name in _ROUTE_SETTINGS:
+            object.__setattr__(self, "_routes", {})
+        elif name in _CONSOLE_SETTINGS:
+            object.__setattr__(self, "_color_cache", {})
+            object.__setattr__(self, "_console_stamp", (None, None, ""))
+
+    def _new_buffer(self, sink: str, path: str) -> RecordBuffer:
+        """Create the memory-bounded buffer of an output."""
+        max_bytes = None
+        if self.max_buffer_mb is not None:
+            max_bytes = int(self.max_buffer_mb * 1024 * 1024)
+        spill_path = f"{path}.spill" if self.buffer_overflow == "spill" else None
+        return RecordBuffer(sink, max_bytes, spill_path)
+
+    def _start_writer(self):
+        """
+        Start the background writer thread unless it is already running.
+
+        A logger reopened this way after close() is registered again, so
+        the writer is drained at interpreter exit.
+        """
+        with self._state_lock:
+            if self._writer is None:
+                self._writer = BackgroundWriter(self._write_batch)
+                _instances.add(self)
+
+    def _ensure_writer(self):
+        """Route every later record through the writer thread; used by the a* helpers."""
+        if self._writer is None:
+            self._start_writer()
 
     def __repr__(self) -> str:
         """Return the active output configuration for debugging."""
@@ -221,15 +568,25 @@ class Tamga:
 
     def _init_services(self):
         """Initialize external services and create necessary files."""
+        if self.rotate_when is not None:
+            # Opening an output can rewrite its tail; read the periods first
+            for filepath, enabled in (
+                (self.file_path, self.file_output),
+                (self.json_path, self.json_output),
+                (self.jsonl_path, self.jsonl_output),
+                (self.sql_path, self.sql_output),
+                (self.binary_path, self.binary_output),
+            ):
+                if enabled:
+                    self._start_rollover_period(filepath, self._file_mtime_ns(filepath))
+
         if self.mongo_output:
             self._init_mongo()
 
         if self.file_output:
             self._ensure_file_exists(self.file_path)
             try:
-                self._file_path_handle = open(
-                    self.file_path, "a", encoding="utf-8", buffering=8192
-                )
+                self._file_path_handle = open(self.file_path, "ab", buffering=8192)
             except Exception:
                 pass
 
@@ -239,21 +596,43 @@ class Tamga:
         if self.sql_output:
             self._init_sql_db()
 
+        if self.binary_output:
+            self._open_binary_file()
+
     def _init_mongo(self):
-        """Initialize MongoDB connection."""
+        """Start the MongoDB writer thread and its event loop."""
         try:
-            import motor.motor_asyncio
-
-            client = motor.motor_asyncio.AsyncIOMotorClient(
-                self.mongo_uri, tls=True, tlsAllowInvalidCertificates=True
+            self._mongo_writer = MongoWriter(
+                self._connect_mongo,
+                batch_size=self.mongo_batch_size,
+                flush_interval=self.mongo_flush_interval,
+                on_error=self._on_mongo_error,
             )
-            self._mongo_client = client[self.mongo_database_name][
-                self.mongo_collection_name
-            ]
             self._log_internal("Connected to MongoDB", "TAMGA", "lime")
         except Exception as e:
             self._log_internal(f"Failed to connect to MongoDB: {e}", "CRITICAL", "red")
 
+    def _connect_mongo(self):
+        """Create the MongoDB collection; runs on the writer's event loop thread."""
+        import motor.motor_asyncio
+
+        client = motor.motor_asyncio.AsyncIOMotorClient(
+            self.mongo_uri, tls=True, tlsAllowInvalidCertificates=True
+        )
+        return client[self.mongo_database_name][self.mongo_collection_name]
+
+    def _on_mongo_error(self, error: Exception, count: int):
+        """Report MongoDB failures from the writer thread."""
+        self._stats.failed("mongo", count or 1)
+        if count:
+            self._log_internal(
+                f"Failed to write {count} logs to MongoDB: {error}", "ERROR", "red"
+            )
+        else:
+            self._log_internal(
+                f"Failed to connect to MongoDB: {error}", "CRITICAL", "red"
+            )
+
     def _init_apprise(self):
         """Lazy initialize Apprise for performance."""
         if self._apprise is None and self.notify_services:
@@ -265,10 +644,12 @@ class Tamga:
                 for service in self.notify_services:
                     self._apprise.add(service)
 
-                from concurrent.futures import ThreadPoolExecutor
-
-                self._notify_executor = ThreadPoolExecutor(
-                    max_workers=2, thread_name_prefix="tamga-notify"
+                self._notifier = NotificationDispatcher(
+                    self._send_notification,
+                    window=self.notify_window,
+                    max_per_level=self.notify_max_per_window,
+                    queue_size=self.notify_queue_size,
+                    drop_policy=self.notify_drop_policy,
                 )
 
                 self._log_internal(
@@ -288,40 +669,47 @@ class Tamga:
                 )
 
     def _send_notification_async(self, message: str, level: str, title: str = None):
-        """Send notification asynchronously without blocking."""
+        """Queue a notification for the rate-limited notification worker."""
         if not self.notify_services or not self._apprise:
             return
 
-        def send():
-            try:
-                final_title = title or self.notify_title.format(
-                    appname="Tamga",
-                    level=level,
-                    date=current_date(),
-                    time=current_time(),
-                )
-                formatted_message = self._apply_default_template(message, level)
-
-                self._apprise.notify(
-                    body=formatted_message,
-                    title=final_title,
-                    body_format=self.notify_format,
-                )
-            except Exception as e:
-                self._log_internal(f"Notification failed: {e}", "ERROR", "red")
-
-        if self._notify_executor:
-            self._notify_executor.submit(send)
+        if self._notifier:
+            self._notifier.submit(message, level, title)
         else:
-            threading.Thread(target=send, daemon=True).start()
+            threading.Thread(
+                target=self._send_notification,
+                args=(message, level, title),
+                daemon=True,
+            ).start()
+
+    def _send_notification(self, message: str, level: str, title: str = None):
+        """Deliver one notification through Apprise."""
+        try:
+            clock = clock_snapshot()
+            final_title = title or self.notify_title.format(
+                appname="Tamga",
+                level=level,
+                date=clock.date,
+                time=clock.time,
+            )
+            formatted_message = self._apply_default_template(message, level)
+
+            self._apprise.notify(
+                body=formatted_message,
+                title=final_title,
+                body_format=self.notify_format,
+            )
+        except Exception as e:
+            self._log_internal(f"Notification failed: {e}", "ERROR", "red")
 
     def _apply_default_template(self, message: str, level: str) -> str:
         """Apply notification templates using the unified apprise module."""
         try:
             from .utils.apprise import format_notification
 
+            clock = clock_snapshot()
             return format_notification(
-                message, level, current_date(), current_time(), self.notify_format
+                message, level, clock.date, clock.time, self.notify_format
             )
         except Exception as e:
             self._log_internal(
@@ -334,16 +722,173 @@ class Tamga:
         if not os.path.exists(self.json_path):
             with open(self.json_path, "w", encoding="utf-8") as f:
                 json.dump([], f)
+        self._open_json_file()
+
+    def _open_json_file(self):
+        """Open the JSON array file for positioned writes and find its tail."""
+        self._json_file_handle = open(self.json_path, "r+b")
+        self._json_tail, self._json_has_entries = self._locate_json_tail(
+            self._json_file_handle
+        )
+        self._file_sizes[self.json_path] = self._json_tail + 2
+
+    def _locate_json_tail(self, handle) -> Tuple[int, bool]:
+        """
+        Find where the next JSON entries go and make the file end in a bracket.
+
+        Entries are written one per line as "[\\n{...},\\n{...}\\n]", so the tail
+        is the offset right after the last entry, or right after "[" when the
+        array is empty. A file left without its closing bracket by a crash is
+        cut back to its last complete entry.
+
+        Returns:
+            Tuple of (tail offset, whether the array has entries)
+        """
+        handle.seek(0, 2)
+        start = max(0, handle.tell() - _JSON_TAIL_SCAN_BYTES)
+        handle.seek(start)
+        content = handle.read().rstrip()
+
+        if content.endswith(b"]"):
+            content = content[:-1].rstrip()
+            if content:
+                return self._close_json_array(
+                    handle, start + len(content), not content.endswith(b"[")
+                )
+
+        # Closing bracket missing: walk back to the last line that is a whole entry
+        handle.seek(0)
+        content = handle.read().rstrip()
+        while content and not content.endswith(b"["):
+            newline = content.rfind(b"\n")
+            entry = content[newline + 1 :].strip().rstrip(b",")
+            try:
+                if isinstance(json.loads(entry), dict):
+                    tail = len(content) - (1 if content.endswith(b",") else 0)
+                    return self._close_json_array(handle, tail, True)
+            except ValueError:
+                pass
+            content = content[:newline].rstrip() if newline >= 0 else b""
+
+        if not content:
+            handle.seek(0)
+            handle.write(b"[")
+            content = b"["
+        return self._close_json_array(handle, len(content), False)
+
+    def _close_json_array(self, handle, tail: int, has_entries: bool):
+        """Write the closing bracket right after tail and drop anything beyond it."""
+        handle.seek(tail)
+        handle.write(b"\n]")
+        handle.truncate()
+        handle.flush()
+        return tail, has_entries
 
     def _init_sql_db(self):
         """Initialize SQLite database with structured data support."""
         self._ensure_file_exists(self.sql_path)
-        with sqlite3.connect(self.sql_path) as conn:
+        self._sql_conn = self._connect_sql()
+
+    def _connect_sql(self) -> sqlite3.Connection:
+        """Open the long-lived SQLite connection in WAL mode and ensure the schema."""
+        conn = sqlite3.connect(self.sql_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.sql_synchronous}")
+        with conn:
             conn.execute(
                 f"""CREATE TABLE IF NOT EXISTS {self.sql_table_name}
                 (level TEXT, message TEXT, data TEXT, date TEXT, time TEXT,
                 timezone TEXT, timestamp REAL)"""
             )
+            conn.execute(
+                f"""CREATE INDEX IF NOT EXISTS {self.sql_table_name}_timestamp
+                ON {self.sql_table_name} (timestamp)"""
+            )
+            conn.execute(
+                f"""CREATE INDEX IF NOT EXISTS {self.sql_table_name}_level_timestamp
+                ON {self.sql_table_name} (level, timestamp)"""
+            )
+        return conn
+
+    def query_sql(
+        self,
+        level: Union[str, Iterable[str], None] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        where_data: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Query the SQL output, oldest record first.
+
+        Buffered records are flushed first. Level and time filters use the
+        (level, timestamp) and timestamp indexes; where_data is matched with
+        SQLite's json_extract on the data column. Rows are read on a separate
+        read-only connection, so logging continues while the generator is open.
+
+        Args:
+            level: Level name or names to keep
+            since: Keep records at or after this time (unix seconds, datetime or ISO string)
+            until: Keep records before this time (unix seconds, datetime or ISO string)
+            where_data: Data key/value pairs that must all be equal
+            limit: Maximum number of rows
+
+        Yields:
+            Records with level, message, data, date, time, timezone and timestamp
+        """
+        self._flush_buffer(self._sql_buffer, Tamga._write_sql_records)
+
+        clauses = []
+        params: List[Any] = []
+        if level is not None:
+            levels = [level] if isinstance(level, str) else list(level)
+            clauses.append(f"level IN ({', '.join('?' * len(levels))})")
+            params.extend(levels)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(to_timestamp(since))
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(to_timestamp(until))
+        for key, value in (where_data or {}).items():
+            path = '$."' + str(key).replace('"', '\\"') + '"'
+            if value is None:
+                clauses.append("json_type(data, ?) = 'null'")
+                params.append(path)
+            elif isinstance(value, (bool, int, float, str)):
+                clauses.append("json_extract(data, ?) = ?")
+                params.extend((path, value))
+            else:
+                clauses.append("json_extract(data, ?) = json(?)")
+                params.extend((path, json.dumps(value, default=str)))
+
+        sql = (
+            "SELECT level, message, data, date, time, timezone, timestamp "
+            f"FROM {self.sql_table_name}"
+        )
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY timestamp"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        # as_uri() percent-encodes characters such as "#" and "?" in the path
+        uri = Path(self.sql_path).absolute().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+        try:
+            for row in conn.execute(sql, params):
+                yield {
+                    "level": row[0],
+                    "message": row[1],
+                    "data": json.loads(row[2]) if row[2] else {},
+                    "date": row[3],
+                    "time": row[4],
+                    "timezone": row[5],
+                    "timestamp": row[6],
+                }
+        finally:
+            conn.close()
 
     def _ensure_file_exists(self, filepath: str):
         """Ensure file exists, create if not."""
@@ -351,471 +896,1167 @@ class Tamga:
             os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
             open(filepath, "w", encoding="utf-8").close()
 
-    def _format_timestamp(self) -> str:
+    def _format_timestamp(self, clock: ClockSnapshot) -> str:
         """Format timestamp string based on settings."""
         parts = []
         if self.show_date:
-            parts.append(current_date())
+            parts.append(clock.date)
         if self.show_time:
-            parts.append(current_time())
+            parts.append(clock.time)
         if self.show_timezone:
-            parts.append(current_timezone())
+            parts.append(clock.timezone)
         return " | ".join(parts) if parts else ""
 
-    def _parse_message_data(self, message: str) -> Tuple[str, Dict[str, Any]]:
+    def _log_internal(self, message: str, level: str, color: str):
+        """Internal logging for Tamga messages."""
+        if self.console_output:
+            self._write_to_console(message, level, color)
+
+    def register_level(self, level: str, severity: int) -> None:
         """
-        Parse message to extract base message and structured data.
+        Register a custom level with its severity for min_level filtering.
 
         Args:
-            message: Message that may contain key-value data (e.g., "User login | user_id=123, action='login'")
-
-        Returns:
-            Tuple of (base_message, key_value_dict)
+            level: Custom level name, as passed to custom()
+            severity: Integer severity, see LOG_SEVERITIES for the built-in scale
         """
-        if " | " not in message:
-            return message, {}
-
-        parts = message.split(" | ", 1)
-        base_message = parts[0]
-        data_part = parts[1]
-
-        data_dict = {}
-        pattern = r"(\w+)=(?:'((?:[^'\\]|\\.)*)' |\"((?:[^\"\\]|\\.)*)\" |([^,]+?))(?=,\s*\w+=|$)"
-        matches = re.findall(pattern, data_part)
+        self._severities[level] = severity
+        self._routes.clear()
+        if len(level) > self.max_level_width:
+            self.max_level_width = len(level)
+            self._color_cache.clear()
 
-        for match in matches:
-            key = match[0]
-            value = match[1] or match[2] or match[3]
-            value = value.strip()
+    def set_min_level(self, level: Union[str, int, None]) -> None:
+        """
+        Drop every record below the given level from now on.
 
-            if not (match[1] or match[2]):
-                try:
-                    if value.lower() in ("true", "false"):
-                        value = value.lower() == "true"
-                    elif (
-                        "." in value
-                        and value.replace(".", "", 1).replace("-", "", 1).isdigit()
-                    ):
-                        value = float(value)
-                    elif value.lstrip("-").isdigit():
-                        value = int(value)
-                except ValueError:
-                    pass
-            data_dict[key] = value
-
-        return base_message, data_dict
+        Args:
+            level: Level name, integer severity, or None to keep all records
+        """
+        if level is None:
+            severity = 0
+        elif isinstance(level, int):
+            severity = level
+        elif level in self._severities:
+            severity = self._severities[level]
+        else:
+            raise ValueError(f"Unknown log level: {level!r}")
 
-    def _log_internal(self, message: str, level: str, color: str):
-        """Internal logging for Tamga messages."""
-        if self.console_output:
-            self._write_to_console(message, level, color)
+        self.min_level = level
+        self._min_severity = severity
 
-    def log(self, message: str, level: str, color: str) -> None:
+    def log(
+        self,
+        message: str,
+        level: str,
+        color: str,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """
         Main logging method that handles all types of logs.
+
+        Args:
+            message: Log message
+            level: Log level name
+            color: Color name used for console output
+            data: Optional structured key-value data, passed to outputs as-is
         """
-        base_message, structured_data = self._parse_message_data(message)
+        if self._severities.get(level, DEFAULT_SEVERITY) < self._min_severity:
+            return
+        self._log(message, level, color, data)
 
+    def _log(
+        self,
+        message: str,
+        level: str,
+        color: str,
+        data: Optional[Dict[str, Any]] = None,
+        limited: bool = True,
+    ) -> None:
+        """Build a record that passed the level check and hand it to the outputs."""
+        limiter = self._limiter
+        if limited and limiter is not None:
+            allowed = limiter.allow(
+                level, data.get("key", message) if data else message
+            )
+            if limiter.report_pending:
+                self._report_suppressed()
+            if not allowed:
+                return
+
+        stats = self._stats
+        with stats.lock:
+            stats.levels[level] = stats.levels.get(level, 0) + 1
+            stats.calls += 1
+            timed = not stats.calls % CALL_SAMPLE_EVERY
+        began = perf_counter_ns() if timed else 0
+
+        clock = clock_snapshot()
         log_data = {
             "message": message,
-            "base_message": base_message,
-            "data": structured_data,
+            "data": data or {},
             "level": level,
             "color": color,
-            "timestamp": self._format_timestamp(),
-            "date": current_date(),
-            "time": current_time(),
-            "timezone": current_timezone(),
-            "unix_timestamp": current_timestamp(),
+            "clock": clock,
+            "date": clock.date,
+            "time": clock.time,
+            "timezone": clock.timezone,
+            "unix_timestamp": clock.timestamp,
         }
 
-        if self.console_output:
-            self._write_to_console(message, level, color)
+        writer = self._writer
+        if writer is not None:
+            writer.submit(log_data)
+        else:
+            self._dispatch(log_data)
+
+        if timed:
+            elapsed = perf_counter_ns() - began
+            with stats.lock:
+                stats.call_latency.record(elapsed)
+
+    def _report_suppressed(self):
+        """Log the sampled and rate-limited call counts since the last report."""
+        suppressed = self._limiter.take_suppressed()
+        if suppressed:
+            self._log(
+                f"Suppressed {sum(suppressed.values())} log records",
+                "METRIC",
+                "cyan",
+                suppressed,
+                limited=False,
+            )
 
-        if self.file_output:
-            self._buffer_file_write(log_data)
+    def _write_batch(self, records: List[Dict[str, Any]]):
+        """Write a batch of queued records from the writer thread or writer process."""
+        console_lines = [] if self.console_output else None
+        for log_data in records:
+            self._dispatch(log_data, console_lines)
 
-        if self.json_output:
-            self._buffer_json_write(log_data)
+        if console_lines:
+            sys.stdout.write("".join(console_lines))
 
-        if self.jsonl_output:
-            self._buffer_jsonl_write(log_data)
+    def _dispatch(
+        self, log_data: Dict[str, Any], console_lines: Optional[List[str]] = None
+    ):
+        """
+        Fan a log record out to the outputs routed for its level.
 
-        if self.sql_output:
-            self._write_to_sql(log_data)
+        Args:
+            log_data: Log record built by log()
+            console_lines: Collects console lines for one batched write instead
+                of writing each line immediately
+        """
+        level = log_data["level"]
+        route = self._routes.get(level)
+        if route is None:
+            route = self._build_route(level)
+        to_console, to_notify, render_text, writers = route
+
+        message = log_data["message"]
+        if render_text and log_data["data"]:
+            message += self._format_kwargs(log_data["data"])
+        log_data["text"] = message
+
+        if to_console:
+            color = log_data["color"]
+            if console_lines is None:
+                self._write_to_console(message, level, color, log_data["clock"])
+            else:
+                console_lines.append(
+                    self._format_console_line(message, level, color, log_data["clock"])
+                )
+
+        for write in writers:
+            write(self, log_data)
 
-        if level in self.notify_levels and self.notify_services:
+        if to_notify:
             if self._apprise is None:
                 self._init_apprise()
 
             self._send_notification_async(message, level)
 
-        if self.mongo_output:
-            self._write_to_mongo_async(log_data)
+    def _build_route(self, level: str) -> Tuple[bool, bool, bool, tuple]:
+        """
+        Work out which outputs receive records of a level and cache the result.
+
+        Returns:
+            Tuple of (to console, to notifications, render key-value text,
+            buffer writers of the other outputs); the writers are plain functions
+            so the cache does not keep the logger alive through bound methods
+        """
+        to_console = self.console_output and self._sink_accepts("console", level)
+        if self.writer_queue is not None:
+            route = (to_console, False, to_console, (Tamga._forward_record,))
+            self._routes[level] = route
+            return route
+
+        to_file = self.file_output and self._sink_accepts("file", level)
+        # notify() submits its own notification, with the caller's title
+        to_notify = (
+            level != "NOTIFY"
+            and level in self.notify_levels
+            and bool(self.notify_services)
+        )
+
+        writers = []
+        if to_file:
+            writers.append(Tamga._buffer_file_write)
+        if self.json_output and self._sink_accepts("json", level):
+            writers.append(Tamga._buffer_json_write)
+        if self.jsonl_output and self._sink_accepts("jsonl", level):
+            writers.append(Tamga._buffer_jsonl_write)
+        if self.sql_output and self._sink_accepts("sql", level):
+            writers.append(Tamga._buffer_sql_write)
+        if self.mongo_output and self._sink_accepts("mongo", level):
+            writers.append(Tamga._buffer_mongo_write)
+        if self.binary_output and self._sink_accepts("binary", level):
+            writers.append(Tamga._buffer_binary_write)
+
+        route = (
+            to_console,
+            to_notify,
+            to_console or to_file or to_notify,
+            tuple(writers),
+        )
+        self._routes[level] = route
+        return route
+
+    def _forward_record(self, log_data: Dict[str, Any]):
+        """Send a record to the writer process that owns the other outputs."""
+        try:
+            self.writer_queue.put(log_data)
+        except Exception as e:
+            self._log_internal(
+                f"Failed to send log to writer process: {e}", "ERROR", "red"
+            )
+
+    @staticmethod
+    def start_writer_process(
+        batch_size: int = 1000,
+        flush_interval: float = 1.0,
+        context: Optional[str] = None,
+        **config: Any,
+    ) -> WriterProcess:
+        """
+        Start a process that owns every output for a group of worker processes.
+
+        Call this once in the parent (e.g. a gunicorn on_starting hook) and
+        create Tamga(writer_queue=writer.queue) in each worker. Only the writer
+        process writes and rotates files, so workers never interleave appends.
+
+        Args:
+            batch_size: Maximum number of records written at once
+            flush_interval: Seconds without records after which buffers are flushed
+            context: multiprocessing start method, None for the platform default
+            **config: Tamga keyword arguments for the writer process outputs;
+                console output is off unless enabled here
+
+        Returns:
+            WriterProcess whose queue is passed to the workers; call stop() on shutdown
+        """
+        return WriterProcess(config, batch_size, flush_interval, context)
+
+    def _sink_accepts(self, sink: str, level: str) -> bool:
+        """Check a level against the sink_levels entry of an output."""
+        accepted = self.sink_levels.get(sink)
+        if accepted is None:
+            return True
+        if isinstance(accepted, (str, int)):
+            if isinstance(accepted, str):
+                accepted = self._severities.get(accepted, DEFAULT_SEVERITY)
+            return self._severities.get(level, DEFAULT_SEVERITY) >= accepted
+        return level in accepted
 
     def _buffer_file_write(self, log_data: Dict[str, Any]):
         """Buffer file writes for better performance."""
-        with self._buffer_lock:
-            self._file_buffer.append(log_data)
-            if len(self._file_buffer) >= self.buffer_size:
-                self._flush_file_buffer()
+        self._buffer_record(self._file_buffer, Tamga._write_file_records, log_data)
 
     def _buffer_json_write(self, log_data: Dict[str, Any]):
         """Buffer JSON writes for better performance."""
-        with self._buffer_lock:
-            self._json_buffer.append(log_data)
-            if len(self._json_buffer) >= self.buffer_size:
-                self._flush_json_buffer()
+        self._buffer_record(self._json_buffer, Tamga._write_json_records, log_data)
 
     def _buffer_jsonl_write(self, log_data: Dict[str, Any]):
         """Buffer JSON Lines writes for better performance."""
-        with self._buffer_lock:
-            self._jsonl_buffer.append(log_data)
-            if len(self._jsonl_buffer) >= self.buffer_size:
-                self._flush_jsonl_buffer()
+        self._buffer_record(self._jsonl_buffer, Tamga._write_jsonl_records, log_data)
+
+    def _open_binary_file(self):
+        """
+        Open the binary log for appending, cutting off a frame left by a crash.
+
+        A file that does not start with the binary log header is left as it
+        is and the output stays closed.
+        """
+        try:
+            length = valid_length(self.binary_path)
+            handle = open(self.binary_path, "ab")
+            if handle.tell() != length:
+                handle.truncate(length)
+
+            encoder = BinaryEncoder()
+            handle.write(encoder.reset() if length else encoder.header())
+            self._binary_handle = handle
+            self._binary_encoder = encoder
+        except Exception as e:
+            self._log_internal(f"Failed to open binary log: {e}", "ERROR", "red")
+
+    def _buffer_sql_write(self, log_data: Dict[str, Any]):
+        """Buffer SQL inserts for better performance."""
+        self._buffer_record(self._sql_buffer, Tamga._write_sql_records, log_data)
+
+    def _buffer_binary_write(self, log_data: Dict[str, Any]):
+        """Buffer binary writes for better performance."""
+        self._buffer_record(self._binary_buffer, Tamga._write_binary_records, log_data)
+
+    def _buffer_record(
+        self,
+        buffer: RecordBuffer,
+        write: Callable[["Tamga", List[Dict[str, Any]]], bool],
+        log_data: Dict[str, Any],
+    ):
+        """
+        Append a record to an output buffer, flushing it when it is due.
 
-    def _flush_jsonl_buffer(self):
-        """Flush JSON Lines buffer to disk.
+        A buffer is due at buffer_size records and full at its memory budget.
+        A due buffer is only flushed if no other thread is writing that output,
+        since the writing thread picks the new records up when it finishes;
+        a full buffer waits for the output so buffer_overflow can apply.
+        """
+        with buffer.lock:
+            count = buffer.append(log_data)
+            full = buffer.full
+        if count >= self.buffer_size or full:
+            self._flush_buffer(buffer, write, wait=full)
+
+    def _flush_buffer(
+        self,
+        buffer: RecordBuffer,
+        write: Callable[["Tamga", List[Dict[str, Any]]], bool],
+        wait: bool = True,
+    ):
+        """
+        Write an output buffer, spilled records first.
+
+        Only io_lock is held during I/O; the buffer lock is taken just to swap
+        the pending records out, so other threads keep appending meanwhile.
+
+        Args:
+            buffer: Output buffer to write
+            write: Writes a batch to the output and returns True on success
+            wait: Wait for a write of this output in progress instead of returning
+        """
+        if not buffer.io_lock.acquire(wait):
+            return
+        try:
+            if buffer.has_spill and not self._replay_spill(buffer, write):
+                # Newer records must not overtake the spilled ones
+                return
+            while (
+                self._write_buffered(buffer, write) and len(buffer) >= self.buffer_size
+            ):
+                pass
+            if buffer.full:
+                self._buffer_overflow(buffer, write)
+        finally:
+            buffer.io_lock.release()
+
+    def _write_buffered(
+        self,
+        buffer: RecordBuffer,
+        write: Callable[["Tamga", List[Dict[str, Any]]], bool],
+    ) -> bool:
+        """Swap the records out of a buffer and write them; io_lock must be held."""
+        with buffer.lock:
+            records, size = buffer.take()
+        if not records:
+            return True
+        unwritten = self._write_periods(write, records)
+        if not unwritten:
+            return True
+        if len(unwritten) < len(records):
+            size = sum(map(record_size, unwritten))
+        with buffer.lock:
+            buffer.restore(unwritten, size)
+        return False
+
+    def _write_periods(
+        self,
+        write: Callable[["Tamga", List[Dict[str, Any]]], bool],
+        records: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Write a batch in parts that each fall inside one rollover period.
+
+        The output rotates between the parts, so records logged before a
+        rollover reach the file of their own period.
+
+        Returns:
+            The records that were not written, empty on success
+        """
+        if self.rotate_when is None:
+            return [] if write(self, records) else records
+
+        start = 0
+        while start < len(records):
+            end = rollover_period(self.rotate_when, records[start]["clock"].unix_ns)[0]
+            stop = start + 1
+            while stop < len(records) and records[stop]["clock"].unix_ns < end:
+                stop += 1
+            part = records if stop - start == len(records) else records[start:stop]
+            if not write(self, part):
+                return records[start:]
+            start = stop
+        return []
+
+    def _replay_spill(
+        self,
+        buffer: RecordBuffer,
+        write: Callable[["Tamga", List[Dict[str, Any]]], bool],
+    ) -> bool:
+        """Write spilled records, then the buffer; io_lock must be held."""
+        try:
+            with buffer.lock:
+                # Queue the buffered records behind the spilled ones to keep order
+                buffer.spill()
+            return buffer.replay(
+                lambda records: not self._write_periods(write, records),
+                self.buffer_size,
+            )
+        except Exception as e:
+            self._log_internal(
+                f"Failed to replay spilled {buffer.name} records: {e}", "ERROR", "red"
+            )
+            return False
+
+    def _buffer_overflow(
+        self,
+        buffer: RecordBuffer,
+        write: Callable[["Tamga", List[Dict[str, Any]]], bool],
+    ):
+        """Apply buffer_overflow to an output buffer over budget; io_lock must be held."""
+        policy = self.buffer_overflow
+        if policy == "block":
+            # Holding io_lock makes every thread that fills this buffer wait too
+            deadline = monotonic() + self.buffer_block_timeout
+            delay = 0.01
+            while buffer.full and monotonic() < deadline:
+                sleep(delay)
+                delay = min(delay * 2, 1.0)
+                self._write_buffered(buffer, write)
+
+        error = None
+        with buffer.lock:
+            if not buffer.full:
+                return
+            if policy == "spill":
+                try:
+                    spilled = buffer.spill()
+                except Exception as e:
+                    error = e
+                else:
+                    self._stats.spilled(buffer.name, spilled)
+                    return
+            if policy == "drop_oldest":
+                dropped = buffer.drop_oldest()
+            else:
+                dropped = buffer.drop_newest()
+
+        if error is not None:
+            self._log_internal(
+                f"Failed to spill {buffer.name} records: {error}", "ERROR", "red"
+            )
+        if dropped:
+            self._stats.dropped(buffer.name, dropped)
+
+    def _write_jsonl_records(self, records: List[Dict[str, Any]]) -> bool:
+        """Write a batch of records to the JSON Lines file.
 
         Unlike the JSON array format, JSONL appends one self-contained JSON
         object per line, so writes are pure appends with no seek/rewrite of the
         existing file. This makes it safe for streaming, log shipping and tools
         like `jq` that consume newline-delimited JSON.
         """
-        if not self._jsonl_buffer:
-            return
-
-        self._handle_file_rotation(self.jsonl_path, self.max_jsonl_size_mb)
+        began = perf_counter_ns()
+        self._handle_file_rotation(
+            self.jsonl_path, self.max_jsonl_size_mb, records[0]["clock"].unix_ns
+        )
 
         try:
-            with open(self.jsonl_path, "a", encoding="utf-8") as f:
-                for log in self._jsonl_buffer:
-                    f.write(
-                        json.dumps(
-                            {
-                                "level": log["level"],
-                                "message": log["base_message"],
-                                "data": log["data"],
-                                "date": log["date"],
-                                "time": log["time"],
-                                "timezone": log["timezone"],
-                                "timestamp": log["unix_timestamp"],
-                            },
-                            ensure_ascii=False,
-                            separators=(",", ":"),
-                        )
-                        + "\n"
-                    )
-            self._jsonl_buffer.clear()
+            entry = self._encoder.entry
+            payload = "".join(entry(log) + "\n" for log in records).encode("utf-8")
+
+            with open(self.jsonl_path, "ab") as f:
+                f.write(payload)
+            self._track_written(self.jsonl_path, len(payload))
+            self._stats.flushed("jsonl", len(records), len(payload), began)
+            return True
         except Exception as e:
+            self._stats.failed("jsonl")
             self._log_internal(f"Failed to write to JSONL: {e}", "ERROR", "red")
+            return False
 
-    def _flush_file_buffer(self):
-        """Flush file buffer to disk."""
-        if not self._file_buffer:
-            return
+    def _write_binary_records(self, records: List[Dict[str, Any]]) -> bool:
+        """Write a batch of records to the binary log.
 
-        self._handle_file_rotation(self.file_path, self.max_file_size_mb)
+        Records are encoded against the string table of the open file, so
+        repeated messages, keys and level names cost a few bytes each.
+        """
+        began = perf_counter_ns()
+        self._handle_file_rotation(
+            self.binary_path, self.max_binary_size_mb, records[0]["clock"].unix_ns
+        )
 
+        handle = self._binary_handle
         try:
+            if handle is None or handle.closed:
+                self._open_binary_file()
+                handle = self._binary_handle
+                if handle is None:
+                    self._stats.failed("binary")
+                    return False
+
+            payload = self._binary_encoder.encode(records)
+            handle.write(payload)
+            handle.flush()
+            self._track_written(self.binary_path, len(payload))
+            self._stats.flushed("binary", len(records), len(payload), began)
+            return True
+        except Exception as e:
+            self._stats.failed("binary")
+            # A partial write leaves the string table out of sync; reopen next time
+            if handle is not None:
+                handle.close()
+            self._binary_handle = None
+            self._log_internal(f"Failed to write to binary log: {e}", "ERROR", "red")
+            return False
+
+    def _write_file_records(self, records: List[Dict[str, Any]]) -> bool:
+        """Write a batch of records to the log file."""
+        began = perf_counter_ns()
+        self._handle_file_rotation(
+            self.file_path, self.max_file_size_mb, records[0]["clock"].unix_ns
+        )
+
+        try:
+            payload = "".join(
+                f"[{log_data['date']} | {log_data['time']} | {log_data['timezone']}] "
+                f"{log_data['level']}: {log_data['text']}\n"
+                for log_data in records
+            ).encode("utf-8")
+
             if self._file_path_handle and not self._file_path_handle.closed:
-                for log_data in self._file_buffer:
-                    file_timestamp = f"{log_data['date']} | {log_data['time']} | {log_data['timezone']}"
-                    self._file_path_handle.write(
-                        f"[{file_timestamp}] {log_data['level']}: {log_data['message']}\n"
-                    )
+                self._file_path_handle.write(payload)
                 self._file_path_handle.flush()
             else:
-                with open(self.file_path, "a", encoding="utf-8") as f:
-                    for log_data in self._file_buffer:
-                        file_timestamp = f"{log_data['date']} | {log_data['time']} | {log_data['timezone']}"
-                        f.write(
-                            f"[{file_timestamp}] {log_data['level']}: {log_data['message']}\n"
-                        )
-            self._file_buffer.clear()
+                with open(self.file_path, "ab") as f:
+                    f.write(payload)
+            self._track_written(self.file_path, len(payload))
+            self._stats.flushed("file", len(records), len(payload), began)
+            return True
         except Exception as e:
+            self._stats.failed("file")
             self._log_internal(f"Failed to write to file: {e}", "ERROR", "red")
+            return False
 
-    def _flush_json_buffer(self):
-        """Flush JSON buffer to disk efficiently."""
-        if not self._json_buffer:
-            return
-
-        self._handle_file_rotation(self.json_path, self.max_json_size_mb)
+    def _write_json_records(self, records: List[Dict[str, Any]]) -> bool:
+        """Write a batch of records to the JSON array file."""
+        began = perf_counter_ns()
+        self._handle_file_rotation(
+            self.json_path, self.max_json_size_mb, records[0]["clock"].unix_ns
+        )
 
         try:
-            with open(self.json_path, "r+", encoding="utf-8") as f:
-                f.seek(0, 2)
-                file_size = f.tell()
-
-                if file_size > 2:
-                    f.seek(file_size - 2)
-                    f.write(",\n")
-                else:
-                    f.seek(0)
-                    f.write("[\n")
-
-                entries = [
-                    json.dumps(
-                        {
-                            "level": log["level"],
-                            "message": log["base_message"],
-                            "data": log["data"],
-                            "date": log["date"],
-                            "time": log["time"],
-                            "timezone": log["timezone"],
-                            "timestamp": log["unix_timestamp"],
-                        },
-                        ensure_ascii=False,
-                        separators=(",", ":"),
-                    )
-                    for log in self._json_buffer
-                ]
-
-                f.write(",\n".join(entries))
-                f.write("\n]")
-
-            self._json_buffer.clear()
+            handle = self._json_file_handle
+            if handle is None or handle.closed:
+                self._open_json_file()
+                handle = self._json_file_handle
+
+            entries = ",\n".join(map(self._encoder.entry, records))
+            separator = ",\n" if self._json_has_entries else "\n"
+            payload = f"{separator}{entries}\n]".encode("utf-8")
+
+            # One positioned write replaces the old closing bracket
+            handle.seek(self._json_tail)
+            handle.write(payload)
+            handle.flush()
+
+            self._json_tail += len(payload) - 2
+            self._json_has_entries = True
+            self._file_sizes[self.json_path] = self._json_tail + 2
+            self._stats.flushed("json", len(records), len(payload), began)
+            return True
         except Exception as e:
+            self._stats.failed("json")
+            # The tail offset is unknown after a failed write; find it again on reopen
+            if self._json_file_handle is not None:
+                self._json_file_handle.close()
+                self._json_file_handle = None
             self._log_internal(f"Failed to write to JSON: {e}", "ERROR", "red")
+            return False
 
-    def _get_color_codes(self, color: str) -> tuple:
-        """Get cached color codes for performance."""
-        if color not in self._color_cache:
-            self._color_cache[color] = (Color.text(color), Color.background(color))
-        return self._color_cache[color]
-
-    def _write_to_console(self, message: str, level: str, color: str):
-        """Write formatted log entry to console."""
-        if not self.colored_output:
-            timestamp = self._format_timestamp()
-            if timestamp:
-                print(f"[ {timestamp} ]  {level:<{self.max_level_width}}  {message}")
-            else:
-                print(f"{level:<{self.max_level_width}}  {message}")
-            return
-
-        text_color, bg_color = self._get_color_codes(color)
+    def _console_format(self, level: str, color: str) -> Tuple[str, str]:
+        """Get the cached (prefix, suffix) wrapped around a console message."""
+        key = (level, color)
+        parts = self._color_cache.get(key)
+        if parts is not None:
+            return parts
+
+        padded_level = f"{level:<{self.max_level_width}}"
+        if self.colored_output:
+            parts = (
+                f"{Color.background(color)}{Color.style('bold')}"
+                f" {padded_level} {Color.end_code} {Color.text(color)}",
+                f"{Color.end_code}\n",
+            )
+        else:
+            parts = (f"{padded_level}  ", "\n")
 
-        output_parts = []
+        self._color_cache[key] = parts
+        return parts
 
-        if self.show_date or self.show_time or self.show_timezone:
-            output_parts.append(f"{Color.text('gray')}[{Color.end_code}")
+    def _console_timestamp(self, clock: ClockSnapshot) -> str:
+        """Get the console timestamp column, rendered once per second."""
+        cached = self._console_stamp
+        if cached[0] == clock.date and cached[1] == clock.time:
+            return cached[2]
 
+        if not (self.show_date or self.show_time or self.show_timezone):
+            stamp = ""
+        elif not self.colored_output:
+            stamp = f"[ {self._format_timestamp(clock)} ]  "
+        else:
+            gray = Color.text("gray")
+            end = Color.end_code
             content_parts = []
-
             if self.show_date:
-                content_parts.append(
-                    f"{Color.text('indigo')}{current_date()}{Color.end_code}"
-                )
-
+                content_parts.append(f"{Color.text('indigo')}{clock.date}{end}")
             if self.show_time:
-                content_parts.append(
-                    f"{Color.text('violet')}{current_time()}{Color.end_code}"
-                )
-
+                content_parts.append(f"{Color.text('violet')}{clock.time}{end}")
             if self.show_timezone:
-                content_parts.append(
-                    f"{Color.text('purple')}{current_timezone()}{Color.end_code}"
-                )
+                content_parts.append(f"{Color.text('purple')}{clock.timezone}{end}")
+            separator = f"{gray} | {end}"
+            stamp = f"{gray}[{end} {separator.join(content_parts)} {gray}]{end} "
 
-            if content_parts:
-                separator = f"{Color.text('gray')} | {Color.end_code}"
-                output_parts.append(separator.join(content_parts))
+        self._console_stamp = (clock.date, clock.time, stamp)
+        return stamp
 
-            output_parts.append(f"{Color.text('gray')}]{Color.end_code}")
+    def _format_console_line(
+        self, message: str, level: str, color: str, clock: ClockSnapshot
+    ) -> str:
+        """Render a complete console line, including the trailing newline."""
+        prefix, suffix = self._console_format(level, color)
+        return f"{self._console_timestamp(clock)}{prefix}{message}{suffix}"
 
-        level_str = (
-            f"{bg_color}"
-            f"{Color.style('bold')}"
-            f" {level:<{self.max_level_width}} "
-            f"{Color.end_code}"
+    def _write_to_console(
+        self,
+        message: str,
+        level: str,
+        color: str,
+        clock: Optional[ClockSnapshot] = None,
+    ):
+        """Write formatted log entry to console."""
+        if clock is None:
+            clock = clock_snapshot()
+        sys.stdout.write(self._format_console_line(message, level, color, clock))
+
+    def _write_sql_records(self, records: List[Dict[str, Any]]) -> bool:
+        """Insert a batch of records into the database in a single transaction."""
+        began = perf_counter_ns()
+        self._handle_file_rotation(
+            self.sql_path, self.max_sql_size_mb, records[0]["clock"].unix_ns
         )
 
-        output_parts.append(level_str)
-        output_parts.append(f"{text_color}{message}{Color.end_code}")
-
-        print(" ".join(output_parts))
-
-    def _write_to_sql(self, log_data: Dict[str, Any]):
-        """Write log entry to SQL database with structured data support."""
-        self._handle_file_rotation(self.sql_path, self.max_sql_size_mb)
-
         try:
-            with sqlite3.connect(self.sql_path) as conn:
-                data_json = json.dumps(log_data["data"] or {})
+            if self._sql_conn is None:
+                self._sql_conn = self._connect_sql()
+
+            data = self._encoder.data
+            rows = [
+                (
+                    log_data["level"],
+                    log_data["message"],
+                    data(log_data),
+                    log_data["date"],
+                    log_data["time"],
+                    log_data["timezone"] or "",
+                    log_data["unix_timestamp"],
+                )
+                for log_data in records
+            ]
 
-                conn.execute(
+            with self._sql_conn:
+                self._sql_conn.executemany(
                     f"INSERT INTO {self.sql_table_name} VALUES (?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        log_data["level"],
-                        log_data["base_message"],
-                        data_json,
-                        log_data["date"],
-                        log_data["time"],
-                        log_data["timezone"] or "",
-                        log_data["unix_timestamp"],
-                    ),
+                    rows,
                 )
+            # Row payload is an estimate of the growth; periodic resyncs correct it
+            size = sum(len(row[1]) + len(row[2]) + _SQL_ROW_OVERHEAD for row in rows)
+            self._track_written(self.sql_path, size)
+            self._stats.flushed("sql", len(rows), size, began)
+            return True
         except Exception as e:
+            self._stats.failed("sql")
             self._log_internal(f"Failed to write to SQL: {e}", "ERROR", "red")
+            return False
 
-    def _write_to_mongo_async(self, log_data: Dict[str, Any]):
-        """Write to MongoDB asynchronously."""
-        if self._mongo_client is None:
+    def _buffer_mongo_write(self, log_data: Dict[str, Any]):
+        """Hand a document to the MongoDB writer, which sends it in batches."""
+        if self._mongo_writer is None:
             return
 
-        async def write():
-            try:
-                document = {
-                    "level": log_data["level"],
-                    "message": log_data["base_message"],
-                    "data": log_data["data"],
-                    "date": log_data["date"],
-                    "time": log_data["time"],
-                    "timezone": log_data["timezone"],
-                    "timestamp": log_data["unix_timestamp"],
-                }
+        self._mongo_writer.submit(
+            {
+                "level": log_data["level"],
+                "message": log_data["message"],
+                "data": log_data["data"],
+                "date": log_data["date"],
+                "time": log_data["time"],
+                "timezone": log_data["timezone"],
+                "timestamp": log_data["unix_timestamp"],
+            }
+        )
 
-                await self._mongo_client.insert_one(document)
-            except Exception as e:
-                self._log_internal(f"Failed to write to MongoDB: {e}", "ERROR", "red")
+    def _check_file_size(self, filepath: str, max_size_mb: int) -> bool:
+        """
+        Check if file size exceeds the maximum size limit.
 
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.create_task(write())
-            else:
-                loop.run_until_complete(write())
-        except RuntimeError:
-            asyncio.run(write())
+        Compares the byte count tracked in-process and only asks the filesystem
+        every few checks, so external truncation or deletion is still noticed.
+        """
+        checks = self._size_checks.get(filepath, _SIZE_RESYNC_INTERVAL) + 1
+        if checks >= _SIZE_RESYNC_INTERVAL:
+            self._resync_file_size(filepath)
+            checks = 0
+        self._size_checks[filepath] = checks
 
-    def _check_file_size(self, filepath: str, max_size_mb: int) -> bool:
-        """Check if file size exceeds the maximum size limit."""
+        return self._file_sizes[filepath] >= (max_size_mb * 1024 * 1024)
+
+    def _resync_file_size(self, filepath: str):
+        """Reset the tracked size of an output file from the file itself."""
         try:
-            return os.path.getsize(filepath) >= (max_size_mb * 1024 * 1024)
-        except OSError:
-            return False
+            self._file_sizes[filepath] = self._file_size(filepath)
+        except (OSError, sqlite3.Error):
+            self._file_sizes[filepath] = 0
+
+    def _track_written(self, filepath: str, size: int):
+        """Add bytes written by this process to the tracked file size."""
+        self._file_sizes[filepath] = self._file_sizes.get(filepath, 0) + size
+
+    def _file_size(self, filepath: str) -> int:
+        """Get the current size of an output file in bytes."""
+        if filepath == self.sql_path and self._sql_conn is not None:
+            # Pages still in the WAL are not reflected in the main file size
+            page_count = self._sql_conn.execute("PRAGMA page_count").fetchone()[0]
+            page_size = self._sql_conn.execute("PRAGMA page_size").fetchone()[0]
+            return page_count * page_size
+        return os.path.getsize(filepath)
+
+    def _create_backup(self, filepath: str, label: Optional[str] = None):
+        """
+        Move the file aside as a backup named after label, or the current time.
 
-    def _create_backup(self, filepath: str):
-        """Create a backup of the file with timestamp."""
+        The rename is the only work done on the logging path; compression and
+        retention run on the rotation worker thread. A database whose WAL is
+        still open is copied through its connection instead.
+        """
         if not os.path.exists(filepath):
             return
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = f"{filepath}.{timestamp}.bak"
+        try:
+            backup = backup_path(filepath, label)
+            if filepath == self.sql_path and self._sql_conn is not None:
+                with closing(sqlite3.connect(backup)) as target:
+                    self._sql_conn.backup(target)
+            else:
+                os.replace(filepath, backup)
+        except Exception as e:
+            self._stats.failed(self._sink_name(filepath))
+            self._log_internal(f"Failed to create backup: {e}", "ERROR", "red")
+            return
 
+        if (
+            self.backup_compression
+            or self.max_backups is not None
+            or self.max_backup_size_mb is not None
+        ):
+            with self._state_lock:
+                if self._rotation_executor is None:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    self._rotation_executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="tamga-rotate"
+                    )
+                self._rotation_executor.submit(self._process_backup, filepath, backup)
+
+    def _process_backup(self, filepath: str, backup: str):
+        """Compress a fresh backup and apply the retention limits."""
         try:
-            import shutil
+            if self.backup_compression:
+                compress_file(backup, self.backup_compression)
 
-            shutil.copy2(filepath, backup_path)
+            max_total_bytes = None
+            if self.max_backup_size_mb is not None:
+                max_total_bytes = int(self.max_backup_size_mb * 1024 * 1024)
+            prune_backups(filepath, self.max_backups, max_total_bytes)
         except Exception as e:
-            self._log_internal(f"Failed to create backup: {e}", "ERROR", "red")
+            self._log_internal(f"Failed to process backup: {e}", "ERROR", "red")
 
-    def _handle_file_rotation(self, filepath: str, max_size_mb: int):
-        """Handle file rotation when size limit is reached."""
-        if not self._check_file_size(filepath, max_size_mb):
-            return
+    def _handle_file_rotation(self, filepath: str, max_size_mb: int, unix_ns: int):
+        """
+        Handle file rotation when the size limit or the rollover time is reached.
+
+        Args:
+            filepath: Output file about to be written
+            max_size_mb: Size limit of the file
+            unix_ns: Time of the first record of the batch, which decides the rollover
+        """
+        label = None
+        if self.rotate_when is not None:
+            period = self._rollovers.get(filepath)
+            if period is None:
+                period = self._start_rollover_period(
+                    filepath, self._file_mtime_ns(filepath)
+                )
+
+            label = period[1]
+            if unix_ns >= period[0]:
+                self._start_rollover_period(filepath, unix_ns)
+                self._rotate_file(filepath, label)
+                return
+
+        if self._check_file_size(filepath, max_size_mb):
+            self._rotate_file(filepath, label)
+
+    def _start_rollover_period(self, filepath: str, unix_ns: int) -> Tuple[int, str]:
+        """Compute the rollover instant and backup label of the period containing unix_ns."""
+        period = rollover_period(self.rotate_when, unix_ns)
+        self._rollovers[filepath] = period
+        return period
+
+    def _file_mtime_ns(self, filepath: str) -> int:
+        """Last modification of an existing output file, so a restart rolls over stale files."""
+        try:
+            return os.stat(filepath).st_mtime_ns
+        except OSError:
+            return time_ns()
+
+    def _checkpoint_sql(self) -> bool:
+        """Copy the WAL into the database file; False if a reader keeps part of it."""
+        try:
+            busy, frames, copied = self._sql_conn.execute(
+                "PRAGMA wal_checkpoint(PASSIVE)"
+            ).fetchone()
+        except sqlite3.Error:
+            return False
+        return not busy and frames == copied
+
+    def _has_records(self, filepath: str) -> bool:
+        """Whether an output file holds any record; a period with none gets no backup."""
+        try:
+            if filepath == self.json_path and self._json_file_handle is not None:
+                return self._json_has_entries
+            if filepath == self.sql_path and self._sql_conn is not None:
+                return bool(
+                    self._sql_conn.execute(
+                        f"SELECT EXISTS(SELECT 1 FROM {self.sql_table_name})"
+                    ).fetchone()[0]
+                )
+            if filepath == self.binary_path:
+                if self._binary_handle is not None:
+                    self._binary_handle.flush()
+                return next(read_binary(filepath), None) is not None
+            return os.path.getsize(filepath) > 0
+        except Exception:
+            return os.path.exists(filepath)
+
+    def _sink_name(self, filepath: str) -> str:
+        """Name of the output writing to filepath, as used in stats()."""
+        if filepath == self.file_path:
+            return "file"
+        if filepath == self.json_path:
+            return "json"
+        if filepath == self.jsonl_path:
+            return "jsonl"
+        if filepath == self.sql_path:
+            return "sql"
+        return "binary"
+
+    def _rotate_file(self, filepath: str, label: Optional[str] = None):
+        """Move a full or expired output file aside and start a fresh one."""
+        backup = self.enable_backup and self._has_records(filepath)
 
         if filepath == self.file_path and self._file_path_handle:
             self._file_path_handle.close()
             self._file_path_handle = None
 
-        if self.enable_backup:
-            self._create_backup(filepath)
+        if filepath == self.binary_path and self._binary_handle:
+            self._binary_handle.close()
+            self._binary_handle = None
+
+        if filepath == self.json_path and self._json_file_handle:
+            self._json_file_handle.close()
+            self._json_file_handle = None
+
+        if filepath == self.sql_path and self._sql_conn:
+            if backup and not self._checkpoint_sql():
+                # A reader holds rows back in the WAL; copy them with the backup API
+                self._create_backup(filepath, label)
+                backup = False
+            self._sql_conn.close()
+            self._sql_conn = None
+
+        if backup:
+            self._create_backup(filepath, label)
 
         try:
-            if filepath.endswith(".json"):
+            if os.path.exists(filepath):
+                os.remove(filepath)
+
+            if filepath == self.json_path:
                 with open(filepath, "w", encoding="utf-8") as f:
                     json.dump([], f)
-            elif filepath.endswith(".db"):
-                with sqlite3.connect(filepath) as conn:
-                    conn.execute(f"DELETE FROM {self.sql_table_name}")
-                    conn.execute(
-                        f"""CREATE TABLE IF NOT EXISTS {self.sql_table_name}
-                        (level TEXT, message TEXT, data TEXT, date TEXT, time TEXT,
-                        timezone TEXT, timestamp REAL)"""
-                    )
+                self._open_json_file()
+            elif filepath == self.sql_path:
+                # A new database must not pick up the WAL of the old one
+                for suffix in ("-wal", "-shm"):
+                    if os.path.exists(filepath + suffix):
+                        os.remove(filepath + suffix)
+                self._sql_conn = self._connect_sql()
+            elif filepath == self.binary_path:
+                self._open_binary_file()
             else:
                 open(filepath, "w", encoding="utf-8").close()
 
             if filepath == self.file_path:
-                self._file_path_handle = open(
-                    self.file_path, "a", encoding="utf-8", buffering=8192
-                )
+                self._file_path_handle = open(self.file_path, "ab", buffering=8192)
+            self._stats.rotated(self._sink_name(filepath))
         except Exception as e:
+            self._stats.failed(self._sink_name(filepath))
             self._log_internal(f"Failed to rotate file: {e}", "ERROR", "red")
 
-    def flush(self):
-        """Flush all buffers to disk."""
-        with self._buffer_lock:
-            if self._file_buffer:
-                self._flush_file_buffer()
-            if self._json_buffer:
-                self._flush_json_buffer()
-            if self._jsonl_buffer:
-                self._flush_jsonl_buffer()
+        self._resync_file_size(filepath)
+
+    def _flush_buffers(self):
+        """Write every non-empty output buffer; also run by the flush timer."""
+        for buffer, write in self._buffers():
+            if buffer or buffer.has_spill:
+                self._flush_buffer(buffer, write)
+
+    def _buffers(self) -> Tuple[Tuple[RecordBuffer, Callable], ...]:
+        """Every output buffer with its write function."""
+        return (
+            (self._file_buffer, Tamga._write_file_records),
+            (self._json_buffer, Tamga._write_json_records),
+            (self._jsonl_buffer, Tamga._write_jsonl_records),
+            (self._sql_buffer, Tamga._write_sql_records),
+            (self._binary_buffer, Tamga._write_binary_records),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get runtime counters of this logger.
+
+        Returns:
+            Dict with uptime_seconds, records per level, records_total,
+            call_latency (sampled, one call in 16) and per output under sinks:
+            records, bytes, flushes, failures, rotations, dropped and spilled
+            records, buffered_records, buffered_bytes and flush_latency.
+            Latencies hold count, mean_us, p50_us, p99_us and max_us.
+            Dropped notifications and queued background records are included
+            when those features are active.
+        """
+        snapshot = self._stats.snapshot()
+        for buffer, _ in self._buffers():
+            sink = snapshot["sinks"].get(buffer.name)
+            if sink is not None:
+                sink["buffered_records"] = len(buffer)
+                sink["buffered_bytes"] = buffer.size
+        if self._notifier is not None:
+            snapshot["notifications_dropped"] = self._notifier.dropped
+        if self._writer is not None:
+            snapshot["writer_queue_size"] = self._writer.pending()
+        return snapshot
+
+    def _export_stats(self):
+        """Pass a stats snapshot to stats_callback; run by the stats timer."""
+        self.stats_callback(self.stats())
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flush all buffers to disk.
+
+        Pending suppressed-record counts are logged first. With the background
+        writer enabled, then waits until every record logged so far has been
+        handed to the outputs.
+
+        Args:
+            timeout: Maximum seconds to wait for the writer queue to drain
+
+        Returns:
+            True if everything was flushed, False if the timeout expired
+        """
+        if self._limiter is not None:
+            self._report_suppressed()
+
+        writer = self._writer
+        if writer is not None and not writer.drain(timeout):
+            return False
+
+        self._flush_buffers()
+
+        if self._mongo_writer is not None:
+            return self._mongo_writer.flush(timeout)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background writer, flush all buffers and release resources.
+
+        Called for every live logger at interpreter exit. Calling it again
+        is harmless.
+
+        Args:
+            timeout: Maximum seconds to wait for each background thread to finish
+        """
+        _instances.discard(self)
+
+        timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.stop(timeout)
+
+        exporter, self._stats_exporter = self._stats_exporter, None
+        if exporter is not None:
+            exporter.stop(timeout)
+
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.stop(timeout)
+
+        self.flush()
+
+        if self._mongo_writer is not None:
+            self._mongo_writer.stop(timeout)
+            self._mongo_writer = None
+
+        if self._notifier:
+            self._notifier.stop(timeout)
+            self._notifier = None
+
+        if self._rotation_executor:
+            self._rotation_executor.shutdown(wait=True)
+            self._rotation_executor = None
+
+        if self._file_path_handle and not self._file_path_handle.closed:
+            self._file_path_handle.close()
+
+        if self._json_file_handle is not None:
+            self._json_file_handle.close()
+            self._json_file_handle = None
+
+        if self._sql_conn is not None:
+            self._sql_conn.close()
+            self._sql_conn = None
+
+        if self._binary_handle is not None:
+            self._binary_handle.close()
+            self._binary_handle = None
+
+    async def aflush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flush all buffers without blocking the event loop.
+
+        Args:
+            timeout: Maximum seconds to wait for the writer queue to drain
+
+        Returns:
+            True if everything was flushed, False if the timeout expired
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.flush, timeout)
+
+    async def aclose(self, timeout: Optional[float] = None) -> None:
+        """
+        Close the logger without blocking the event loop.
+
+        Args:
+            timeout: Maximum seconds to wait for the writer thread to finish
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close, timeout)
+
+    async def __aenter__(self) -> "Tamga":
+        """Start the background writer for use inside an event loop."""
+        self._start_writer()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Drain the writer and release resources."""
+        await self.aclose()
 
     def __del__(self):
         """Cleanup when logger is destroyed."""
         try:
-            self.flush()
-            if self._notify_executor:
-                self._notify_executor.shutdown(wait=False)
-
-            if self._file_path_handle and not self._file_path_handle.closed:
-                self._file_path_handle.close()
+            self.close()
         except Exception:
             pass
 
-    def _format_kwargs(self, **kwargs) -> str:
+    def _format_kwargs(self, data: Dict[str, Any]) -> str:
         """
+        Render structured data for the text outputs (console, file, notifications).
+
         Args:
-            **kwargs: Key-value pairs to format
+            data: Key-value pairs to format
 
         Returns:
             Formatted string representation of key-value data
         """
-        if not kwargs:
+        if not data:
             return ""
 
-        pairs = [f"{k}={repr(v)}" for k, v in kwargs.items()]
+        pairs = [f"{k}={v!r}" for k, v in data.items()]
         return f" | {', '.join(pairs)}"
 
     def info(self, message: str, **kwargs) -> None:
         """Log info message with optional key-value data."""
-        full_message = message + self._format_kwargs(**kwargs)
-        self.log(full_message, "INFO", "sky")
+        if self._min_severity > _INFO:
+            return
+        self._log(message, "INFO", "sky", kwargs)
 
     def warning(self, message: str, **kwargs) -> None:
         """Log warning message with optional key-value data."""
-        full_message = message + self._format_kwargs(**kwargs)
-        self.log(full_message, "WARNING", "amber")
+        if self._min_severity > _WARNING:
+            return
+        self._log(message, "WARNING", "amber", kwargs)
 
     def error(self, message: str, **kwargs) -> None:
         """Log error message with optional key-value data."""
-        full_message = message + self._format_kwargs(**kwargs)
-        self.log(full_message, "ERROR", "rose")
+        if self._min_severity > _ERROR:
+            return
+        self._log(message, "ERROR", "rose", kwargs)
 
     def success(self, message: str, **kwargs) -> None:
         """Log success message with optional key-value data."""
-        full_message = message + self._format_kwargs(**kwargs)
-        self.log(full_message, "SUCCESS", "emerald")
+        if self._min_severity > _SUCCESS:
+            return
+        self._log(message, "SUCCESS", "emerald", kwargs)
 
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message with optional key-value data."""
-        full_message = message + self._format_kwargs(**kwargs)
-        self.log(full_message, "DEBUG", "indigo")
+        if self._min_severity > _DEBUG:
+            return
+        self._log(message, "DEBUG", "indigo", kwargs)
 
     def critical(self, message: str, **kwargs) -> None:
         """Log critical message with optional key-value data."""
-        full_message = message + self._format_kwargs(**kwargs)
-        self.log(full_message, "CRITICAL", "red")
+        if self._min_severity > _CRITICAL:
+            return
+        self._log(message, "CRITICAL", "red", kwargs)
 
     def database(self, message: str, **kwargs) -> None:
         """Log database message with optional key-value data."""
-        full_message = message + self._format_kwargs(**kwargs)
-        self.log(full_message, "DATABASE", "green")
+        if self._min_severity > _DATABASE:
+            return
+        self._log(message, "DATABASE", "green", kwargs)
 
     def notify(
         self, message: str, title: str = None, services: list = None, **kwargs
@@ -829,8 +2070,9 @@ class Tamga:
             services: Optional list of services (overrides defaults)
             **kwargs: Optional key-value data to include in message
         """
-        full_message = message + self._format_kwargs(**kwargs)
-        self.log(full_message, "NOTIFY", "purple")
+        if self._min_severity <= _NOTIFY:
+            self._log(message, "NOTIFY", "purple", kwargs)
+        full_message = message + self._format_kwargs(kwargs)
 
         if services:
             try:
@@ -840,11 +2082,12 @@ class Tamga:
                 for service in services:
                     temp_apprise.add(service)
 
+                clock = clock_snapshot()
                 final_title = title or self.notify_title.format(
                     appname="Tamga",
                     level="NOTIFY",
-                    date=current_date(),
-                    time=current_time(),
+                    date=clock.date,
+                    time=clock.time,
                 )
 
                 temp_apprise.notify(
@@ -853,19 +2096,86 @@ class Tamga:
             except Exception as e:
                 self._log_internal(f"Custom notification failed: {e}", "ERROR", "red")
         elif self.notify_services:
+            if self._apprise is None:
+                self._init_apprise()
             self._send_notification_async(full_message, "NOTIFY", title)
 
     def metric(self, message: str, **kwargs) -> None:
         """Log metric message with optional key-value data."""
-        full_message = message + self._format_kwargs(**kwargs)
-        self.log(full_message, "METRIC", "cyan")
+        if self._min_severity > _METRIC:
+            return
+        self._log(message, "METRIC", "cyan", kwargs)
 
     def trace(self, message: str, **kwargs) -> None:
         """Log trace message with optional key-value data."""
-        full_message = message + self._format_kwargs(**kwargs)
-        self.log(full_message, "TRACE", "gray")
+        if self._min_severity > _TRACE:
+            return
+        self._log(message, "TRACE", "gray", kwargs)
 
     def custom(self, message: str, level: str, color: str, **kwargs) -> None:
         """Log custom message with optional key-value data."""
-        full_message = message + self._format_kwargs(**kwargs)
-        self.log(full_message, level, color)
+        self.log(message, level, color, kwargs)
+
+    # Async variants: records go through the background writer thread, so the
+    # event loop only pays for building the record and a queue put. The first
+    # call starts that thread for good, so the sync helpers use it from then on
+
+    async def ainfo(self, message: str, **kwargs) -> None:
+        """Log info message without blocking the event loop."""
+        self._ensure_writer()
+        self.info(message, **kwargs)
+
+    async def awarning(self, message: str, **kwargs) -> None:
+        """Log warning message without blocking the event loop."""
+        self._ensure_writer()
+        self.warning(message, **kwargs)
+
+    async def aerror(self, message: str, **kwargs) -> None:
+        """Log error message without blocking the event loop."""
+        self._ensure_writer()
+        self.error(message, **kwargs)
+
+    async def asuccess(self, message: str, **kwargs) -> None:
+        """Log success message without blocking the event loop."""
+        self._ensure_writer()
+        self.success(message, **kwargs)
+
+    async def adebug(self, message: str, **kwargs) -> None:
+        """Log debug message without blocking the event loop."""
+        self._ensure_writer()
+        self.debug(message, **kwargs)
+
+    async def acritical(self, message: str, **kwargs) -> None:
+        """Log critical message without blocking the event loop."""
+        self._ensure_writer()
+        self.critical(message, **kwargs)
+
+    async def adatabase(self, message: str, **kwargs) -> None:
+        """Log database message without blocking the event loop."""
+        self._ensure_writer()
+        self.database(message, **kwargs)
+
+    async def ametric(self, message: str, **kwargs) -> None:
+        """Log metric message without blocking the event loop."""
+        self._ensure_writer()
+        self.metric(message, **kwargs)
+
+    async def atrace(self, message: str, **kwargs) -> None:
+        """Log trace message without blocking the event loop."""
+        self._ensure_writer()
+        self.trace(message, **kwargs)
+
+    async def acustom(self, message: str, level: str, color: str, **kwargs) -> None:
+        """Log custom message without blocking the event loop."""
+        self._ensure_writer()
+        self.log(message, level, color, kwargs)
+
+    async def anotify(
+        self, message: str, title: str = None, services: list = None, **kwargs
+    ) -> None:
+        """Send a notification, running any blocking delivery in an executor."""
+        self._ensure_writer()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, functools.partial(self.notify, message, title, services, **kwargs)
+        )
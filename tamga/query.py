@@ -0,0 +1,282 @@
+"""
+Streaming query engine over Tamga JSONL and binary logs, including backups
+"""
+
+import gzip
+import json
+import lzma
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .utils.binary import MAGIC, read_binary
+from .utils.rotation import list_backups
+
+TimeBound = Union[float, int, str, datetime, None]
+
+
+class LogFilter:
+    """
+    Record predicate on level, time range and data values.
+
+    Raw JSONL lines are checked for the expected ``"level":"..."`` and
+    ``"key":value`` fragments before they are parsed, so lines that cannot
+    match are skipped without paying for ``json.loads``.
+    """
+
+    __slots__ = [
+        "levels",
+        "since",
+        "until",
+        "where",
+        "_level_needles",
+        "_where_needles",
+    ]
+
+    def __init__(
+        self,
+        level: Union[str, Iterable[str], None] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        where: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Build the filter.
+
+        Args:
+            level: Level name or names to keep, None for all
+            since: Keep records at or after this time (unix seconds, datetime or ISO string)
+            until: Keep records before this time (unix seconds, datetime or ISO string)
+            where: Data key/value pairs that must all be equal
+        """
+        if isinstance(level, str):
+            level = [level]
+        self.levels = frozenset(level) if level is not None else None
+        self.since = to_timestamp(since)
+        self.until = to_timestamp(until)
+        self.where = dict(where or {})
+
+        self._level_needles = tuple(
+            _fragment("level", name) for name in self.levels or ()
+        )
+        # Floats and containers can be written in more than one way; parse those
+        self._where_needles = tuple(
+            _fragment(key, value)
+            for key, value in self.where.items()
+            if value is None or isinstance(value, (str, int))
+        )
+
+    def matches_line(self, line: bytes) -> bool:
+        """Cheap pre-check of a raw JSONL line; False means it cannot match."""
+        if self._level_needles and not any(
+            needle in line for needle in self._level_needles
+        ):
+            return False
+        return all(needle in line for needle in self._where_needles)
+
+    def matches(self, record: Dict[str, Any]) -> bool:
+        """Check a parsed record."""
+        if self.levels is not None and record.get("level") not in self.levels:
+            return False
+
+        timestamp = record.get("timestamp")
+        if self.since is not None and (timestamp is None or timestamp < self.since):
+            return False
+        if self.until is not None and (timestamp is None or timestamp >= self.until):
+            return False
+
+        if self.where:
+            data = record.get("data") or {}
+            for key, value in self.where.items():
+                if key not in data or data[key] != value:
+                    return False
+        return True
+
+
+def _fragment(key: str, value: Any) -> bytes:
+    """Encode key/value exactly as the JSONL output writes it."""
+    pair = json.dumps({key: value}, ensure_ascii=False, separators=(",", ":"))
+    return pair[1:-1].encode("utf-8")
+
+
+def to_timestamp(value: TimeBound) -> Optional[float]:
+    """Convert a time bound (unix seconds, datetime or ISO string) to unix seconds."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+
+def log_files(
+    paths: Union[str, Iterable[str]], include_backups: bool = True
+) -> List[str]:
+    """
+    Expand log paths into the files to read, oldest first.
+
+    Args:
+        paths: Log file paths such as "tamga.jsonl"
+        include_backups: Also read the rotated backups of each path
+
+    Returns:
+        Backups of each path in age order followed by the path itself
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+
+    files = []
+    for path in paths:
+        if include_backups:
+            files.extend(list_backups(path))
+        if os.path.exists(path):
+            files.append(path)
+    return files
+
+
+def _open(path: str):
+    """Open a log file, transparently decompressing rotated backups."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".xz"):
+        return lzma.open(path, "rb")
+    return open(path, "rb")
+
+
+def read_records(
+    path: str, log_filter: Optional[LogFilter] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the matching records of one JSONL or binary log file.
+
+    Args:
+        path: Log file, optionally gzip or lzma compressed
+        log_filter: Filter to apply, None to yield every record
+
+    Yields:
+        Parsed records, one line or frame in memory at a time
+    """
+    with _open(path) as f:
+        is_binary = f.read(len(MAGIC)) == MAGIC
+
+    if is_binary:
+        for record in read_binary(path):
+            if log_filter is None or log_filter.matches(record):
+                yield record
+        return
+
+    with _open(path) as f:
+        for line in f:
+            if log_filter is not None and not log_filter.matches_line(line):
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Partial last line of a file cut off by a crash
+                continue
+            if log_filter is None or log_filter.matches(record):
+                yield record
+
+
+def query_logs(
+    paths: Union[str, Iterable[str]],
+    level: Union[str, Iterable[str], None] = None,
+    since: TimeBound = None,
+    until: TimeBound = None,
+    where: Optional[Dict[str, Any]] = None,
+    include_backups: bool = True,
+    limit: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records matching the filters from log files and their backups.
+
+    Args:
+        paths: Log file paths such as "tamga.jsonl"
+        level: Level name or names to keep
+        since: Keep records at or after this time
+        until: Keep records before this time
+        where: Data key/value pairs that must all be equal
+        include_backups: Also read rotated, possibly compressed backups
+        limit: Stop after this many records
+
+    Yields:
+        Matching records, oldest file first
+    """
+    log_filter = LogFilter(level, since, until, where)
+    if limit is not None and limit <= 0:
+        return
+
+    count = 0
+    for path in log_files(paths, include_backups):
+        for record in read_records(path, log_filter):
+            yield record
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+
+def _count_file(
+    path: str, log_filter: LogFilter, interval: float
+) -> Dict[Tuple[float, str], int]:
+    """Count the matching records of one file per (interval start, level)."""
+    counts: Dict[Tuple[float, str], int] = {}
+    for record in read_records(path, log_filter):
+        timestamp = record.get("timestamp") or 0.0
+        key = (timestamp - timestamp % interval, record.get("level"))
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def count_by_interval(
+    paths: Union[str, Iterable[str]],
+    interval: float = 60.0,
+    level: Union[str, Iterable[str], None] = None,
+    since: TimeBound = None,
+    until: TimeBound = None,
+    where: Optional[Dict[str, Any]] = None,
+    include_backups: bool = True,
+    processes: Optional[int] = None,
+) -> Dict[Tuple[float, str], int]:
+    """
+    Count matching records per level per time interval.
+
+    Files are counted in parallel by a process pool, each worker streaming
+    one file, so memory only grows with the number of intervals.
+
+    Args:
+        paths: Log file paths such as "tamga.jsonl"
+        interval: Bucket length in seconds (default: 60, counts per minute)
+        level: Level name or names to keep
+        since: Keep records at or after this time
+        until: Keep records before this time
+        where: Data key/value pairs that must all be equal
+        include_backups: Also read rotated, possibly compressed backups
+        processes: Worker processes, None for one per CPU, 1 to stay in-process
+
+    Returns:
+        Counts keyed by (interval start as unix seconds, level), in time order
+    """
+    log_filter = LogFilter(level, since, until, where)
+    files = log_files(paths, include_backups)
+
+    if len(files) <= 1 or processes == 1:
+        results = [_count_file(path, log_filter, interval) for path in files]
+    else:
+        workers = min(len(files), processes or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(
+                pool.map(
+                    _count_file,
+                    files,
+                    [log_filter] * len(files),
+                    [interval] * len(files),
+                )
+            )
+
+    totals: Dict[Tuple[float, str], int] = {}
+    for counts in results:
+        for key, count in counts.items():
+            totals[key] = totals.get(key, 0) + count
+    return dict(sorted(totals.items(), key=lambda item: (item[0][0], str(item[0][1]))))
@@ -0,0 +1,337 @@
+"""
+Compact binary log format for Tamga logger
+
+A file starts with the 5 byte header ``TMGB`` + version, followed by frames of
+``tag (u8) | payload length (u32) | payload``, all little-endian:
+
+- STRING: UTF-8 text that gets the next string id (0, 1, 2, ...)
+- LEVEL: level code (u8) followed by the UTF-8 level name
+- RECORD: level code (u8), unix time in ns (i64), message string id (u32),
+  timezone string id (u32), data pair count (u16), then per pair the key
+  string id (u32) and a tagged value; short string values are stored in the
+  string table as well
+- RESET: forget every string and level defined so far
+
+Messages, data keys, timezones and level names are written once and then
+referenced by id. Date and time strings are not stored; readers derive them
+from the timestamp.
+"""
+
+import gzip
+import json
+import lzma
+import os
+import struct
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterator, List
+
+MAGIC = b"TMGB\x01"
+
+_STRING = 1
+_LEVEL = 2
+_RECORD = 3
+_RESET = 4
+
+_FRAME = struct.Struct("<BI")
+_RECORD_HEAD = struct.Struct("<BqIIH")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+# Value tags
+_NONE = 0
+_TRUE = 1
+_FALSE = 2
+_INT = 3
+_FLOAT = 4
+_STR = 5
+_JSON = 6
+_STR_REF = 7
+
+_INT_MIN = -(2**63)
+_INT_MAX = 2**63 - 1
+
+# String values up to this many characters are interned like messages and keys
+_MAX_INTERNED_VALUE = 32
+# Strings kept in the table before it is reset to bound writer memory
+_MAX_STRINGS = 65536
+_MAX_LEVELS = 256
+
+_DATE_FORMAT = "%d.%m.%y"
+_TIME_FORMAT = "%H:%M:%S"
+
+
+class BinaryEncoder:
+    """
+    Encodes log records into frames, tracking the string and level tables.
+
+    One encoder belongs to one open file: a fresh file starts with
+    ``header()``, an existing file being appended to starts with ``reset()``
+    so readers drop the tables of the previous writer.
+    """
+
+    __slots__ = ["_strings", "_levels"]
+
+    def __init__(self):
+        self._strings: Dict[str, int] = {}
+        self._levels: Dict[str, int] = {}
+
+    def header(self) -> bytes:
+        """File header for a new file."""
+        self._strings.clear()
+        self._levels.clear()
+        return MAGIC
+
+    def reset(self) -> bytes:
+        """RESET frame that clears the tables of readers and of this encoder."""
+        self._strings.clear()
+        self._levels.clear()
+        return _FRAME.pack(_RESET, 0)
+
+    def encode(self, records: List[Dict[str, Any]]) -> bytes:
+        """
+        Encode log records built by Tamga.
+
+        Args:
+            records: Log records with level, message, data, timezone and clock
+
+        Returns:
+            Frames defining any new strings and levels followed by the records
+        """
+        out = []
+        for log in records:
+            if len(self._strings) >= _MAX_STRINGS or len(self._levels) >= _MAX_LEVELS:
+                out.append(self.reset())
+
+            data = log["data"]
+            body = [
+                _RECORD_HEAD.pack(
+                    self._level(log["level"], out),
+                    log["clock"].unix_ns,
+                    self._string(log["message"], out),
+                    self._string(log["timezone"], out),
+                    len(data),
+                )
+            ]
+            for key, value in data.items():
+                body.append(_U32.pack(self._string(str(key), out)))
+                if type(value) is str and len(value) <= _MAX_INTERNED_VALUE:
+                    body.append(b"\x07" + _U32.pack(self._string(value, out)))
+                else:
+                    body.append(_encode_value(value))
+
+            payload = b"".join(body)
+            out.append(_FRAME.pack(_RECORD, len(payload)))
+            out.append(payload)
+
+        return b"".join(out)
+
+    def _string(self, text: str, out: List[bytes]) -> int:
+        """Get the id of a string, defining it first if needed."""
+        string_id = self._strings.get(text)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings[text] = string_id
+            encoded = text.encode("utf-8")
+            out.append(_FRAME.pack(_STRING, len(encoded)))
+            out.append(encoded)
+        return string_id
+
+    def _level(self, level: str, out: List[bytes]) -> int:
+        """Get the code of a level, defining it first if needed."""
+        code = self._levels.get(level)
+        if code is None:
+            code = len(self._levels)
+            self._levels[level] = code
+            encoded = level.encode("utf-8")
+            out.append(_FRAME.pack(_LEVEL, len(encoded) + 1))
+            out.append(bytes((code,)))
+            out.append(encoded)
+        return code
+
+
+def _encode_value(value: Any) -> bytes:
+    """Encode one data value with its type tag."""
+    if value is None:
+        return b"\x00"
+    if value is True:
+        return b"\x01"
+    if value is False:
+        return b"\x02"
+    if type(value) is int and _INT_MIN <= value <= _INT_MAX:
+        return b"\x03" + _I64.pack(value)
+    if type(value) is float:
+        return b"\x04" + _F64.pack(value)
+    if type(value) is str:
+        encoded = value.encode("utf-8")
+        return b"\x05" + _U32.pack(len(encoded)) + encoded
+
+    encoded = json.dumps(
+        value, ensure_ascii=False, separators=(",", ":"), default=str
+    ).encode("utf-8")
+    return b"\x06" + _U32.pack(len(encoded)) + encoded
+
+
+def _decode_value(payload: bytes, offset: int, strings: List[str]):
+    """Decode one tagged value, returning (value, next offset)."""
+    tag = payload[offset]
+    offset += 1
+    if tag == _NONE:
+        return None, offset
+    if tag == _TRUE:
+        return True, offset
+    if tag == _FALSE:
+        return False, offset
+    if tag == _INT:
+        return _I64.unpack_from(payload, offset)[0], offset + 8
+    if tag == _FLOAT:
+        return _F64.unpack_from(payload, offset)[0], offset + 8
+    if tag == _STR_REF:
+        return strings[_U32.unpack_from(payload, offset)[0]], offset + 4
+
+    (length,) = _U32.unpack_from(payload, offset)
+    offset += 4
+    text = payload[offset : offset + length].decode("utf-8")
+    if tag == _JSON:
+        return json.loads(text), offset + length
+    return text, offset + length
+
+
+def _open_log(path: str) -> BinaryIO:
+    """Open a binary log, transparently decompressing rotated backups."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".xz"):
+        return lzma.open(path, "rb")
+    return open(path, "rb")
+
+
+def read_binary(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the records of a binary log file.
+
+    Reading stops quietly at a truncated final frame, such as one cut off
+    by a crash. Gzip and lzma compressed backups are read transparently.
+
+    Args:
+        path: Path of a file written by the binary output
+
+    Yields:
+        Records with the same keys as JSONL output: level, message, data,
+        date, time, timezone and timestamp
+    """
+    strings: List[str] = []
+    levels: Dict[int, str] = {}
+    # (unix second, date, time) of the last record, as date strings repeat
+    second_cache = (None, "", "")
+
+    with _open_log(path) as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a Tamga binary log")
+
+        read = f.read
+        while True:
+            head = read(_FRAME.size)
+            if len(head) < _FRAME.size:
+                return
+            tag, length = _FRAME.unpack(head)
+            payload = read(length)
+            if len(payload) < length:
+                return
+
+            if tag == _STRING:
+                strings.append(payload.decode("utf-8"))
+            elif tag == _LEVEL:
+                levels[payload[0]] = payload[1:].decode("utf-8")
+            elif tag == _RESET:
+                strings = []
+                levels = {}
+            elif tag == _RECORD:
+                code, unix_ns, message_id, timezone_id, pair_count = (
+                    _RECORD_HEAD.unpack_from(payload)
+                )
+                offset = _RECORD_HEAD.size
+                data = {}
+                for _ in range(pair_count):
+                    (key_id,) = _U32.unpack_from(payload, offset)
+                    data[strings[key_id]], offset = _decode_value(
+                        payload, offset + 4, strings
+                    )
+
+                second = unix_ns // 1_000_000_000
+                if second_cache[0] != second:
+                    moment = datetime.fromtimestamp(second)
+                    second_cache = (
+                        second,
+                        moment.strftime(_DATE_FORMAT),
+                        moment.strftime(_TIME_FORMAT),
+                    )
+
+                yield {
+                    "level": levels[code],
+                    "message": strings[message_id],
+                    "data": data,
+                    "date": second_cache[1],
+                    "time": second_cache[2],
+                    "timezone": strings[timezone_id],
+                    "timestamp": unix_ns / 1_000_000_000,
+                }
+
+
+def binary_to_jsonl(path: str, output_path: str) -> int:
+    """
+    Convert a binary log file into JSON Lines.
+
+    Args:
+        path: Path of a file written by the binary output
+        output_path: Path of the JSONL file to write
+
+    Returns:
+        Number of records written
+    """
+    count = 0
+    with open(output_path, "w", encoding="utf-8") as out:
+        for record in read_binary(path):
+            out.write(
+                json.dumps(
+                    record, ensure_ascii=False, separators=(",", ":"), default=str
+                )
+            )
+            out.write("\n")
+            count += 1
+    return count
+
+
+def valid_length(path: str) -> int:
+    """
+    Find where the last complete frame of a binary log ends.
+
+    Args:
+        path: Path of an uncompressed binary log
+
+    Returns:
+        Byte length of the intact part, 0 if the header itself is missing
+
+    Raises:
+        ValueError: If the file holds something other than a binary log
+    """
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return 0
+
+    with open(path, "rb") as f:
+        head = f.read(len(MAGIC))
+        if head != MAGIC:
+            # A header cut off by a crash is rewritten; anything else is kept
+            if not MAGIC.startswith(head):
+                raise ValueError(f"{path} is not a Tamga binary log")
+            return 0
+        end = len(MAGIC)
+        while end + _FRAME.size <= size:
+            f.seek(end)
+            _, length = _FRAME.unpack(f.read(_FRAME.size))
+            if end + _FRAME.size + length > size:
+                break
+            end += _FRAME.size + length
+    return end
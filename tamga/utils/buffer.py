@@ -0,0 +1,194 @@
+"""
+Memory-bounded record buffers for Tamga logger
+"""
+
+import json
+import os
+import shutil
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .time import ClockSnapshot
+
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest", "spill")
+
+# Bytes charged per record for the dict, date/time strings and clock snapshot
+_RECORD_OVERHEAD = 600
+# Bytes charged per data value that is not a string
+_VALUE_SIZE = 48
+
+
+def record_size(log_data: Dict[str, Any]) -> int:
+    """Estimate the memory held by a buffered record without serializing it."""
+    size = _RECORD_OVERHEAD + len(log_data["message"])
+    for key, value in log_data["data"].items():
+        size += len(key) + (len(value) if isinstance(value, str) else _VALUE_SIZE)
+    return size
+
+
+class RecordBuffer:
+    """
+    Pending records of one output with their estimated size in bytes.
+
+    ``lock`` guards the record list and is only held to append or to swap
+    the list out; ``io_lock`` serializes writes to the output and is held
+    while the swapped-out batch is written. Appending threads therefore
+    never wait for disk, and batches still reach the output in order.
+
+    The buffer only counts; the logger decides what to do once ``full``
+    is set. With a spill path, records can be moved to a JSON Lines file
+    next to the output and replayed once the output accepts writes again.
+    A spill file left by a previous process is replayed as well.
+    """
+
+    __slots__ = [
+        "name",
+        "max_bytes",
+        "records",
+        "size",
+        "lock",
+        "io_lock",
+        "spill_path",
+        "has_spill",
+    ]
+
+    def __init__(
+        self, name: str, max_bytes: Optional[int], spill_path: Optional[str] = None
+    ):
+        """
+        Create an empty buffer.
+
+        Args:
+            name: Output name as used in stats()
+            max_bytes: Memory budget in bytes, None for no limit
+            spill_path: Spill file used by the "spill" overflow policy
+        """
+        self.name = name
+        self.max_bytes = max_bytes
+        self.records: List[Dict[str, Any]] = []
+        self.size = 0
+        self.lock = threading.Lock()
+        self.io_lock = threading.Lock()
+        self.spill_path = spill_path
+        self.has_spill = spill_path is not None and os.path.exists(spill_path)
+
+    def __len__(self) -> int:
+        """Number of buffered records."""
+        return len(self.records)
+
+    @property
+    def full(self) -> bool:
+        """Whether the buffer holds at least its budget."""
+        return self.max_bytes is not None and self.size >= self.max_bytes
+
+    def append(self, log_data: Dict[str, Any]) -> int:
+        """Add a record under ``lock`` and return the number of records."""
+        self.records.append(log_data)
+        self.size += record_size(log_data)
+        return len(self.records)
+
+    def take(self) -> Tuple[List[Dict[str, Any]], int]:
+        """Swap in an empty list under ``lock`` and return the records and their size."""
+        records, size = self.records, self.size
+        self.records = []
+        self.size = 0
+        return records, size
+
+    def restore(self, records: List[Dict[str, Any]], size: int) -> None:
+        """Put a batch that failed to write back in front of newer records."""
+        records.extend(self.records)
+        self.records = records
+        self.size += size
+
+    def drop_newest(self) -> int:
+        """Remove the newest records until the buffer is under budget."""
+        dropped = 0
+        while self.records and self.full:
+            self.size -= record_size(self.records.pop())
+            dropped += 1
+        return dropped
+
+    def drop_oldest(self) -> int:
+        """Remove the oldest records until the buffer is under budget."""
+        dropped = 0
+        size = self.size
+        while dropped < len(self.records) and size >= self.max_bytes:
+            size -= record_size(self.records[dropped])
+            dropped += 1
+        del self.records[:dropped]
+        self.size = size
+        return dropped
+
+    def spill(self) -> int:
+        """
+        Append every record to the spill file and clear the buffer.
+
+        Returns:
+            Number of records moved to disk
+
+        Raises:
+            OSError: If the spill file cannot be written; the buffer is unchanged
+        """
+        self._append_spill(self.records)
+        count = len(self.records)
+        self.take()
+        return count
+
+    def _append_spill(self, records: List[Dict[str, Any]]) -> None:
+        """Append records to the spill file as JSON Lines."""
+        payload = "".join(
+            json.dumps(log_data, ensure_ascii=False, default=str) + "\n"
+            for log_data in records
+        )
+        with open(self.spill_path, "a", encoding="utf-8") as f:
+            f.write(payload)
+        self.has_spill = True
+
+    def replay(
+        self, write: Callable[[List[Dict[str, Any]]], bool], batch_size: int
+    ) -> bool:
+        """
+        Write spilled records oldest first, at most a batch or a budget at a time.
+
+        Stops at the first failed write; that batch and the rest of the file
+        are spilled again, so order is kept. Call with ``io_lock`` held.
+
+        Args:
+            write: Writes a batch to the output and returns True on success
+            batch_size: Records per write
+
+        Returns:
+            True if every spilled record was written
+        """
+        replay_path = self.spill_path + ".replay"
+        os.replace(self.spill_path, replay_path)
+        self.has_spill = False
+
+        with open(replay_path, "r", encoding="utf-8") as f:
+            batch: List[Dict[str, Any]] = []
+            size = 0
+            written = True
+            for line in f:
+                try:
+                    log_data = json.loads(line)
+                except ValueError:
+                    # Partial last line of a spill cut off by a crash
+                    continue
+                log_data["clock"] = ClockSnapshot(*log_data["clock"])
+                batch.append(log_data)
+                size += record_size(log_data)
+                if len(batch) >= batch_size or (
+                    self.max_bytes is not None and size >= self.max_bytes
+                ):
+                    written = write(batch)
+                    if not written:
+                        break
+                    batch, size = [], 0
+            if written and batch:
+                written = write(batch)
+            if not written:
+                self._append_spill(batch)
+                with open(self.spill_path, "a", encoding="utf-8") as out:
+                    shutil.copyfileobj(f, out)
+        os.remove(replay_path)
+        return written
@@ -0,0 +1,129 @@
+"""
+JSON serialization shared by the structured outputs of Tamga logger
+
+Both encoders write datetimes, dataclasses and other unknown types as their
+str(), so the output does not depend on whether orjson is installed. Two
+differences are left: orjson writes NaN and infinity as null where the
+standard library writes the non-standard NaN/Infinity tokens, and it writes
+Enum members as their value rather than their str().
+"""
+
+import json
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JsonEncoder = Callable[[Any], str]
+
+_json_encode = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), default=str
+).encode
+
+
+def stdlib_encoder(value: Any) -> str:
+    """Compact JSON with the standard library; unknown types become str()."""
+    return _json_encode(value)
+
+
+_ORJSON_OPTIONS = 0
+if orjson is not None:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def orjson_encoder(value: Any) -> str:
+    """
+    Compact JSON with orjson; unknown types become str().
+
+    Values orjson rejects, such as integers beyond 64 bits, are encoded with
+    the standard library instead.
+    """
+    try:
+        return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
+    except TypeError:
+        return _json_encode(value)
+
+
+def default_encoder() -> JsonEncoder:
+    """orjson when it is installed, the standard library otherwise."""
+    return orjson_encoder if orjson is not None else stdlib_encoder
+
+
+class RecordEncoder:
+    """
+    Serializes each record at most once for every structured output.
+
+    The JSON text of ``data`` and of the whole entry are cached on the
+    record itself, so the JSON, JSONL and SQL outputs reuse the same
+    strings; the entry embeds the cached ``data`` text rather than encoding
+    it again. Level names and the date/time/timezone fragment of the
+    current second are cached as well, leaving the message and the data as
+    the only values encoded per record.
+    """
+
+    __slots__ = ["encode", "_levels", "_clock"]
+
+    def __init__(self, encode: Optional[JsonEncoder] = None):
+        """
+        Create the encoder.
+
+        Args:
+            encode: Function turning a value into JSON text, None for default_encoder()
+        """
+        self.encode = encode or default_encoder()
+        self._levels: Dict[str, str] = {}
+        self._clock = (None, "")
+
+    def data(self, log_data: Dict[str, Any]) -> str:
+        """JSON text of the record's data."""
+        text = log_data.get("data_json")
+        if text is None:
+            data = log_data["data"]
+            if not data:
+                text = "{}"
+            else:
+                try:
+                    text = self.encode(data)
+                except Exception:
+                    # One value that cannot be encoded must not fail the whole batch
+                    text = stdlib_encoder(
+                        {key: repr(value) for key, value in data.items()}
+                    )
+            log_data["data_json"] = text
+        return text
+
+    def entry(self, log_data: Dict[str, Any]) -> str:
+        """JSON text of the record as written to the JSON and JSONL outputs."""
+        text = log_data.get("entry_json")
+        if text is not None:
+            return text
+
+        encode = self.encode
+        level = log_data["level"]
+        level_text = self._levels.get(level)
+        if level_text is None:
+            level_text = self._levels[level] = encode(level)
+
+        clock = (log_data["date"], log_data["time"], log_data["timezone"])
+        cached = self._clock
+        if cached[0] != clock:
+            cached = (
+                clock,
+                f',"date":{encode(clock[0])},"time":{encode(clock[1])}'
+                f',"timezone":{encode(clock[2])}',
+            )
+            self._clock = cached
+
+        text = (
+            f'{{"level":{level_text},"message":{encode(log_data["message"])}'
+            f',"data":{self.data(log_data)}{cached[1]}'
+            f',"timestamp":{log_data["unix_timestamp"]!r}}}'
+        )
+        log_data["entry_json"] = text
+        return text
@@ -0,0 +1,188 @@
+"""
+MongoDB writer for Tamga logger running on a dedicated event loop thread
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from pymongo.errors import BulkWriteError
+except ImportError:
+
+    class BulkWriteError(Exception):
+        """Placeholder used when pymongo is not installed."""
+
+
+class MongoWriter:
+    """
+    Buffers documents and sends them with ``insert_many(ordered=False)``.
+
+    The collection lives on a private event loop in a background thread, so
+    callers never block on the network and never need a running loop. A batch
+    is sent when ``batch_size`` documents are waiting or ``flush_interval``
+    seconds have passed, and failed batches are retried with bounded
+    exponential backoff.
+
+    Any object with an awaitable ``insert_many(documents, ordered=False)``
+    works as the collection, which keeps the writer testable without a server.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        max_backoff: float = 5.0,
+        on_error: Optional[Callable[[Exception, int], None]] = None,
+    ):
+        """
+        Start the event loop thread and connect.
+
+        Args:
+            connect: Callable returning the collection, called on the loop thread
+            batch_size: Number of buffered documents that triggers a send
+            flush_interval: Maximum seconds a document waits in the buffer
+            max_retries: Retries of a failed batch before it is dropped
+            retry_backoff: Delay in seconds before the first retry, doubled each time
+            max_backoff: Upper bound in seconds for the retry delay
+            on_error: Called with (exception, document count) when documents are lost
+        """
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self._on_error = on_error
+
+        self._connect = connect
+        self._collection = None
+        self._buffer: List[Dict[str, Any]] = []
+        self._buffer_lock = threading.Lock()
+        self._closed = False
+
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._send_lock: Optional[asyncio.Lock] = None
+        self._thread = threading.Thread(
+            target=self._run, name="tamga-mongo", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+
+    def submit(self, document: Dict[str, Any]) -> None:
+        """Buffer a document; wakes the loop thread once a batch is full."""
+        if self._closed:
+            return
+
+        with self._buffer_lock:
+            self._buffer.append(document)
+            full = len(self._buffer) >= self.batch_size
+
+        if full:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send every buffered document and wait for the inserts to finish.
+
+        Args:
+            timeout: Maximum seconds to wait, None to wait indefinitely
+
+        Returns:
+            True if the buffer was sent, False on timeout
+        """
+        if not self._thread.is_alive():
+            return not self._buffer
+
+        future = asyncio.run_coroutine_threadsafe(self._send_buffered(), self._loop)
+        try:
+            future.result(timeout)
+            return True
+        except Exception:
+            return False
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Send the remaining documents and stop the loop thread."""
+        if self._closed:
+            return
+
+        self.flush(timeout)
+        self._closed = True
+        if self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        self._thread.join(timeout)
+
+    def _run(self):
+        """Loop thread entry point."""
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._main())
+        finally:
+            self._loop.close()
+
+    async def _main(self):
+        """Connect, then send batches on size or time thresholds until stopped."""
+        self._wakeup = asyncio.Event()
+        self._send_lock = asyncio.Lock()
+        self._ready.set()
+
+        try:
+            self._collection = self._connect()
+        except Exception as e:
+            self._closed = True
+            self._report(e, 0)
+            return
+
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self._send_buffered()
+
+        await self._send_buffered()
+
+    async def _send_buffered(self):
+        """Swap out the buffer and insert it in batch_size chunks."""
+        async with self._send_lock:
+            with self._buffer_lock:
+                documents, self._buffer = self._buffer, []
+
+            for start in range(0, len(documents), self.batch_size):
+                await self._insert(documents[start : start + self.batch_size])
+
+    async def _insert(self, batch: List[Dict[str, Any]]):
+        """Insert one batch, retrying transient failures with backoff."""
+        if self._collection is None:
+            return
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self._collection.insert_many(batch, ordered=False)
+                return
+            except BulkWriteError as e:
+                # Unordered inserts already stored every document that could be stored
+                failed = len((getattr(e, "details", None) or {}).get("writeErrors", ()))
+                self._report(e, failed)
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self._report(e, len(batch))
+                    return
+                await asyncio.sleep(
+                    min(self.max_backoff, self.retry_backoff * (2**attempt))
+                )
+
+    def _report(self, error: Exception, count: int):
+        """Pass a failure to the error callback without raising."""
+        if self._on_error is None:
+            return
+        try:
+            self._on_error(error, count)
+        except Exception:
+            pass
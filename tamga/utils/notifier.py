@@ -0,0 +1,157 @@
+"""
+Rate-limited notification dispatcher for Tamga logger
+"""
+
+import threading
+from collections import deque
+from time import monotonic
+from typing import Callable, Dict, Optional, Tuple
+
+DROP_POLICIES = ("drop_oldest", "drop_newest")
+
+# Distinct suppressed messages tracked per window before they are merged per level
+_MAX_FINGERPRINTS = 1000
+
+
+class NotificationDispatcher:
+    """
+    Sends notifications from one worker thread with rate limits and coalescing.
+
+    Within each window of ``window`` seconds a message is sent the first time
+    it is seen, and each level sends at most ``max_per_level`` notifications.
+    Everything else is counted per (level, message) fingerprint and sent as
+    one digest such as "ERROR x 482 in last 60s: Payment failed" when the
+    window closes. Pending sends wait in a queue of at most ``queue_size``
+    entries; when it is full the oldest or the newest entry is dropped.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, str, Optional[str]], None],
+        window: float = 60.0,
+        max_per_level: int = 5,
+        queue_size: int = 100,
+        drop_policy: str = "drop_oldest",
+    ):
+        """
+        Start the notification worker thread.
+
+        Args:
+            send: Callable receiving (message, level, title) that delivers one notification
+            window: Length in seconds of the rate limit and coalescing window
+            max_per_level: Notifications sent per level within one window
+            queue_size: Maximum number of notifications waiting to be sent
+            drop_policy: What to drop when the queue is full - drop_oldest/drop_newest
+        """
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"drop_policy must be one of {DROP_POLICIES}")
+
+        self.window = window
+        self.max_per_level = max_per_level
+        self.queue_size = max(1, queue_size)
+        self.drop_policy = drop_policy
+        self.dropped = 0
+
+        self._send = send
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+
+        self._window_end = monotonic() + window
+        self._level_counts: Dict[str, int] = {}
+        self._sent = set()
+        self._suppressed: Dict[Tuple[str, Optional[str]], int] = {}
+
+        self._thread = threading.Thread(
+            target=self._run, name="tamga-notify", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, message: str, level: str, title: Optional[str] = None) -> bool:
+        """
+        Queue a notification unless it is rate limited or a repeat.
+
+        Returns:
+            True if the notification was queued, False if it was coalesced
+        """
+        key = (level, message)
+        with self._cond:
+            if self._closed:
+                return False
+
+            sent_for_level = self._level_counts.get(level, 0)
+            if key in self._sent or sent_for_level >= self.max_per_level:
+                self._suppress(key)
+                return False
+
+            self._sent.add(key)
+            self._level_counts[level] = sent_for_level + 1
+            self._enqueue((message, level, title))
+            return True
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Queue the digests of the current window and stop the worker.
+
+        Args:
+            timeout: Seconds to wait for pending sends, None to wait for all of them
+        """
+        with self._cond:
+            if not self._closed:
+                self._closed = True
+                self._roll_window()
+                self._cond.notify()
+
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _suppress(self, key: Tuple[str, Optional[str]]):
+        """Count a coalesced notification; merge per level past the fingerprint cap."""
+        if key not in self._suppressed and len(self._suppressed) >= _MAX_FINGERPRINTS:
+            key = (key[0], None)
+        self._suppressed[key] = self._suppressed.get(key, 0) + 1
+
+    def _enqueue(self, item: Tuple[str, str, Optional[str]]):
+        """Append to the bounded queue, applying the drop policy when full."""
+        if len(self._queue) >= self.queue_size:
+            self.dropped += 1
+            if self.drop_policy == "drop_newest":
+                return
+            self._queue.popleft()
+        self._queue.append(item)
+        self._cond.notify()
+
+    def _roll_window(self):
+        """Queue one digest per coalesced fingerprint and start a new window."""
+        for (level, message), count in self._suppressed.items():
+            if message is None:
+                message = "other notifications"
+            elif (level, message) in self._sent:
+                count += 1
+            self._enqueue(
+                (f"{level} x {count} in last {self.window:g}s: {message}", level, None)
+            )
+
+        self._suppressed.clear()
+        self._sent.clear()
+        self._level_counts.clear()
+        self._window_end = monotonic() + self.window
+
+    def _run(self):
+        """Worker loop: send queued notifications and close windows on time."""
+        while True:
+            with self._cond:
+                while True:
+                    if not self._closed and monotonic() >= self._window_end:
+                        self._roll_window()
+                    if self._queue:
+                        item = self._queue.popleft()
+                        break
+                    if self._closed:
+                        return
+                    self._cond.wait(max(0.0, self._window_end - monotonic()))
+
+            try:
+                self._send(*item)
+            except Exception:
+                pass
@@ -0,0 +1,128 @@
+"""
+Writer process shared by the worker processes of a prefork server
+"""
+
+import multiprocessing
+import queue
+import signal
+from typing import Any, Dict, Optional
+
+_STOP = None
+
+
+class WriterProcess:
+    """
+    Owns every output in one process and writes records sent by workers.
+
+    Worker processes create ``Tamga(writer_queue=writer.queue)`` and only
+    put records on the shared queue. The writer process batches whatever is
+    waiting across all workers, writes the batch through its own ``Tamga``
+    built from ``config``, and is the only process that rotates files, so
+    appends from different workers never interleave or get lost at rotation.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        batch_size: int = 1000,
+        flush_interval: float = 1.0,
+        context: Optional[str] = None,
+    ):
+        """
+        Start the writer process.
+
+        Args:
+            config: Tamga keyword arguments for the outputs of the writer process
+            batch_size: Maximum number of records written at once
+            flush_interval: Seconds without records after which buffers are flushed
+            context: multiprocessing start method, None for the platform default
+        """
+        if "writer_queue" in config:
+            raise ValueError("The writer process config cannot set writer_queue")
+
+        config = dict(config)
+        config.setdefault("console_output", False)
+
+        ctx = multiprocessing.get_context(context)
+        self.queue = ctx.Queue()
+        self._process = ctx.Process(
+            target=_run_writer,
+            args=(self.queue, config, max(1, batch_size), flush_interval),
+            name="tamga-writer",
+            daemon=True,
+        )
+        self._process.start()
+
+    @property
+    def pid(self) -> Optional[int]:
+        """Process id of the writer process."""
+        return self._process.pid
+
+    def is_alive(self) -> bool:
+        """Check whether the writer process is still running."""
+        return self._process.is_alive()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write the records queued so far and stop the writer process.
+
+        Args:
+            timeout: Maximum seconds to wait for the process to finish
+
+        Returns:
+            True if the process stopped, False on timeout
+        """
+        if self._process.is_alive():
+            self.queue.put(_STOP)
+        self._process.join(timeout)
+        return not self._process.is_alive()
+
+
+def _run_writer(
+    records: "multiprocessing.Queue",
+    config: Dict[str, Any],
+    batch_size: int,
+    flush_interval: float,
+):
+    """Writer process entry point: batch queued records into one Tamga."""
+    from ..main import Tamga
+
+    # Shutdown is driven by stop() so Ctrl+C on the server drains the queue
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    logger = Tamga(**config)
+    get = records.get
+    get_nowait = records.get_nowait
+
+    try:
+        while True:
+            try:
+                item = get(timeout=flush_interval)
+            except queue.Empty:
+                logger.flush()
+                continue
+
+            batch = []
+            stopping = False
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    break
+                try:
+                    item = get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    logger._write_batch(batch)
+                except Exception:
+                    pass
+
+            if stopping:
+                return
+    finally:
+        logger.close()
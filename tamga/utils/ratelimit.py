@@ -0,0 +1,151 @@
+"""
+Sampling and token-bucket rate limiting for Tamga logger
+"""
+
+import threading
+from time import monotonic
+from typing import Dict, Hashable, Optional
+
+# Token buckets tracked before idle ones are discarded
+_MAX_BUCKETS = 10000
+
+
+class LogLimiter:
+    """
+    Decides whether a log call may build a record.
+
+    Sampling keeps exactly one record in every N per level, counted rather
+    than drawn at random so the suppressed totals stay exact. Rate limiting
+    gives every key (a message template or an explicit ``key=`` value) a token
+    bucket refilled at ``rate`` tokens per second holding up to ``burst``
+    tokens. Rejected calls are counted per level; ``report_pending`` turns True
+    once ``report_interval`` seconds have passed with suppressed records, and
+    ``take_suppressed()`` hands the counts over and starts a new interval.
+    """
+
+    __slots__ = [
+        "sample_rates",
+        "rate",
+        "burst",
+        "report_interval",
+        "report_pending",
+        "_sample_counts",
+        "_buckets",
+        "_suppressed",
+        "_next_report",
+        "_lock",
+    ]
+
+    def __init__(
+        self,
+        sample_rates: Optional[Dict[str, int]] = None,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        report_interval: float = 60.0,
+    ):
+        """
+        Set up sampling and rate limits.
+
+        Args:
+            sample_rates: Keep one record in N per level, e.g. {"INFO": 100}
+            rate: Records per second allowed per key, None for no limit
+            burst: Records a key may log at once, defaults to rate
+            report_interval: Seconds between suppressed count reports
+        """
+        self.sample_rates = {
+            level: int(every) for level, every in (sample_rates or {}).items()
+        }
+        if any(every < 1 for every in self.sample_rates.values()):
+            raise ValueError("sample_rates values must be at least 1")
+        if rate is not None and rate <= 0:
+            raise ValueError("rate_limit must be positive")
+
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate or 1.0)
+        self.report_interval = report_interval
+        self.report_pending = False
+
+        self._sample_counts: Dict[str, int] = {}
+        self._buckets: Dict[Hashable, list] = {}
+        self._suppressed: Dict[str, int] = {}
+        self._next_report = monotonic() + report_interval
+        self._lock = threading.Lock()
+
+    def allow(self, level: str, key: Hashable) -> bool:
+        """
+        Check one log call against the sampling and rate limits.
+
+        Args:
+            level: Log level of the call
+            key: Rate limit key, usually the message template; unhashable keys
+                are compared by repr()
+
+        Returns:
+            True if the record should be logged, False if it is suppressed
+        """
+        with self._lock:
+            now = monotonic()
+            if now >= self._next_report and self._suppressed:
+                self.report_pending = True
+
+            every = self.sample_rates.get(level)
+            if every is not None and every > 1:
+                seen = self._sample_counts.get(level, 0)
+                self._sample_counts[level] = seen + 1
+                if seen % every:
+                    self._suppress(level)
+                    return False
+
+            if self.rate is None:
+                return True
+
+            try:
+                bucket = self._buckets.get(key)
+            except TypeError:
+                # Unhashable key= values such as dicts are limited by their repr()
+                key = repr(key)
+                bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= _MAX_BUCKETS:
+                    self._discard_idle(now)
+                self._buckets[key] = [self.burst - 1.0, now]
+                return True
+
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens < 1.0:
+                bucket[0] = tokens
+                self._suppress(level)
+                return False
+
+            bucket[0] = tokens - 1.0
+            return True
+
+    def take_suppressed(self) -> Dict[str, int]:
+        """
+        Hand over the suppressed counts and start a new report interval.
+
+        Returns:
+            Number of suppressed records per level since the last report
+        """
+        with self._lock:
+            suppressed, self._suppressed = self._suppressed, {}
+            self.report_pending = False
+            self._next_report = monotonic() + self.report_interval
+            return suppressed
+
+    def _suppress(self, level: str):
+        """Count a rejected call."""
+        self._suppressed[level] = self._suppressed.get(level, 0) + 1
+
+    def _discard_idle(self, now: float):
+        """Drop buckets that have refilled completely, or all of them if none have."""
+        idle = [
+            key
+            for key, (tokens, last) in self._buckets.items()
+            if tokens + (now - last) * self.rate >= self.burst
+        ]
+        if not idle:
+            self._buckets.clear()
+        for key in idle:
+            del self._buckets[key]
@@ -0,0 +1,200 @@
+"""
+Backup naming, retention and compression helpers for Tamga file rotation
+"""
+
+import gzip
+import lzma
+import os
+import re
+import shutil
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "lzma": ".xz"}
+
+ROTATE_WHEN = ("H", "D", "midnight")
+
+_BACKUP_SUFFIX = ".bak"
+
+
+def backup_path(filepath: str, label: Optional[str] = None) -> str:
+    """
+    Get an unused backup path for a rotated file.
+
+    Args:
+        filepath: Path of the file being rotated
+        label: Backup label, defaults to the current YYYYmmdd_HHMMSS timestamp
+
+    Returns:
+        Path such as "tamga.log.20250628_143022.bak", numbered
+        ("tamga.log.20250628_143022.1.bak") when that label is already taken.
+        Numbers continue after the highest one in use, so they follow age even
+        after retention deleted older backups of the label.
+    """
+    label = label or datetime.now().strftime("%Y%m%d_%H%M%S")
+    highest = _highest_backup_number(filepath, label)
+    if highest is None:
+        return f"{filepath}.{label}{_BACKUP_SUFFIX}"
+    return f"{filepath}.{label}.{highest + 1}{_BACKUP_SUFFIX}"
+
+
+def rollover_period(when: str, unix_ns: int) -> Tuple[int, str]:
+    """
+    Find the calendar period containing a moment for time-based rotation.
+
+    Periods start on the local hour ("H") or at local midnight ("D" and
+    "midnight" are the same), so files cover whole hours or days.
+
+    Args:
+        when: Rotation interval, one of ROTATE_WHEN
+        unix_ns: Moment inside the period, in unix nanoseconds
+
+    Returns:
+        Tuple of (end of the period in unix nanoseconds, backup label of the
+        period such as "20250628_14" for hours or "20250628" for days)
+    """
+    moment = datetime.fromtimestamp(unix_ns / 1_000_000_000)
+    if when == "H":
+        start = moment.replace(minute=0, second=0, microsecond=0)
+        end = start + timedelta(hours=1)
+        label = start.strftime("%Y%m%d_%H")
+    else:
+        start = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+        end = start + timedelta(days=1)
+        label = start.strftime("%Y%m%d")
+    return int(end.timestamp() * 1_000_000_000), label
+
+
+def _highest_backup_number(filepath: str, label: str) -> Optional[int]:
+    """Highest number among the backups of a label, 0 for the unnumbered one, None if none."""
+    directory = os.path.dirname(filepath) or "."
+    pattern = re.compile(
+        re.escape(f"{os.path.basename(filepath)}.{label}")
+        + r"(?:\.(\d+))?"
+        + re.escape(_BACKUP_SUFFIX)
+        + r"(?:\.gz|\.xz)?$"
+    )
+
+    highest = None
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return None
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            number = int(match.group(1) or 0)
+            if highest is None or number > highest:
+                highest = number
+    return highest
+
+
+def list_backups(filepath: str) -> List[str]:
+    """
+    List existing backups of a file, oldest first.
+
+    Args:
+        filepath: Path of the rotated file
+
+    Returns:
+        Backup paths including compressed ones, ordered by modification time
+    """
+    directory = os.path.dirname(filepath) or "."
+    pattern = re.compile(
+        re.escape(os.path.basename(filepath))
+        + r"\.[\d_]+(\.\d+)?"
+        + re.escape(_BACKUP_SUFFIX)
+        + r"(\.gz|\.xz)?$"
+    )
+
+    backups = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if pattern.match(entry.name):
+                    backups.append((entry.stat().st_mtime_ns, entry.path))
+    except OSError:
+        return []
+
+    backups.sort()
+    return [path for _, path in backups]
+
+
+def prune_backups(
+    filepath: str,
+    max_backups: Optional[int] = None,
+    max_total_bytes: Optional[int] = None,
+) -> List[str]:
+    """
+    Delete the oldest backups beyond the retention limits.
+
+    Args:
+        filepath: Path of the rotated file
+        max_backups: Maximum number of backups to keep
+        max_total_bytes: Maximum combined size of the kept backups
+
+    Returns:
+        Paths of the deleted backups
+    """
+    if max_backups is None and max_total_bytes is None:
+        return []
+
+    backups = list_backups(filepath)
+    removed = []
+
+    if max_backups is not None:
+        while len(backups) > max_backups:
+            removed.append(backups.pop(0))
+
+    if max_total_bytes is not None:
+        sizes = {path: _size_or_zero(path) for path in backups}
+        total = sum(sizes.values())
+        while backups and total > max_total_bytes:
+            oldest = backups.pop(0)
+            total -= sizes[oldest]
+            removed.append(oldest)
+
+    for path in removed:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return removed
+
+
+def _size_or_zero(path: str) -> int:
+    """Get file size, 0 if it vanished."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def compress_file(path: str, method: str) -> str:
+    """
+    Compress a rotated file next to itself and remove the original.
+
+    The archive is written under a temporary name and renamed when complete,
+    so readers never see a partial archive. The original modification time is
+    kept so retention still orders backups by age.
+
+    Args:
+        path: File to compress
+        method: Compression method, "gzip" or "lzma"
+
+    Returns:
+        Path of the compressed file
+    """
+    suffix = COMPRESSION_SUFFIXES[method]
+    opener = gzip.open if method == "gzip" else lzma.open
+    target = path + suffix
+    temp_target = target + ".tmp"
+
+    with open(path, "rb") as source, opener(temp_target, "wb") as archive:
+        shutil.copyfileobj(source, archive, 1024 * 1024)
+
+    stat = os.stat(path)
+    os.utime(temp_target, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(temp_target, target)
+    os.remove(path)
+    return target
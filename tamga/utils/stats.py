@@ -0,0 +1,159 @@
+"""
+Runtime counters and latency histograms for Tamga logger
+"""
+
+import threading
+from time import monotonic, perf_counter_ns
+from typing import Any, Dict
+
+# Per-call latency is timed for one call in this many (must be a power of two)
+CALL_SAMPLE_EVERY = 16
+
+
+class LatencyHistogram:
+    """
+    Latency histogram with power-of-two nanosecond buckets.
+
+    Recording is one ``bit_length()`` and one list increment. Percentiles are
+    reported as the upper bound of their bucket, so they are exact to within
+    a factor of two, which is enough to see a sink slowing down.
+    """
+
+    __slots__ = ["buckets", "count", "total_ns", "max_ns"]
+
+    def __init__(self):
+        self.buckets = [0] * 64
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns: int) -> None:
+        """Add one duration in nanoseconds."""
+        self.buckets[min(63, ns.bit_length())] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound in microseconds of the bucket holding the given fraction."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank:
+                return min(1 << index, self.max_ns) / 1000
+        return self.max_ns / 1000
+
+    def snapshot(self) -> Dict[str, float]:
+        """Summary with count, mean, p50, p99 and max in microseconds."""
+        return {
+            "count": self.count,
+            "mean_us": self.total_ns / self.count / 1000 if self.count else 0.0,
+            "p50_us": self.percentile(0.50),
+            "p99_us": self.percentile(0.99),
+            "max_us": self.max_ns / 1000,
+        }
+
+
+class SinkStats:
+    """Counters of one output."""
+
+    __slots__ = [
+        "records",
+        "bytes",
+        "failures",
+        "rotations",
+        "dropped",
+        "spilled",
+        "flush_latency",
+    ]
+
+    def __init__(self):
+        self.records = 0
+        self.bytes = 0
+        self.failures = 0
+        self.rotations = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.flush_latency = LatencyHistogram()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters and flush latency summary."""
+        return {
+            "records": self.records,
+            "bytes": self.bytes,
+            "flushes": self.flush_latency.count,
+            "failures": self.failures,
+            "rotations": self.rotations,
+            "dropped": self.dropped,
+            "spilled": self.spilled,
+            "flush_latency": self.flush_latency.snapshot(),
+        }
+
+
+class LoggerStats:
+    """
+    Counters kept by a Tamga instance: records per level, sampled per-call
+    latency, and per-output records, bytes, failures, rotations and flush
+    latency. Every update takes one uncontended lock.
+    """
+
+    __slots__ = ["lock", "levels", "calls", "call_latency", "sinks", "started"]
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.levels: Dict[str, int] = {}
+        self.calls = 0
+        self.call_latency = LatencyHistogram()
+        self.sinks: Dict[str, SinkStats] = {}
+        self.started = monotonic()
+
+    def _sink(self, sink: str) -> SinkStats:
+        """Get the counters of an output, creating them on first use."""
+        stats = self.sinks.get(sink)
+        if stats is None:
+            stats = self.sinks[sink] = SinkStats()
+        return stats
+
+    def flushed(self, sink: str, records: int, size: int, began_ns: int) -> None:
+        """Count a successful flush that started at began_ns (perf_counter_ns)."""
+        elapsed = perf_counter_ns() - began_ns
+        with self.lock:
+            stats = self._sink(sink)
+            stats.records += records
+            stats.bytes += size
+            stats.flush_latency.record(elapsed)
+
+    def failed(self, sink: str, count: int = 1) -> None:
+        """Count failed writes of an output."""
+        with self.lock:
+            self._sink(sink).failures += count
+
+    def rotated(self, sink: str) -> None:
+        """Count a rotation of an output file."""
+        with self.lock:
+            self._sink(sink).rotations += 1
+
+    def dropped(self, sink: str, count: int) -> None:
+        """Count records an output buffer dropped over its memory budget."""
+        with self.lock:
+            self._sink(sink).dropped += count
+
+    def spilled(self, sink: str, count: int) -> None:
+        """Count records an output buffer moved to its spill file."""
+        with self.lock:
+            self._sink(sink).spilled += count
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy of every counter as plain dicts."""
+        with self.lock:
+            return {
+                "uptime_seconds": monotonic() - self.started,
+                "records": dict(self.levels),
+                "records_total": self.calls,
+                "call_latency": self.call_latency.snapshot(),
+                "sinks": {sink: stats.snapshot() for sink, stats in self.sinks.items()},
+            }
@@ -3,20 +3,64 @@ Time utilities for Tamga logger
 """
 
 from datetime import datetime
-from time import tzname
+from time import time_ns, tzname
+from typing import NamedTuple
 
 _DATE_FORMAT = "%d.%m.%y"
 _TIME_FORMAT = "%H:%M:%S"
 
+# (unix second, date string, time string) of the last formatted second
+_second_cache = (-1, "", "")
+
+
+class ClockSnapshot(NamedTuple):
+    """
+    Single wall-clock reading shared by every output of one log record.
+    """
+
+    unix_ns: int
+    date: str
+    time: str
+    timezone: str
+
+    @property
+    def timestamp(self) -> float:
+        """Unix timestamp in seconds."""
+        return self.unix_ns / 1_000_000_000
+
+
+def clock_snapshot() -> ClockSnapshot:
+    """
+    Read the clock once and return matching date, time and timestamp values.
+
+    Date and time strings are formatted at most once per wall-clock second
+    and reused for every snapshot taken within that second.
+    """
+    global _second_cache
+
+    unix_ns = time_ns()
+    second = unix_ns // 1_000_000_000
+    cached = _second_cache
+    if cached[0] != second:
+        moment = datetime.fromtimestamp(second)
+        cached = (
+            second,
+            moment.strftime(_DATE_FORMAT),
+            moment.strftime(_TIME_FORMAT),
+        )
+        _second_cache = cached
+
+    return ClockSnapshot(unix_ns, cached[1], cached[2], tzname[0])
+
 
 def current_date() -> str:
     """Get current date in DD.MM.YY format."""
-    return datetime.now().strftime(_DATE_FORMAT)
+    return clock_snapshot().date
 
 
 def current_time() -> str:
     """Get current time in HH:MM:SS format."""
-    return datetime.now().strftime(_TIME_FORMAT)
+    return clock_snapshot().time
 
 
 def current_timezone() -> str:
@@ -26,7 +70,7 @@ def current_timezone() -> str:
 
 def current_timestamp() -> float:
     """Get current Unix timestamp."""
-    return datetime.now().timestamp()
+    return time_ns() / 1_000_000_000
 
 
 def format_timestamp(include_timezone: bool = True) -> str:
@@ -39,7 +83,8 @@ def format_timestamp(include_timezone: bool = True) -> str:
     Returns:
         Formatted timestamp string
     """
-    parts = [current_date(), current_time()]
+    clock = clock_snapshot()
+    parts = [clock.date, clock.time]
     if include_timezone:
-        parts.append(current_timezone())
+        parts.append(clock.timezone)
     return " | ".join(parts)
@@ -0,0 +1,55 @@
+"""
+Periodic timer thread for Tamga logger
+"""
+
+import threading
+import weakref
+from typing import Callable, Optional
+
+
+class PeriodicTimer:
+    """
+    Calls a method every ``interval`` seconds from a daemon thread.
+
+    Runs both the flush_interval flushes and the stats_callback exports.
+    The thread only holds a weak reference to the method's object, so a
+    logger that is no longer used can still be garbage collected; the
+    thread exits on the next tick after that.
+    """
+
+    __slots__ = ["interval", "_method", "_stopped", "_thread"]
+
+    def __init__(
+        self, method: Callable[[], None], interval: float, name: str = "tamga-timer"
+    ):
+        """
+        Start the timer thread.
+
+        Args:
+            method: Bound method to call, held weakly
+            interval: Seconds between calls
+            name: Name of the timer thread
+        """
+        self.interval = interval
+        self._method = weakref.WeakMethod(method)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the timer thread."""
+        self._stopped.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _run(self):
+        """Timer loop."""
+        while not self._stopped.wait(self.interval):
+            method = self._method()
+            if method is None:
+                return
+            try:
+                method()
+            except Exception:
+                pass
+            del method
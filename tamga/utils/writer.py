@@ -0,0 +1,121 @@
+"""
+Background writer thread for Tamga logger
+"""
+
+import queue
+import threading
+from typing import Any, Callable, List, Optional
+
+_STOP = object()
+
+
+class BackgroundWriter:
+    """
+    Drains queued log records into a handler on a dedicated thread.
+
+    Callers only pay for a queue put; the writer thread collects whatever is
+    waiting (up to ``batch_size`` records) and hands it to the handler in one
+    call, so sinks can amortise their I/O across the batch.
+    """
+
+    __slots__ = ["batch_size", "_handler", "_queue", "_thread", "_closed"]
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], None],
+        batch_size: int = 1000,
+        name: str = "tamga-writer",
+    ):
+        """
+        Start the writer thread.
+
+        Args:
+            handler: Callable receiving a list of records to write
+            batch_size: Maximum number of records passed to handler at once
+            name: Name of the writer thread
+        """
+        self.batch_size = max(1, batch_size)
+        self._handler = handler
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, record: Any) -> None:
+        """Queue a record for the writer thread."""
+        self._queue.put(record)
+
+    def pending(self) -> int:
+        """Approximate number of records waiting in the queue."""
+        return self._queue.qsize()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every record submitted so far has been handled.
+
+        Args:
+            timeout: Maximum seconds to wait, None to wait indefinitely
+
+        Returns:
+            True if the queue was drained, False on timeout
+        """
+        if not self._thread.is_alive():
+            return self._queue.empty()
+
+        marker = threading.Event()
+        self._queue.put(marker)
+        return marker.wait(timeout)
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Handle the remaining records and stop the writer thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread to finish
+
+        Returns:
+            True if the thread stopped, False on timeout
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self):
+        """Writer thread loop: collect a batch, handle it, release waiters."""
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+
+        while True:
+            item = get()
+            batch = []
+            markers = []
+            stopping = False
+
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    break
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                try:
+                    item = get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    self._handler(batch)
+                except Exception:
+                    pass
+
+            for marker in markers:
+                marker.set()
+
+            if stopping:
+                return
@@ -1,17 +1,57 @@
+import asyncio
+import gzip
 import json
+import multiprocessing
 import os
 import sqlite3
+import subprocess
 import sys
 import tempfile
+import threading
 import unittest
 from contextlib import redirect_stdout
+from dataclasses import dataclass
+from datetime import datetime
 from io import StringIO
+from time import monotonic, sleep
+from time import time as time_now
 from unittest.mock import patch
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from tamga import Tamga
+from tamga import Tamga, binary_to_jsonl, read_binary
+from tamga import main as tamga_core
+from tamga.__main__ import main as tamga_main
+from tamga.query import count_by_interval, query_logs
+from tamga.utils import encoding
+from tamga.utils.encoding import orjson_encoder, stdlib_encoder
+from tamga.utils.mongo import MongoWriter
+from tamga.utils.notifier import NotificationDispatcher
+from tamga.utils.rotation import backup_path
+from tamga.utils.time import clock_snapshot
+
+
+class FakeMongoCollection:
+    """In-process stand-in for an async MongoDB collection."""
+
+    def __init__(self, failures=0):
+        self.batches = []
+        self.failures = failures
+
+    async def insert_many(self, documents, ordered=True):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("temporary network error")
+        self.batches.append((list(documents), ordered))
+
+
+def log_from_worker(writer_queue, worker, count):
+    """Worker process body for the writer process test."""
+    logger = Tamga(console_output=False, writer_queue=writer_queue)
+    for i in range(count):
+        logger.info(f"worker {worker} line {i}")
+    logger.close()
 
 
 class TestTamgaCore(unittest.TestCase):
@@ -110,6 +150,29 @@ class TestTamgaCore(unittest.TestCase):
             self.assertTrue(logger.colored_output)
             self.assertIn("\x1b[", output.getvalue())
 
+    def test_console_line_format(self):
+        """Test console lines rendered from cached prefixes, directly and batched."""
+        for background_writer in (False, True):
+            with self.subTest(background_writer=background_writer):
+                output = StringIO()
+                logger = Tamga(
+                    console_output=True,
+                    colored_output=False,
+                    show_date=False,
+                    show_time=False,
+                    background_writer=background_writer,
+                )
+
+                with redirect_stdout(output):
+                    logger.info("First line", user_id=1)
+                    logger.error("Second line")
+                    logger.close()
+
+                self.assertEqual(
+                    output.getvalue(),
+                    "INFO      First line | user_id=1\nERROR     Second line\n",
+                )
+
     def test_file_logging(self):
         """Test file logging with buffering."""
         logger = Tamga(
@@ -157,6 +220,46 @@ class TestTamgaCore(unittest.TestCase):
             self.assertEqual(data[0]["message"], "JSON error message")
             self.assertIn("timestamp", data[0])
 
+    def test_json_keeps_handle_and_appends(self):
+        """Test JSON output reuses one handle across flushes."""
+        logger = Tamga(
+            console_output=False,
+            json_output=True,
+            json_path=self.json_file,
+            buffer_size=2,
+        )
+        handle = logger._json_file_handle
+
+        for i in range(5):
+            logger.info(f"Entry {i}")
+        logger.flush()
+
+        self.assertIs(logger._json_file_handle, handle)
+        with open(self.json_file, "r") as f:
+            data = json.load(f)
+        self.assertEqual([d["message"] for d in data], [f"Entry {i}" for i in range(5)])
+        logger.close()
+
+    def test_json_recovers_missing_closing_bracket(self):
+        """Test JSON output repairs a file truncated by a crash."""
+        with open(self.json_file, "w") as f:
+            f.write('[\n{"level":"INFO","message":"Before crash"},\n{"level":"IN')
+
+        logger = Tamga(
+            console_output=False,
+            json_output=True,
+            json_path=self.json_file,
+            buffer_size=1,
+        )
+        logger.info("After restart")
+        logger.close()
+
+        with open(self.json_file, "r") as f:
+            data = json.load(f)
+        self.assertEqual(
+            [d["message"] for d in data], ["Before crash", "After restart"]
+        )
+
     def test_sql_logging(self):
         """Test SQLite logging functionality."""
         logger = Tamga(
@@ -167,6 +270,7 @@ class TestTamgaCore(unittest.TestCase):
         )
 
         logger.warning("SQL warning message")
+        logger.flush()
 
         # Verify SQL data
         conn = sqlite3.connect(self.sql_file)
@@ -179,6 +283,144 @@ class TestTamgaCore(unittest.TestCase):
         self.assertEqual(rows[0][0], "WARNING")  # level
         self.assertEqual(rows[0][1], "SQL warning message")  # message
 
+    def test_sql_batched_wal_connection(self):
+        """Test SQLite output buffers rows and keeps one WAL-mode connection."""
+        logger = Tamga(
+            console_output=False,
+            sql_output=True,
+            sql_path=self.sql_file,
+            buffer_size=10,
+        )
+        connection = logger._sql_conn
+
+        for i in range(25):
+            logger.info(f"Row {i}", index=i)
+
+        conn = sqlite3.connect(self.sql_file)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0], 20)
+
+        logger.flush()
+        rows = conn.execute("SELECT message, data FROM logs").fetchall()
+        conn.close()
+
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(rows[-1], ("Row 24", '{"index":24}'))
+        self.assertIs(logger._sql_conn, connection)
+        logger.close()
+
+        # Records logged after close() reconnect instead of failing
+        logger.info("After close")
+        logger.close()
+        conn = sqlite3.connect(self.sql_file)
+        count = conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0]
+        conn.close()
+        self.assertEqual(count, 26)
+
+    def test_sql_rotation_with_open_reader(self):
+        """Test SQL rotation keeps every row while a query_sql() generator is open."""
+        logger = Tamga(
+            console_output=False,
+            sql_output=True,
+            sql_path=self.sql_file,
+            max_sql_size_mb=0.05,
+            buffer_size=100,
+        )
+        for i in range(300):
+            logger.info(f"Row {i}", index=i)
+        reader = logger.query_sql()
+        next(reader)
+        for i in range(300, 3200):
+            logger.info(f"Row {i}", index=i)
+        logger.close()
+        reader.close()
+
+        paths = [self.sql_file] + [
+            os.path.join(self.temp_dir, name)
+            for name in os.listdir(self.temp_dir)
+            if name.endswith(".bak")
+        ]
+        self.assertGreater(len(paths), 1)
+        indexes = []
+        for path in paths:
+            conn = sqlite3.connect(path)
+            rows = conn.execute("SELECT json_extract(data, '$.index') FROM logs")
+            indexes.extend(row[0] for row in rows)
+            conn.close()
+        self.assertEqual(sorted(indexes), list(range(3200)))
+
+        # Rows a reader's snapshot keeps in the WAL are copied into the backup
+        for path in paths:
+            os.remove(path)
+        logger = Tamga(
+            console_output=False,
+            sql_output=True,
+            sql_path=self.sql_file,
+            buffer_size=10,
+        )
+        for i in range(50):
+            logger.info(f"Row {i}", index=i)
+        reader = sqlite3.connect(self.sql_file)
+        reader.execute("BEGIN")
+        reader.execute("SELECT COUNT(*) FROM logs").fetchone()
+        for i in range(50, 100):
+            logger.info(f"Row {i}", index=i)
+        logger._rotate_file(self.sql_file, "reader")
+        logger.info("Fresh database", index=100)
+        logger.close()
+        reader.close()
+
+        conn = sqlite3.connect(self.sql_file + ".reader.bak")
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0], 100)
+        conn.close()
+        conn = sqlite3.connect(self.sql_file)
+        messages = conn.execute("SELECT message FROM logs").fetchall()
+        conn.close()
+        self.assertEqual(messages, [("Fresh database",)])
+
+    def test_mongo_batched_inserts(self):
+        """Test MongoDB output sends unordered insert_many batches off-thread."""
+        collection = FakeMongoCollection()
+
+        with patch.object(Tamga, "_connect_mongo", return_value=collection):
+            logger = Tamga(
+                console_output=False,
+                mongo_output=True,
+                mongo_batch_size=4,
+                mongo_flush_interval=60,
+            )
+            for i in range(10):
+                logger.info(f"Mongo message {i}", index=i)
+            self.assertTrue(logger.flush(timeout=5))
+            logger.close()
+
+        documents = [doc for batch, _ in collection.batches for doc in batch]
+        self.assertEqual([doc["data"]["index"] for doc in documents], list(range(10)))
+        self.assertTrue(all(len(batch) <= 4 for batch, _ in collection.batches))
+        self.assertTrue(all(ordered is False for _, ordered in collection.batches))
+
+    def test_mongo_writer_retries_with_backoff(self):
+        """Test failed MongoDB batches are retried and reported when exhausted."""
+        collection = FakeMongoCollection(failures=2)
+        writer = MongoWriter(lambda: collection, retry_backoff=0.01)
+        writer.submit({"message": "retried"})
+        self.assertTrue(writer.flush(timeout=5))
+        self.assertEqual(collection.batches[0][0], [{"message": "retried"}])
+        writer.stop()
+
+        errors = []
+        failing = FakeMongoCollection(failures=10)
+        writer = MongoWriter(
+            lambda: failing,
+            max_retries=1,
+            retry_backoff=0.01,
+            on_error=lambda error, count: errors.append(count),
+        )
+        writer.submit({"message": "lost"})
+        writer.stop(timeout=5)
+        self.assertEqual(errors, [1])
+        self.assertEqual(failing.batches, [])
+
     def test_multiple_outputs(self):
         """Test logging to multiple outputs simultaneously."""
         logger = Tamga(
@@ -267,6 +509,378 @@ class TestTamgaCore(unittest.TestCase):
             self.assertIn("func='process_user'", content)
             self.assertIn("version='1.2.3'", content)
 
+    def test_min_level_filtering(self):
+        """Test records below min_level are dropped before a record is built."""
+        logger = Tamga(
+            console_output=False,
+            file_output=True,
+            file_path=self.file_path,
+            min_level="WARNING",
+            buffer_size=1,
+        )
+        logger.register_level("AUDIT", 45)
+        logger.register_level("CHATTER", 1)
+
+        with patch("tamga.main.clock_snapshot", wraps=clock_snapshot) as clock:
+            logger.debug("Hidden debug", expensive=True)
+            logger.info("Hidden info")
+            logger.custom("Hidden chatter", "CHATTER", "gray")
+            self.assertEqual(clock.call_count, 0)
+
+            logger.warning("Shown warning")
+            logger.error("Shown error")
+            logger.custom("Shown audit", "AUDIT", "purple")
+        logger.flush()
+
+        with open(self.file_path, "r") as f:
+            content = f.read()
+        self.assertNotIn("Hidden", content)
+        for message in ("Shown warning", "Shown error", "Shown audit"):
+            self.assertIn(message, content)
+
+        logger.set_min_level(None)
+        logger.debug("Debug after reset")
+        logger.flush()
+        with open(self.file_path, "r") as f:
+            self.assertIn("Debug after reset", f.read())
+
+        with self.assertRaises(ValueError):
+            logger.set_min_level("VERBOSE")
+        logger.close()
+
+    def test_settings_apply_after_first_record(self):
+        """Test changed output settings and custom levels in sink_levels take effect."""
+        logger = Tamga(
+            colored_output=True,
+            file_output=True,
+            file_path=self.file_path,
+            custom_levels={"AUDIT": 45},
+            sink_levels={"file": "AUDIT"},
+            buffer_size=1,
+        )
+        output = StringIO()
+        with redirect_stdout(output):
+            logger.info("Colored")
+            logger.colored_output = False
+            logger.info("Plain")
+            logger.console_output = False
+            logger.info("Hidden")
+            logger.custom("Access granted", "AUDIT", "orange")
+        logger.close()
+
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("\033[", lines[0])
+        self.assertNotIn("\033[", lines[1])
+        with open(self.file_path, "r") as f:
+            content = f.read()
+        self.assertIn("AUDIT", content)
+        self.assertNotIn("Hidden", content)
+
+    def test_sink_levels_routing(self):
+        """Test each output only receives the levels routed to it."""
+        jsonl_path = os.path.join(self.temp_dir, "routed.jsonl")
+        sql_path = os.path.join(self.temp_dir, "routed.db")
+        logger = Tamga(
+            console_output=True,
+            jsonl_output=True,
+            jsonl_path=jsonl_path,
+            sql_output=True,
+            sql_path=sql_path,
+            sink_levels={"sql": "WARNING", "console": ["ERROR"]},
+            buffer_size=10,
+        )
+
+        output = StringIO()
+        with redirect_stdout(output):
+            logger.info("Routine")
+            logger.warning("Careful")
+            logger.error("Broken")
+            logger.flush()
+
+        with open(jsonl_path, "r") as f:
+            self.assertEqual(len(f.readlines()), 3)
+        with sqlite3.connect(sql_path) as conn:
+            levels = [
+                row[0] for row in conn.execute("SELECT level FROM logs ORDER BY rowid")
+            ]
+        self.assertEqual(levels, ["WARNING", "ERROR"])
+        self.assertNotIn("Routine", output.getvalue())
+        self.assertNotIn("Careful", output.getvalue())
+        self.assertIn("Broken", output.getvalue())
+        logger.close()
+
+        with self.assertRaises(ValueError):
+            Tamga(sink_levels={"syslog": "ERROR"})
+
+    def test_sampling_and_rate_limit(self):
+        """Test sampled and rate-limited calls are dropped and counted."""
+        jsonl_path = os.path.join(self.temp_dir, "limited.jsonl")
+        logger = Tamga(
+            console_output=False,
+            jsonl_output=True,
+            jsonl_path=jsonl_path,
+            sample_rates={"METRIC": 10},
+            rate_limit=0.001,
+            rate_limit_burst=3,
+        )
+
+        with patch("tamga.main.clock_snapshot", wraps=clock_snapshot) as clock:
+            for i in range(100):
+                logger.metric("Loop tick", key=i)
+            self.assertEqual(clock.call_count, 10)
+
+        for _ in range(5):
+            logger.info("Cache miss", key="users")
+            logger.info("Cache miss", key="orders")
+            logger.warning("Disk almost full")
+        logger.flush()
+
+        with open(jsonl_path, "r") as f:
+            records = [json.loads(line) for line in f]
+        ticks = [r["data"]["key"] for r in records if r["message"] == "Loop tick"]
+        self.assertEqual(ticks, list(range(0, 100, 10)))
+        keys = [r["data"]["key"] for r in records if r["message"] == "Cache miss"]
+        self.assertEqual(keys.count("users"), 3)
+        self.assertEqual(keys.count("orders"), 3)
+        self.assertEqual(sum(r["message"] == "Disk almost full" for r in records), 3)
+
+        report = records[-1]
+        self.assertEqual(report["level"], "METRIC")
+        self.assertEqual(report["data"], {"METRIC": 90, "INFO": 4, "WARNING": 2})
+        logger.close()
+
+        # Unhashable key= values are limited by their repr() instead of raising
+        logger = Tamga(console_output=False, rate_limit=1, rate_limit_burst=2)
+        for _ in range(3):
+            logger.info("Login", key={"user": 1})
+        self.assertEqual(logger.stats()["records"], {"INFO": 2})
+        logger.close()
+
+    def test_writer_process(self):
+        """Test worker processes write through one writer process."""
+        writer = Tamga.start_writer_process(
+            file_output=True, file_path=self.file_path, max_file_size_mb=1
+        )
+        workers = [
+            multiprocessing.Process(
+                target=log_from_worker, args=(writer.queue, worker, 200)
+            )
+            for worker in range(3)
+        ]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(10)
+        self.assertTrue(writer.stop(10))
+
+        with open(self.file_path, "r") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 600)
+        for worker in range(3):
+            self.assertEqual(
+                sum(f"worker {worker} line" in line for line in lines), 200
+            )
+
+        with self.assertRaises(ValueError):
+            Tamga.start_writer_process(writer_queue=writer.queue)
+
+    def test_async_api(self):
+        """Test async helpers write from the writer thread, not the event loop."""
+        threads = []
+        original = Tamga._buffer_file_write
+
+        def record_thread(logger, log_data):
+            threads.append(threading.current_thread().name)
+            original(logger, log_data)
+
+        async def main():
+            async with Tamga(
+                console_output=False, file_output=True, file_path=self.file_path
+            ) as logger:
+                await logger.ainfo("Async info", user_id=7)
+                await logger.aerror("Async error")
+                await logger.acustom("Async audit", "AUDIT", "purple")
+                self.assertTrue(await logger.aflush(5))
+
+        with patch.object(Tamga, "_buffer_file_write", record_thread):
+            asyncio.run(main())
+
+        with open(self.file_path, "r") as f:
+            content = f.read()
+        self.assertIn("Async info | user_id=7", content)
+        self.assertIn("Async error", content)
+        self.assertIn("Async audit", content)
+        self.assertEqual(threads, ["tamga-writer"] * 3)
+
+        # After close() the async helpers reopen the logger for the exit-time close
+        logger = Tamga(
+            console_output=False,
+            file_output=True,
+            file_path=self.file_path,
+            buffer_size=1000,
+        )
+        logger.close()
+        asyncio.run(logger.ainfo("Logged after close"))
+        self.assertIn(logger, tamga_core._instances)
+        tamga_core._close_all()
+        with open(self.file_path, "r") as f:
+            self.assertIn("Logged after close", f.read())
+
+    def test_binary_output(self):
+        """Test the binary output reads back like JSONL at a fraction of the size."""
+        binary_path = os.path.join(self.temp_dir, "test.bin")
+        jsonl_path = os.path.join(self.temp_dir, "test.jsonl")
+        logger = Tamga(
+            console_output=False,
+            binary_output=True,
+            binary_path=binary_path,
+            jsonl_output=True,
+            jsonl_path=jsonl_path,
+        )
+        for i in range(200):
+            logger.info("Request handled", status=200, elapsed=0.25, path="/users")
+        logger.error("Payment failed", order=None, ok=False, tags=["a", "b"])
+        logger.custom("Audit entry", "AUDIT", "purple", big=2**70)
+        logger.close()
+
+        records = list(read_binary(binary_path))
+        with open(jsonl_path, "r") as f:
+            expected = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 202)
+        self.assertEqual(len(expected), len(records))
+        for record, line in zip(records, expected):
+            self.assertEqual(record["timestamp"], line["timestamp"])
+            self.assertEqual(record, line)
+        self.assertLess(os.path.getsize(binary_path) * 3, os.path.getsize(jsonl_path))
+
+        # A frame cut off by a crash is dropped when the file is reopened
+        with open(binary_path, "ab") as f:
+            f.write(b"\x03\xff\x00")
+        logger = Tamga(
+            console_output=False, binary_output=True, binary_path=binary_path
+        )
+        logger.warning("After restart", attempt=2)
+        logger.close()
+
+        converted_path = os.path.join(self.temp_dir, "converted.jsonl")
+        self.assertEqual(binary_to_jsonl(binary_path, converted_path), 203)
+        with open(converted_path, "r") as f:
+            last = json.loads(f.readlines()[-1])
+        self.assertEqual(last["message"], "After restart")
+        self.assertEqual(last["data"], {"attempt": 2})
+
+        # A file that is not a binary log is reported and never truncated
+        other_path = os.path.join(self.temp_dir, "other.bin")
+        with open(other_path, "wb") as f:
+            f.write(b"not a binary log\n")
+        logger = Tamga(console_output=False, binary_output=True, binary_path=other_path)
+        logger.info("Not written")
+        logger.flush()
+        self.assertGreater(logger.stats()["sinks"]["binary"]["failures"], 0)
+        logger.close()
+        with open(other_path, "rb") as f:
+            self.assertEqual(f.read(), b"not a binary log\n")
+
+    def test_query_logs_and_backups(self):
+        """Test querying JSONL logs together with their compressed backups."""
+        jsonl_path = os.path.join(self.temp_dir, "query.jsonl")
+        logger = Tamga(
+            console_output=False,
+            jsonl_output=True,
+            jsonl_path=jsonl_path,
+            max_jsonl_size_mb=0.002,  # 2KB
+            backup_compression="gzip",
+            buffer_size=10,
+        )
+        for i in range(200):
+            if i % 4 == 0:
+                logger.error("Payment failed", user=i % 8, amount=9.5)
+            else:
+                logger.info("Request handled", user=i % 8)
+        logger.close()
+
+        self.assertTrue(any(f.endswith(".bak.gz") for f in os.listdir(self.temp_dir)))
+
+        errors = list(query_logs(jsonl_path, level="ERROR"))
+        self.assertEqual(len(errors), 50)
+        matching = list(query_logs(jsonl_path, level="ERROR", where={"user": 4}))
+        self.assertEqual(len(matching), 25)
+        self.assertEqual(len(list(query_logs(jsonl_path, where={"amount": 9.5}))), 50)
+        self.assertEqual(len(list(query_logs(jsonl_path, limit=7))), 7)
+        self.assertEqual(list(query_logs(jsonl_path, since=time_now() + 60)), [])
+        self.assertLess(len(list(query_logs(jsonl_path, include_backups=False))), 200)
+
+        counts = count_by_interval(jsonl_path, interval=60, processes=2)
+        per_level = {}
+        for (_, level), count in counts.items():
+            per_level[level] = per_level.get(level, 0) + count
+        self.assertEqual(per_level, {"ERROR": 50, "INFO": 150})
+
+        output = StringIO()
+        with redirect_stdout(output):
+            tamga_main(["query", jsonl_path, "--level", "ERROR", "--where", "user=0"])
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 25)
+        self.assertEqual(json.loads(lines[0])["data"]["user"], 0)
+
+        output = StringIO()
+        with redirect_stdout(output):
+            tamga_main(["query", jsonl_path, "--count", "--processes", "1"])
+        total = sum(int(line.split("\t")[2]) for line in output.getvalue().splitlines())
+        self.assertEqual(total, 200)
+
+    def test_query_sql(self):
+        """Test query_sql filters with the indexes and json_extract."""
+        sql_path = os.path.join(self.temp_dir, "query.db")
+        logger = Tamga(
+            console_output=False, sql_output=True, sql_path=sql_path, buffer_size=100
+        )
+        for i in range(30):
+            logger.info("Request handled", user=i % 3, path="/users", ok=i % 2 == 0)
+        logger.error("Payment failed", user=1, tags=["card", "declined"])
+        logger.warning("Slow query", user=None)
+
+        errors = list(logger.query_sql(level="ERROR"))
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0]["data"], {"user": 1, "tags": ["card", "declined"]})
+
+        rows = list(logger.query_sql(level=["INFO", "ERROR"], where_data={"user": 1}))
+        self.assertEqual(len(rows), 11)
+        self.assertEqual(len(list(logger.query_sql(where_data={"ok": True}))), 15)
+        self.assertEqual(len(list(logger.query_sql(where_data={"user": None}))), 1)
+        self.assertEqual(
+            len(list(logger.query_sql(where_data={"tags": ["card", "declined"]}))), 1
+        )
+        self.assertEqual(len(list(logger.query_sql(limit=5))), 5)
+        self.assertEqual(list(logger.query_sql(since=time_now() + 60)), [])
+        timestamps = [row["timestamp"] for row in logger.query_sql()]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+        with sqlite3.connect(sql_path) as conn:
+            plan = " ".join(
+                str(row)
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM logs "
+                    "WHERE level = 'ERROR' AND timestamp >= 0"
+                )
+            )
+        self.assertIn("logs_level_timestamp", plan)
+        logger.close()
+
+        # Characters with a meaning in URIs are escaped in the read-only URI
+        directory = os.path.join(self.temp_dir, "x #1?")
+        os.makedirs(directory)
+        sql_path = os.path.join(directory, "a.db")
+        logger = Tamga(console_output=False, sql_output=True, sql_path=sql_path)
+        logger.info("Escaped path")
+        self.assertEqual(
+            [row["message"] for row in logger.query_sql()], ["Escaped path"]
+        )
+        logger.close()
+        # No stray database at the part of the path before "#"
+        self.assertNotIn("x ", os.listdir(self.temp_dir))
+
     def test_kwargs_empty(self):
         """Test that methods work without kwargs."""
         logger = Tamga(
@@ -288,6 +902,41 @@ class TestTamgaCore(unittest.TestCase):
             # Should not contain any key-value formatting (check for key=value patterns)
             self.assertNotIn("=", content)
 
+    def test_kwargs_structured_outputs_keep_types(self):
+        """Test that structured outputs receive kwargs values unchanged."""
+        jsonl_file = os.path.join(self.temp_dir, "test.jsonl")
+        logger = Tamga(
+            console_output=False,
+            jsonl_output=True,
+            jsonl_path=jsonl_file,
+            buffer_size=1,
+        )
+
+        logger.info(
+            "Order placed",
+            items=["a", "b"],
+            address={"city": "Ankara", "zip": 6000},
+            note="fragile, handle with care",
+            ratio=0.5,
+            paid=False,
+        )
+        logger.flush()
+
+        with open(jsonl_file, "r") as f:
+            entry = json.loads(f.readline())
+
+        self.assertEqual(entry["message"], "Order placed")
+        self.assertEqual(
+            entry["data"],
+            {
+                "items": ["a", "b"],
+                "address": {"city": "Ankara", "zip": 6000},
+                "note": "fragile, handle with care",
+                "ratio": 0.5,
+                "paid": False,
+            },
+        )
+
     def test_kwargs_notify_method(self):
         """Test kwargs with notify method including custom parameters."""
         logger = Tamga(
@@ -308,6 +957,115 @@ class TestTamgaCore(unittest.TestCase):
             self.assertIn("user='john_doe'", content)
             self.assertIn("premium=True", content)
 
+    def test_notify_sends_formatted_message(self):
+        """Test notify() passes the message with key-value data to notifications."""
+        logger = Tamga(console_output=False, notify_services=["json://localhost"])
+
+        with patch.object(Tamga, "_send_notification_async") as send:
+            logger.notify("Payment received", title="Sales", amount=150)
+
+        send.assert_called_with("Payment received | amount=150", "NOTIFY", "Sales")
+
+    def test_exit_close_is_bounded(self):
+        """Test the close at interpreter exit gives up on hanging sends after exit_timeout."""
+        release = threading.Event()
+        logger = Tamga(console_output=False, exit_timeout=0.2)
+        logger._notifier = NotificationDispatcher(lambda *args: release.wait(5))
+        logger._notifier.submit("Webhook hangs", "ERROR")
+
+        began = monotonic()
+        tamga_core._close_all()
+        release.set()
+        self.assertLess(monotonic() - began, 2)
+        self.assertNotIn(logger, tamga_core._instances)
+
+    def test_notify_delivers_once_with_title(self):
+        """Test notify() sends one notification carrying the caller's title."""
+        delivered = []
+
+        class FakeApprise:
+            def add(self, service):
+                pass
+
+            def notify(self, body, title, body_format=None):
+                delivered.append((title, body))
+
+        fake_module = type(sys)("apprise")
+        fake_module.Apprise = FakeApprise
+        with patch.dict(sys.modules, {"apprise": fake_module}):
+            logger = Tamga(console_output=False, notify_services=["json://localhost"])
+            logger.notify("Deploy finished", title="My custom title")
+            logger.close()
+
+        self.assertEqual(len(delivered), 1)
+        self.assertEqual(delivered[0][0], "My custom title")
+        self.assertIn("Deploy finished", delivered[0][1])
+
+    def test_notifications_coalesced_and_rate_limited(self):
+        """Test repeated notifications collapse into one digest per window."""
+        sent = []
+        dispatcher = NotificationDispatcher(
+            lambda message, level, title: sent.append((message, level)),
+            window=60,
+            max_per_level=2,
+        )
+
+        for _ in range(50):
+            dispatcher.submit("Payment failed", "ERROR")
+        for i in range(3):
+            dispatcher.submit(f"Disk {i} full", "CRITICAL")
+        dispatcher.stop(timeout=5)
+
+        self.assertEqual(
+            sent,
+            [
+                ("Payment failed", "ERROR"),
+                ("Disk 0 full", "CRITICAL"),
+                ("Disk 1 full", "CRITICAL"),
+                ("ERROR x 50 in last 60s: Payment failed", "ERROR"),
+                ("CRITICAL x 1 in last 60s: Disk 2 full", "CRITICAL"),
+            ],
+        )
+
+    def test_notification_queue_is_bounded(self):
+        """Test the pending notification queue drops entries when full."""
+        release = threading.Event()
+        sent = []
+
+        def send(message, level, title):
+            release.wait(5)
+            sent.append(message)
+
+        dispatcher = NotificationDispatcher(
+            send, max_per_level=100, queue_size=3, drop_policy="drop_oldest"
+        )
+        for i in range(10):
+            dispatcher.submit(f"Alert {i}", "ERROR")
+        release.set()
+        dispatcher.stop(timeout=5)
+
+        self.assertEqual(dispatcher.dropped, len(range(10)) - len(sent))
+        self.assertEqual(sent[-3:], ["Alert 7", "Alert 8", "Alert 9"])
+        self.assertLessEqual(len(sent), 4)
+
+    def test_close_delivers_pending_notifications(self):
+        """Test close() waits for queued notifications and the final digests."""
+        sent = []
+
+        def send(message, level, title):
+            sleep(0.05)
+            sent.append(message)
+
+        logger = Tamga(console_output=False)
+        logger._notifier = NotificationDispatcher(send, max_per_level=1)
+        for _ in range(3):
+            logger._notifier.submit("Payment failed", "ERROR")
+        logger.close()
+
+        self.assertEqual(
+            sent, ["Payment failed", "ERROR x 3 in last 60s: Payment failed"]
+        )
+
     def test_file_rotation(self):
         """Test file rotation when size limit is reached."""
         logger = Tamga(
@@ -328,6 +1086,451 @@ class TestTamgaCore(unittest.TestCase):
         backup_files = [f for f in os.listdir(self.temp_dir) if f.endswith(".bak")]
         self.assertGreater(len(backup_files), 0)
 
+    def test_rotation_retention_and_compression(self):
+        """Test rename-based rotation keeps a bounded set of compressed backups."""
+        logger = Tamga(
+            console_output=False,
+            file_output=True,
+            file_path=self.file_path,
+            max_file_size_mb=0.001,  # 1KB
+            max_backups=2,
+            backup_compression="gzip",
+            buffer_size=1,
+        )
+
+        for i in range(100):
+            logger.info(f"Rotated message {i:03d} " + "x" * 100)
+        logger.close()
+
+        backups = sorted(f for f in os.listdir(self.temp_dir) if ".bak" in f)
+        self.assertEqual(len(backups), 2)
+        self.assertTrue(all(name.endswith(".bak.gz") for name in backups))
+
+        with gzip.open(os.path.join(self.temp_dir, backups[-1]), "rt") as f:
+            self.assertIn("Rotated message", f.read())
+
+        # Numbers continue after the highest one left by retention
+        label_path = os.path.join(self.temp_dir, "numbered.log")
+        for name in ("numbered.log.L.1.bak.gz", "numbered.log.L.3.bak"):
+            open(os.path.join(self.temp_dir, name), "w").close()
+        self.assertEqual(backup_path(label_path, "L"), label_path + ".L.4.bak")
+        self.assertEqual(backup_path(label_path, "M"), label_path + ".M.bak")
+
+    def test_time_based_rotation(self):
+        """Test hourly and daily rollovers at calendar boundaries with period labels."""
+
+        def at(*moment):
+            return int(datetime(*moment).timestamp()) * 1_000_000_000
+
+        def logged_at(*moment):
+            return patch("tamga.utils.time.time_ns", return_value=at(*moment))
+
+        open(self.file_path, "w").close()
+        os.utime(self.file_path, ns=(at(2025, 6, 28, 14, 30), at(2025, 6, 28, 14, 30)))
+        logger = Tamga(
+            console_output=False,
+            file_output=True,
+            file_path=self.file_path,
+            rotate_when="H",
+            buffer_size=1,
+        )
+
+        with logged_at(2025, 6, 28, 14, 31):
+            logger.info("Before the hour")
+            logger.info("Still before the hour")
+        with logged_at(2025, 6, 28, 15, 5):
+            logger.info("After the hour")
+        logger.close()
+
+        with open(self.file_path + ".20250628_14.bak", "r") as f:
+            self.assertEqual(f.read().count("the hour"), 2)
+        with open(self.file_path, "r") as f:
+            self.assertEqual(f.read().count("INFO"), 1)
+
+        # A batch crossing the hour is split, and an hour without records
+        # leaves no backup behind
+        open(self.file_path, "w").close()
+        os.utime(self.file_path, ns=(at(2025, 6, 28, 16, 0), at(2025, 6, 28, 16, 0)))
+        logger = Tamga(
+            console_output=False,
+            file_output=True,
+            file_path=self.file_path,
+            rotate_when="H",
+            buffer_size=3,
+        )
+        with logged_at(2025, 6, 28, 17, 58):
+            logger.info("First of the batch")
+        with logged_at(2025, 6, 28, 17, 59):
+            logger.info("Second of the batch")
+        with logged_at(2025, 6, 28, 18, 1):
+            logger.info("Third of the batch")
+        logger.close()
+
+        self.assertFalse(os.path.exists(self.file_path + ".20250628_16.bak"))
+        with open(self.file_path + ".20250628_17.bak", "r") as f:
+            self.assertEqual(f.read().count("of the batch"), 2)
+        with open(self.file_path, "r") as f:
+            self.assertIn("Third of the batch", f.read())
+
+        # Files left over from a previous day roll over on the first flush
+        jsonl_path = os.path.join(self.temp_dir, "daily.jsonl")
+        json_path = os.path.join(self.temp_dir, "daily.json")
+        with open(jsonl_path, "w") as f:
+            f.write('{"message":"yesterday"}\n')
+        with open(json_path, "w") as f:
+            f.write('[\n{"message":"yesterday"}\n]')
+        for path in (jsonl_path, json_path):
+            os.utime(path, ns=(at(2025, 6, 27, 10, 0), at(2025, 6, 27, 10, 0)))
+
+        logger = Tamga(
+            console_output=False,
+            jsonl_output=True,
+            jsonl_path=jsonl_path,
+            json_output=True,
+            json_path=json_path,
+            rotate_when="midnight",
+            buffer_size=1,
+        )
+        with logged_at(2025, 6, 28, 9, 0):
+            logger.info("Today")
+        logger.close()
+
+        for path in (jsonl_path, json_path):
+            with open(path + ".20250627.bak", "r") as f:
+                self.assertIn("yesterday", f.read())
+            with open(path, "r") as f:
+                content = f.read()
+            self.assertNotIn("yesterday", content)
+            self.assertIn("Today", content)
+
+        with self.assertRaises(ValueError):
+            Tamga(rotate_when="W")
+
+    def test_stats(self):
+        """Test level counts, per-output counters and the periodic stats export."""
+        exported = []
+        jsonl_path = os.path.join(self.temp_dir, "stats.jsonl")
+        logger = Tamga(
+            console_output=False,
+            file_output=True,
+            file_path=self.file_path,
+            jsonl_output=True,
+            jsonl_path=jsonl_path,
+            max_file_size_mb=0.001,  # 1KB
+            buffer_size=5,
+            stats_callback=exported.append,
+            stats_interval=0.05,
+        )
+        for i in range(40):
+            logger.info(f"Message {i}")
+        logger.error("Failure")
+        logger.flush()
+
+        stats = logger.stats()
+        self.assertEqual(stats["records"], {"INFO": 40, "ERROR": 1})
+        self.assertEqual(stats["records_total"], 41)
+        self.assertGreater(stats["call_latency"]["count"], 0)
+
+        jsonl = stats["sinks"]["jsonl"]
+        self.assertEqual(jsonl["records"], 41)
+        self.assertEqual(jsonl["bytes"], os.path.getsize(jsonl_path))
+        self.assertEqual(jsonl["flushes"], jsonl["flush_latency"]["count"])
+        self.assertGreaterEqual(jsonl["flushes"], 8)
+        self.assertLessEqual(
+            jsonl["flush_latency"]["p50_us"], jsonl["flush_latency"]["max_us"]
+        )
+        self.assertEqual(jsonl["failures"], 0)
+        self.assertGreater(stats["sinks"]["file"]["rotations"], 0)
+
+        deadline = monotonic() + 5
+        while not exported and monotonic() < deadline:
+            sleep(0.01)
+        logger.close()
+        self.assertIn("sinks", exported[0])
+        count = len(exported)
+        sleep(0.15)
+        self.assertEqual(len(exported), count)
+
+    def test_buffer_overflow_policies(self):
+        """Test memory budgets and overflow policies while an output keeps failing."""
+
+        def read_messages(path):
+            with open(path, "r") as f:
+                return [json.loads(line)["message"] for line in f]
+
+        failing_output = patch(
+            "tamga.utils.encoding.RecordEncoder.entry", side_effect=OSError("Disk full")
+        )
+        for policy in ("drop_oldest", "drop_newest", "spill"):
+            with self.subTest(policy=policy):
+                jsonl_path = os.path.join(self.temp_dir, f"{policy}.jsonl")
+                logger = Tamga(
+                    console_output=False,
+                    jsonl_output=True,
+                    jsonl_path=jsonl_path,
+                    buffer_size=1000,
+                    max_buffer_mb=0.01,
+                    buffer_overflow=policy,
+                )
+                # Serialization failing inside the JSONL write
+                with failing_output, redirect_stdout(StringIO()):
+                    for i in range(100):
+                        logger.info(f"Message {i}")
+                    stats = logger.stats()["sinks"]["jsonl"]
+                self.assertLessEqual(stats["buffered_bytes"], 0.01 * 1024 * 1024)
+                logger.close()
+
+                messages = read_messages(jsonl_path)
+                if policy == "spill":
+                    self.assertEqual(stats["dropped"], 0)
+                    self.assertGreater(stats["spilled"], 0)
+                    self.assertEqual(messages, [f"Message {i}" for i in range(100)])
+                    self.assertFalse(os.path.exists(jsonl_path + ".spill"))
+                else:
+                    self.assertEqual(stats["dropped"] + len(messages), 100)
+                    self.assertGreater(stats["dropped"], 0)
+                    kept = "Message 99" if policy == "drop_oldest" else "Message 0"
+                    lost = "Message 0" if policy == "drop_oldest" else "Message 99"
+                    self.assertIn(kept, messages)
+                    self.assertNotIn(lost, messages)
+
+        logger = Tamga(
+            console_output=False,
+            jsonl_output=True,
+            jsonl_path=os.path.join(self.temp_dir, "block.jsonl"),
+            buffer_size=1000,
+            max_buffer_mb=0.001,
+            buffer_overflow="block",
+            buffer_block_timeout=0.05,
+        )
+        with failing_output, redirect_stdout(StringIO()):
+            began = monotonic()
+            logger.info("Waits for the failing output, then is dropped")
+            logger.info("Second")
+            self.assertGreaterEqual(monotonic() - began, 0.05)
+            self.assertGreater(logger.stats()["sinks"]["jsonl"]["dropped"], 0)
+        logger.close()
+
+        with self.assertRaises(ValueError):
+            Tamga(buffer_overflow="grow")
+
+    def test_flush_interval_and_exit_flush(self):
+        """Test timed flushes of a quiet logger and the flush at interpreter exit."""
+        logger = Tamga(
+            console_output=False,
+            file_output=True,
+            file_path=self.file_path,
+            buffer_size=1000,
+            flush_interval=0.02,
+        )
+        logger.info("Quiet service")
+
+        deadline = monotonic() + 5
+        content = ""
+        while "Quiet service" not in content and monotonic() < deadline:
+            sleep(0.01)
+            with open(self.file_path, "r") as f:
+                content = f.read()
+        self.assertIn("Quiet service", content)
+        logger.close()
+        logger.close()
+
+        # The writer thread keeps this logger alive, so __del__ never runs at exit
+        jsonl_path = os.path.join(self.temp_dir, "exit.jsonl")
+        script = (
+            "from tamga import Tamga\n"
+            f"logger = Tamga(console_output=False, jsonl_output=True, "
+            f"jsonl_path={jsonl_path!r}, buffer_size=1000, background_writer=True)\n"
+            "logger.info('Written at exit')\n"
+        )
+        subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            cwd=self.temp_dir,
+            env={
+                **os.environ,
+                "PYTHONPATH": os.path.dirname(
+                    os.path.dirname(os.path.abspath(__file__))
+                ),
+            },
+        )
+        with open(jsonl_path, "r") as f:
+            self.assertIn("Written at exit", f.read())
+
+    def test_slow_output_does_not_block_others(self):
+        """Test a slow write only holds its own output while appends continue."""
+        started = threading.Event()
+        release = threading.Event()
+        write_json = Tamga._write_json_records
+
+        def slow_write_json(logger, records):
+            started.set()
+            release.wait(5)
+            return write_json(logger, records)
+
+        logger = Tamga(
+            console_output=False,
+            file_output=True,
+            file_path=self.file_path,
+            json_output=True,
+            json_path=self.json_file,
+            sink_levels={"json": "ERROR"},
+            buffer_size=1,
+        )
+        with patch.object(Tamga, "_write_json_records", slow_write_json):
+            slow = threading.Thread(target=logger.error, args=("First error",))
+            slow.start()
+            self.assertTrue(started.wait(5))
+
+            logger.info("Written while JSON is stalled")
+            logger.error("Queued behind the stalled write")
+            with open(self.file_path, "r") as f:
+                content = f.read()
+            self.assertIn("Written while JSON is stalled", content)
+            self.assertIn("Queued behind the stalled write", content)
+            self.assertTrue(slow.is_alive())
+
+            release.set()
+            slow.join(5)
+        logger.close()
+
+        with open(self.json_file, "r") as f:
+            messages = [entry["message"] for entry in json.load(f)]
+        self.assertEqual(messages, ["First error", "Queued behind the stalled write"])
+
+    def test_records_serialized_once(self):
+        """Test JSON, JSONL and SQL share one serialization per record."""
+        encoders = [stdlib_encoder]
+        if encoding.orjson is not None:
+            encoders.append(orjson_encoder)
+
+        for encoder in encoders:
+            with self.subTest(encoder=encoder.__name__):
+                encoded = []
+
+                def counting_encoder(value):
+                    encoded.append(value)
+                    return encoder(value)
+
+                directory = tempfile.mkdtemp(dir=self.temp_dir)
+                jsonl_path = os.path.join(directory, "test.jsonl")
+                json_path = os.path.join(directory, "test.json")
+                sql_path = os.path.join(directory, "test.db")
+                logger = Tamga(
+                    console_output=False,
+                    json_output=True,
+                    json_path=json_path,
+                    jsonl_output=True,
+                    jsonl_path=jsonl_path,
+                    sql_output=True,
+                    sql_path=sql_path,
+                    json_encoder=counting_encoder,
+                )
+                logger.info("Order placed", order_id=7, total=9.5, customer="Ayşe")
+                logger.info("Plain")
+                logger.close()
+
+                self.assertEqual(sum(isinstance(v, dict) for v in encoded), 1)
+                self.assertEqual(encoded.count("Order placed"), 1)
+
+                with open(jsonl_path, "r", encoding="utf-8") as f:
+                    line = f.readline()
+                record = json.loads(line)
+                # Same text as json.dumps of the entry dict
+                self.assertEqual(
+                    line,
+                    json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+                    + "\n",
+                )
+                self.assertEqual(
+                    list(record),
+                    [
+                        "level",
+                        "message",
+                        "data",
+                        "date",
+                        "time",
+                        "timezone",
+                        "timestamp",
+                    ],
+                )
+                with open(json_path, "r", encoding="utf-8") as f:
+                    self.assertEqual(json.load(f)[0], record)
+
+                with sqlite3.connect(sql_path) as conn:
+                    data = conn.execute("SELECT data FROM logs").fetchall()
+                conn.close()
+                self.assertEqual(
+                    [json.loads(row[0]) for row in data], [record["data"], {}]
+                )
+
+    def test_encoders_agree_and_never_fail_a_batch(self):
+        """Test both encoders write the same text and values they reject."""
+
+        @dataclass
+        class Point:
+            x: int
+
+        encoders = [stdlib_encoder]
+        if encoding.orjson is not None:
+            encoders.append(orjson_encoder)
+
+        for encoder in encoders:
+            with self.subTest(encoder=encoder.__name__):
+                value = {
+                    "big": 2**70,
+                    "at": datetime(2025, 6, 28, 14, 30),
+                    "point": Point(1),
+                    1: "non-string key",
+                }
+                self.assertEqual(encoder(value), stdlib_encoder(value))
+
+                circular = {}
+                circular["self"] = circular
+                jsonl_path = os.path.join(self.temp_dir, f"{encoder.__name__}.jsonl")
+                logger = Tamga(
+                    console_output=False,
+                    jsonl_output=True,
+                    jsonl_path=jsonl_path,
+                    json_encoder=encoder,
+                )
+                logger.info("Big", big=2**70)
+                logger.info("Circular", value=circular)
+                logger.info("After")
+                logger.close()
+
+                with open(jsonl_path, "r", encoding="utf-8") as f:
+                    records = [json.loads(line) for line in f]
+                self.assertEqual(
+                    [r["message"] for r in records], ["Big", "Circular", "After"]
+                )
+                self.assertEqual(records[0]["data"], {"big": 2**70})
+                self.assertEqual(records[1]["data"], {"value": repr(circular)})
+
+    def test_rotation_uses_tracked_file_size(self):
+        """Test rotation decisions come from bytes written, not a stat per flush."""
+        logger = Tamga(
+            console_output=False,
+            file_output=True,
+            file_path=self.file_path,
+            max_file_size_mb=0.001,  # 1KB
+            buffer_size=1,
+        )
+
+        with patch("tamga.main.os.path.getsize", wraps=os.path.getsize) as getsize:
+            for i in range(30):
+                logger.info(f"Tracked size message number {i:04d}")
+            logger.flush()
+
+        backup_files = [f for f in os.listdir(self.temp_dir) if f.endswith(".bak")]
+        self.assertGreater(len(backup_files), 0)
+        # Only the initial seed and post-rotation resyncs hit the filesystem
+        self.assertLessEqual(getsize.call_count, len(backup_files) + 2)
+        self.assertEqual(
+            logger._file_sizes[self.file_path], os.path.getsize(self.file_path)
+        )
+        logger.close()
+
     def test_flush_on_deletion(self):
         """Test that buffers are flushed when logger is deleted."""
         logger = Tamga(
@@ -343,6 +1546,37 @@ class TestTamgaCore(unittest.TestCase):
         with open(self.file_path, "r") as f:
             self.assertIn("Message before deletion", f.read())
 
+    def test_background_writer(self):
+        """Test that the background writer drains records on flush and close."""
+        logger = Tamga(
+            console_output=False,
+            file_output=True,
+            jsonl_output=True,
+            file_path=self.file_path,
+            jsonl_path=os.path.join(self.temp_dir, "test.jsonl"),
+            buffer_size=1000,
+            background_writer=True,
+        )
+
+        for i in range(200):
+            logger.info(f"Queued message {i}", index=i)
+        self.assertTrue(logger.flush(timeout=5))
+
+        with open(self.file_path, "r") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 200)
+        self.assertIn("Queued message 0", lines[0])
+        self.assertIn("Queued message 199", lines[-1])
+
+        writer_thread = logger._writer._thread
+        logger.info("Logged before close")
+        logger.close()
+        self.assertFalse(writer_thread.is_alive())
+        self.assertIsNone(logger._writer)
+
+        with open(self.file_path, "r") as f:
+            self.assertIn("Logged before close", f.read())
+
     def test_timezone_toggle(self):
         """Test timezone display toggle."""
         # Without timezone
@@ -375,6 +1609,20 @@ class TestTamgaCore(unittest.TestCase):
             # The one with timezone should be longer
             self.assertLess(len(content1), len(content2))
 
+    def test_clock_snapshot(self):
+        """Test that clock snapshots are consistent and reuse per-second strings."""
+        with patch("tamga.utils.time.time_ns", return_value=1_750_000_000_250_000_000):
+            first = clock_snapshot()
+        with patch("tamga.utils.time.time_ns", return_value=1_750_000_000_750_000_000):
+            second = clock_snapshot()
+
+        expected = datetime.fromtimestamp(1_750_000_000)
+        self.assertEqual(first.date, expected.strftime("%d.%m.%y"))
+        self.assertEqual(first.time, expected.strftime("%H:%M:%S"))
+        self.assertEqual(first.timestamp, 1_750_000_000.25)
+        self.assertIs(first.date, second.date)
+        self.assertIs(first.time, second.time)
+
     def test_all_log_levels(self):
         """Test all available log level methods."""
         logger = Tamga(